@@ -9,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 # openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -50,7 +51,7 @@ Rules
     # Get the async client
     client = await get_async_client()
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "ats_score",
         model="gpt-5.1",
         messages=[
             {"role": "system", "content": prompt_template},
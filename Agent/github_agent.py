@@ -9,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 # openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -28,7 +29,7 @@ async def analyze_github_profile(profile_data):
     Analyze GitHub profile and provide comprehensive developer assessment
     
     Args:
-        profile_data: GitHub profile data (JSON string or dict)
+        profile_data: GitHub profile digest from pipeline.github_digest (string or dict)
         
     Returns:
         Comprehensive analysis with repository summary, open source contributions, and overall developer assessment
@@ -36,6 +37,10 @@ async def analyze_github_profile(profile_data):
     
     prompt_template = """You are an expert GitHub profile analyst and developer assessor. 
     Analyze the provided GitHub profile data and provide a comprehensive assessment.
+    The profile is given as a digest computed from all of the developer's repositories and
+    recent events: totals, language distribution, top topics, activity per year, event counts
+    and the highest-signal repositories, the first of which include a README excerpt and
+    their language mix by code size. Use the READMEs to identify frameworks and tools.
     
     Your task is to analyze the GitHub profile and provide exactly the following three components:
     
@@ -94,11 +99,11 @@ async def analyze_github_profile(profile_data):
     # Get the async client
     client = await get_async_client()
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "github",
         model="gpt-5.1",
         messages=[
             {"role": "system", "content": prompt_template},
-            {"role": "user", "content": f"Extract structured data from this GitHub profile: {profile_data}"}
+            {"role": "user", "content": f"Extract structured data from this GitHub profile digest: {profile_data}"}
         ],
         response_format=github_profile_data,
     )
@@ -14,6 +14,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -242,7 +243,7 @@ async def analyze_large_portfolio(html_data: str, max_retries: int) -> Tuple[Opt
         # Get the async client
         client = await get_async_client()
         
-        final_completion = await client.beta.chat.completions.parse(
+        final_completion = await parse_completion(client, "portfolio",
             model="gpt-5.1",
             messages=[
                 {"role": "system", "content": final_prompt},
@@ -278,6 +279,7 @@ async def analyze_portfolio_direct(html_data: str, max_retries: int) -> Tuple[Op
     """
     prompt_template = """You are an expert portfolio website analyst and professional assessor. 
     Analyze the provided HTML content from a portfolio website and create a comprehensive summary.
+    The content may come from several pages of the site, each starting with a "## Page <path>" heading.
     
     Your task is to read through the HTML content and create a detailed portfolio summary that includes:
     
@@ -329,7 +331,7 @@ async def analyze_portfolio_direct(html_data: str, max_retries: int) -> Tuple[Op
             # Get the async client
             client = await get_async_client()
             
-            completion = await client.beta.chat.completions.parse(
+            completion = await parse_completion(client, "portfolio",
                 model="gpt-5.1",
                 messages=[
                     {"role": "system", "content": prompt_template},
@@ -9,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 # openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -54,11 +55,8 @@ class Skills(BaseModel):
     Skills: list[str]
 
 
-class Step(BaseModel):
+class ProfileStep(BaseModel):
     SuggestedRole: str
-    CandidateFullName: str
-    EmailAddress: str
-    PhoneNumber: str
     ProfessionalTitle: str
     Summary: str
     YearsOfExperienceRequired: str
@@ -70,11 +68,55 @@ class Step(BaseModel):
     Skills: list[Skills]
 
 
+class Step(ProfileStep):
+    CandidateFullName: str
+    EmailAddress: str
+    PhoneNumber: str
+
+
 class resume_data(BaseModel):
     steps: list[Step]
 
 
-async def analyze_resume(input_question):
+class ContactStep(ProfileStep):
+    CandidateFullName: str
+    PhoneNumber: str
+
+
+class resume_profile_data(BaseModel):
+    # Used when the email address was already extracted from the resume text
+    steps: list[ContactStep]
+
+
+def format_verified_facts(verified_facts):
+    """
+    Render locally extracted contact details as a prompt block.
+    """
+    return f"""**Verified facts (copied directly from the resume text, use them as-is):**
+        - Email: {verified_facts.get('email') or 'not found'}
+        - Links: {', '.join(verified_facts.get('urls', [])) or 'none'}
+        - Dates: {', '.join(verified_facts.get('dates', [])) or 'none'}
+
+        **Hints (guessed from the resume layout, check them against the resume text):**
+        - Full Name: {verified_facts.get('full_name') or 'not found'}
+        - Phone: {verified_facts.get('phone') or 'not found'}
+        """
+
+
+async def analyze_resume(input_question, verified_facts=None):
+    """
+    Parses the resume into structured profile data.
+
+    Args:
+        input_question (str): Resume text
+        verified_facts (dict): Contact details from Scraper.contact_extractor (optional).
+                               Email, links and dates are given to the model as
+                               verified facts, name and phone as hints; when the
+                               email was found the model does not generate it again.
+
+    Returns:
+        tuple: (resume_data or resume_profile_data object, total_tokens_used)
+    """
 
     prompt_template = """ You are an expert resume parser. Extract the following information from the resume and structure it according to the specified format:
 
@@ -171,16 +213,23 @@ async def analyze_resume(input_question):
 
         """
 
+    response_format, step_format = resume_data, Step
+    if verified_facts:
+        input_question = f"{format_verified_facts(verified_facts)}\n{input_question}"
+        # Only the email address is an exact match; name and phone stay in the schema
+        if verified_facts.get('email'):
+            response_format, step_format = resume_profile_data, ContactStep
+
     # Get the async client
     client = await get_async_client()
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "resume",
     model="gpt-5.1",
     messages=[
         {"role": "system", "content": prompt_template},
         {"role": "user", "content": input_question}
     ],
-    response_format=resume_data,
+    response_format=step_format,
     )
 
     analysis_response = completion.choices[0].message
@@ -189,5 +238,5 @@ async def analyze_resume(input_question):
         print(f"Model refused to respond: {analysis_response.refusal}")
         return None, total_tokens
     else:
-        parsed_data = resume_data(steps=analysis_response.parsed.steps)
+        parsed_data = response_format(steps=[analysis_response.parsed])
         return parsed_data, total_tokens
\ No newline at end of file
@@ -9,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 # openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -97,13 +98,13 @@ async def analyze_resume_Experience(input_question):
     # Get the async client
     client = await get_async_client()
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "resume_experience",
     model="gpt-5.1",
     messages=[
         {"role": "system", "content": prompt_template},
         {"role": "user", "content": input_question}
     ],
-    response_format=resume_experience_data,
+    response_format=Step,
     )
 
     analysis_response = completion.choices[0].message
@@ -112,7 +113,7 @@ async def analyze_resume_Experience(input_question):
         print(f"Model refused to respond: {analysis_response.refusal}")
         return None, total_tokens
     else:
-        parsed_data = resume_experience_data(steps=analysis_response.parsed.steps)
+        parsed_data = resume_experience_data(steps=[analysis_response.parsed])
         print("dataatatata : ", parsed_data)
         return parsed_data, total_tokens
 
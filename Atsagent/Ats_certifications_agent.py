@@ -9,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 # openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -153,13 +154,13 @@ async def analyze_certifications(input_question, jd_input):
     # Get the async client
     client = await get_async_client()
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "ats_certifications",
     model="gpt-5.1",
     messages=[
         {"role": "system", "content": prompt_template},
         {"role": "user", "content": f"Certification Information: {input_question}\n\nJob Description Qualification Requirements for ATS Optimization:\nRequired Qualifications: {jd_input.get('required_qualifications', [])}\nPreferred Qualifications: {jd_input.get('preferred_qualifications', [])}"}
     ],
-    response_format=Certifications_data,
+    response_format=Step,
     )
 
     analysis_response = completion.choices[0].message
@@ -168,5 +169,5 @@ async def analyze_certifications(input_question, jd_input):
         print(f"Model refused to respond: {analysis_response.refusal}")
         return None, total_tokens
     else:
-        parsed_data = Certifications_data(steps=analysis_response.parsed.steps)
+        parsed_data = Certifications_data(steps=[analysis_response.parsed])
         return parsed_data, total_tokens
\ No newline at end of file
@@ -9,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 # openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -132,13 +133,13 @@ async def analyze_achievements(input_question):
     # Get the async client
     client = await get_async_client()
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "achievements",
     model="gpt-5.1",
     messages=[
         {"role": "system", "content": prompt_template},
         {"role": "user", "content": input_question}
     ],
-    response_format=Achievements_data,
+    response_format=Step,
     )
 
     analysis_response = completion.choices[0].message
@@ -147,5 +148,5 @@ async def analyze_achievements(input_question):
         print(f"Model refused to respond: {analysis_response.refusal}")
         return None, total_tokens
     else:
-        parsed_data = Achievements_data(steps=analysis_response.parsed.steps)
+        parsed_data = Achievements_data(steps=[analysis_response.parsed])
         return parsed_data, total_tokens
\ No newline at end of file
@@ -9,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 # openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -21,17 +22,32 @@ class BasicInformation(BaseModel):
     ProfessionalTitle: str
     Summary: str
 
+class ProfileInformation(BaseModel):
+    SuggestedRole: str
+    CandidateFullName: str
+    ProfessionalTitle: str
+    Summary: str
+
 class BasicInformationData(BaseModel):
     steps: list[BasicInformation]
 
 
-async def analyze_basic_information(input_question):
+# Contact fields that can be echoed from the resume instead of generated. The
+# name stays generated: LinkedIn may spell it more completely than the resume.
+CONTACT_FIELDS = ("EmailAddress", "PhoneNumber")
+
+
+async def analyze_basic_information(input_question, echoed_fields=None):
     """
     Analyzes and extracts basic information from combined resume and LinkedIn profile data.
     
     Args:
         input_question (str): Combined text containing basic information from both 
                              resume and LinkedIn profile (name, email, phone, title, etc.)
+        echoed_fields (dict, optional): CONTACT_FIELDS values copied verbatim from
+                             the resume. When all are given they are echoed into the
+                             result and the model only generates the name and the
+                             profile fields.
     
     Returns:
         tuple: (BasicInformationData object, total_tokens_used)
@@ -71,16 +87,20 @@ async def analyze_basic_information(input_question):
 
         """
 
+    step_format = BasicInformation
+    if echoed_fields and all(echoed_fields.get(field) for field in CONTACT_FIELDS):
+        step_format = ProfileInformation
+
     # Get the async client
     client = await get_async_client()
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "basic_information",
     model="gpt-5.1",
     messages=[
         {"role": "system", "content": prompt_template},
         {"role": "user", "content": input_question}
     ],
-    response_format=BasicInformationData,
+    response_format=step_format,
     )
 
     analysis_response = completion.choices[0].message
@@ -89,5 +109,8 @@ async def analyze_basic_information(input_question):
         print(f"Model refused to respond: {analysis_response.refusal}")
         return None, total_tokens
     else:
-        parsed_data = BasicInformationData(steps=analysis_response.parsed.steps)
+        step = analysis_response.parsed
+        if step_format is ProfileInformation:
+            step = BasicInformation(**step.model_dump(), **{field: echoed_fields[field] for field in CONTACT_FIELDS})
+        parsed_data = BasicInformationData(steps=[step])
         return parsed_data, total_tokens
\ No newline at end of file
@@ -0,0 +1,136 @@
+import os
+import re
+from functools import lru_cache
+from pydantic import BaseModel, create_model
+from openai import AsyncOpenAI
+from dotenv import load_dotenv
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import shared_client
+sys.path.append(str(Path(__file__).parent.parent))
+from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
+from Multiagent.Basic_Information_agent import BasicInformation
+from Multiagent.Experience_agent import Step as ExperienceStep
+from Multiagent.Education_agent import Step as EducationStep
+from Multiagent.Skills_agent import Step as SkillsStep
+from Multiagent.Languages_agent import Step as LanguagesStep
+from Multiagent.Projects_agent import Step as ProjectsStep
+from Multiagent.Certifications_agent import Step as CertificationsStep
+from Multiagent.Achievements_agent import Step as AchievementsStep
+
+load_dotenv()
+
+
+class Step(BaseModel):
+    # Field names match the section keys of analysis_results
+    basic_information: BasicInformation
+    experience: ExperienceStep
+    education: EducationStep
+    skills: SkillsStep
+    languages: LanguagesStep
+    projects: ProjectsStep
+    certifications: CertificationsStep
+    achievements: AchievementsStep
+
+
+class Consolidated_data(BaseModel):
+    steps: list[Step]
+
+
+@lru_cache(maxsize=None)
+def section_models(sections):
+    """
+    Step and Consolidated_data models limited to the given sections, so the
+    model is not asked for sections missing from the input.
+
+    Args:
+        sections (tuple): Step field names
+
+    Returns:
+        tuple: (step model, data model)
+    """
+    if set(sections) == set(Step.model_fields):
+        return Step, Consolidated_data
+    step_model = create_model("Step", **{name: (field.annotation, ...) for name, field in Step.model_fields.items() if name in sections})
+    return step_model, create_model("Consolidated_data", steps=(list[step_model], ...))
+
+
+async def analyze_all_sections(input_question, sections=None):
+    """
+    Analyzes every resume section in a single call. Used for short resumes
+    without external sources, where the fixed prompt overhead of eight
+    separate section agents outweighs the per-section input.
+
+    Args:
+        input_question (str): The section agent inputs, each under a
+                             "### <section>" heading
+        sections (list, optional): Step field names of the sections in the
+                             input; all eight when not given
+
+    Returns:
+        tuple: (Consolidated_data object with one entry per requested section, total_tokens_used)
+    """
+
+    prompt_template = """ You are an expert resume analyst. You will receive the data for every section of one candidate's resume, each under a "### <section>" heading. Analyze each section from its own data and fill the matching field of the output format:
+
+        **General Instructions:**
+        - Use only information present in the input; never invent employers, dates, degrees or credentials
+        - Cross-reference the sections so names, dates and technologies stay consistent
+        - Use industry-standard terminology and proper capitalization (e.g., "JavaScript", "AWS")
+        - Return empty lists for sections without data
+        - Sections missing from the input are not part of the output format; skip their instructions below
+
+        1. **basic_information:**
+           - Full name, email address, phone number and current professional title
+           - Summary: 3-4 sentences in first person ("I am a [professional title] with [X years] of experience in [domain]...")
+           - Suggested role: the most suitable realistic role given experience, education and skills
+
+        2. **experience:**
+           - One entry per position with company, position, duration (StartDate/EndDate, "Present" for current roles), location and skill set
+           - Describe projects within each role with the technologies used and a results-oriented description
+
+        3. **education:**
+           - Institution, location, degree, graduation year, GPA (0 when not stated) and notable coursework or honors
+
+        4. **skills:**
+           - Group skills into relevant categories (Programming Languages, Frameworks & Libraries, Databases, Cloud & DevOps, Tools, Soft Skills, Domain Expertise)
+           - Each skill appears once; 3-8 skills per category ordered by relevance
+
+        5. **languages:**
+           - Spoken languages with proficiency level; do not list programming languages
+
+        6. **projects:**
+           - Title, role, technologies, duration and a description of purpose and impact
+
+        7. **certifications:**
+           - Certification name, issuing organization, dates and credential details when present
+
+        8. **achievements:**
+           - Awards, recognitions and notable accomplishments with issuer and date when present
+
+        """
+
+    step_format, data_format = section_models(tuple(sections or Step.model_fields))
+
+    # Get the async client
+    client = await get_async_client()
+
+    completion = await parse_completion(client, "consolidated",
+    model="gpt-5.1",
+    messages=[
+        {"role": "system", "content": prompt_template},
+        {"role": "user", "content": input_question}
+    ],
+    response_format=step_format,
+    )
+
+    analysis_response = completion.choices[0].message
+    total_tokens = completion.usage.total_tokens
+    if hasattr(analysis_response, 'refusal') and analysis_response.refusal:
+        print(f"Model refused to respond: {analysis_response.refusal}")
+        return None, total_tokens
+    else:
+        parsed_data = data_format(steps=[analysis_response.parsed])
+        return parsed_data, total_tokens
@@ -0,0 +1,137 @@
+"""
+Deterministic contact details extraction.
+
+Regex and layout heuristics over the resume text produced by MarkItDown.
+Emails, phone numbers, links and dates are copied verbatim from the resume,
+so they are passed to the resume agent as verified facts. Only the email
+address can be checked exactly; the name is a layout guess and is given to
+the model as a hint.
+"""
+import re
+
+EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
+# Loose phone candidates; extract_phone filters out dates and other numbers
+PHONE_PATTERN = re.compile(r"(?<![\w/])\+?\(?\d[\d\s().-]{7,18}\d(?![\w/])")
+YEAR_PATTERN = re.compile(r"^(?:19|20)\d{2}$")
+
+URL_PATTERN = re.compile(
+    r"(?:https?://|www\.)[^\s|,;<>()\[\]]+"
+    r"|\b(?:[a-z]{2,3}\.)?(?:linkedin\.com|github\.com|gitlab\.com|behance\.net|dribbble\.com)/[^\s|,;<>()\[\]]+",
+    re.IGNORECASE
+)
+
+MONTH = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?"
+SINGLE_DATE = rf"(?:{MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|(?:19|20)\d{{2}})"
+DATE_PATTERN = re.compile(
+    rf"\b{SINGLE_DATE}(?:\s*(?:-|–|—|to)\s*(?:{SINGLE_DATE}|Present|Current|Now|Today))?",
+    re.IGNORECASE
+)
+
+# Lines near the top of a resume that are headings rather than the candidate's name
+NON_NAME_LINES = {
+    "resume", "curriculum vitae", "cv", "summary", "profile", "contact",
+    "experience", "education", "skills", "objective", "personal information",
+}
+# Words of section headings and job titles, which are capitalized like names
+NON_NAME_WORDS = {
+    "resume", "curriculum", "vitae", "cv", "summary", "profile", "contact", "details",
+    "professional", "personal", "information", "experience", "education", "skills",
+    "objective", "projects", "certifications", "achievements", "references", "career",
+    "work", "history", "technical", "core", "competencies", "about", "me",
+    "senior", "junior", "lead", "principal", "staff", "chief", "head", "associate",
+    "software", "engineer", "engineering", "developer", "development", "designer",
+    "manager", "management", "analyst", "consultant", "architect", "scientist",
+    "specialist", "administrator", "director", "officer", "intern", "assistant",
+    "coordinator", "executive", "full", "stack", "frontend", "backend", "data",
+    "product", "marketing", "sales", "web", "mobile", "devops", "cloud", "qa",
+}
+NAME_WORD_PATTERN = re.compile(r"^[A-Z][A-Za-z'’.-]*$")
+
+
+def _clean_line(line):
+    # Drop markdown decoration added by MarkItDown
+    return re.sub(r"^[#>*\-\s]+|[*_`]+", "", line).strip()
+
+
+def extract_full_name(resume_text, max_lines=5):
+    """
+    Guess the candidate's name from the first lines of the resume: a short
+    line of capitalized words without digits, emails, links, section
+    headings or job title words. A hint only; the resume agent has the
+    final say.
+    """
+    lines = [_clean_line(line) for line in resume_text.splitlines()]
+    for line in [line for line in lines if line][:max_lines]:
+        if line.lower() in NON_NAME_LINES or "@" in line or any(ch.isdigit() for ch in line):
+            continue
+        words = line.replace(",", " ").split()
+        if not 2 <= len(words) <= 4 or not all(NAME_WORD_PATTERN.match(word) for word in words):
+            continue
+        if any(word.strip(".").lower() in NON_NAME_WORDS for word in words):
+            continue
+        return line
+    return ""
+
+
+def _looks_like_phone(candidate):
+    digits = re.sub(r"\D", "", candidate)
+    # Year ranges such as "2018 - 2020" have 8 digits; phone numbers have 9-15
+    if not 9 <= len(digits) <= 15:
+        return False
+    if candidate.startswith("+"):
+        return True
+    groups = re.findall(r"\d+", candidate)
+    # A bare digit run could be any ID; a phone number is written in groups
+    if len(groups) < 2:
+        return False
+    # "2015 2016 2017" or "2019 0045 6789": year lists and IDs, not phones
+    return not YEAR_PATTERN.match(groups[0])
+
+
+def extract_phone(resume_text):
+    """
+    Take the first phone number: 9-15 digits written with a leading "+" or
+    in separated groups, not starting with a year.
+    """
+    for match in PHONE_PATTERN.finditer(resume_text):
+        candidate = match.group().strip()
+        if _looks_like_phone(candidate):
+            return candidate
+    return ""
+
+
+def _unique(values):
+    seen = set()
+    result = []
+    for value in values:
+        if value.lower() not in seen:
+            seen.add(value.lower())
+            result.append(value)
+    return result
+
+
+def extract_contact_facts(resume_text):
+    """
+    Extract contact details, links and dates from resume text.
+
+    Args:
+        resume_text (str): Resume text produced by MarkItDown or pasted by the user
+
+    Returns:
+        dict: full_name, email, phone (empty string when not found), urls and
+              dates (lists in the order they appear in the resume)
+    """
+    resume_text = resume_text or ""
+    emails = EMAIL_PATTERN.findall(resume_text)
+    # Email addresses end in a domain, so strip them before looking for links
+    text_without_emails = EMAIL_PATTERN.sub(" ", resume_text)
+    urls = [url.rstrip(".") for url in URL_PATTERN.findall(text_without_emails)]
+
+    return {
+        'full_name': extract_full_name(resume_text),
+        'email': emails[0] if emails else "",
+        'phone': extract_phone(resume_text),
+        'urls': _unique(urls),
+        'dates': _unique(match.group() for match in DATE_PATTERN.finditer(text_without_emails)),
+    }
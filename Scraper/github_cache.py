@@ -0,0 +1,169 @@
+"""
+GitHub Response Cache
+
+Disk-backed cache for GitHub API responses, one pickle per endpoint URL.
+Each entry keeps the response JSON, its Link header and the ETag /
+Last-Modified validators:
+- within GITHUB_CACHE_FRESH_SECONDS of the last validation the entry is
+  served without a request (hit)
+- after that a conditional request is sent; GitHub answers 304 when nothing
+  changed, which does not count against the rate limit (not_modified)
+- otherwise the full response is fetched and stored (miss)
+- when the GitHub rate limit is used up (see github_tokens.py), an older
+  entry is served as it is (stale)
+
+A 404 is stored the same way with no data, so a repository without a README
+is not asked for it again on every collection.
+
+Entries not validated for GITHUB_CACHE_TTL seconds are evicted when read
+and by the periodic sweep in pipeline/disk_store.py. The hit /
+304 / miss / stale counts and rates are reported by the /health endpoint
+under github_cache.
+"""
+import asyncio
+import hashlib
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+
+from Scraper.github_tokens import GitHubRateLimited
+from pipeline.disk_store import DiskStore
+
+load_dotenv()
+
+DEFAULT_CACHE_DIR = os.getenv("GITHUB_CACHE_DIR", os.path.join(os.getenv("RESUME_CACHE_DIR", "./resume_cache"), "github"))
+DEFAULT_TTL_SECONDS = int(os.getenv("GITHUB_CACHE_TTL", str(7 * 24 * 3600)))
+DEFAULT_FRESH_SECONDS = int(os.getenv("GITHUB_CACHE_FRESH_SECONDS", "600"))
+
+HIT = "hit"
+NOT_MODIFIED = "not_modified"
+MISS = "miss"
+STALE = "stale"
+
+# Entries sit directly in the cache directory
+RESPONSES = ""
+
+# Responses stored even though they carry no data: the resource does not exist
+NOT_FOUND_STATUS = 404
+
+
+class GitHubCache(DiskStore):
+    """
+    Conditional-request cache for GitHub API GET requests.
+
+    Args:
+        cache_dir: Directory holding the entries
+        ttl_seconds: Lifetime of an entry since it was last validated
+        fresh_seconds: Age up to which an entry is served without a request
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: int = DEFAULT_TTL_SECONDS, fresh_seconds: int = DEFAULT_FRESH_SECONDS):
+        super().__init__(cache_dir, ttl_seconds, kinds=(RESPONSES,), label="GitHub cache entry")
+        self.fresh_seconds = fresh_seconds
+        self._counts = dict.fromkeys((HIT, NOT_MODIFIED, MISS, STALE), 0)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, params=None) -> str:
+        query = "&".join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def _record(self, outcome: str):
+        with self._lock:
+            self._counts[outcome] += 1
+
+    async def get_json(self, send, url, params=None, headers=None, prefer_stale=False):
+        """
+        GET a GitHub API endpoint through the cache.
+
+        Args:
+            send: Coroutine function (url, params, headers) -> httpx.Response
+            url: Endpoint URL
+            params: Query parameters (optional)
+            headers: Request headers (optional)
+            prefer_stale: Serve any stored entry without a request, to save
+                          rate-limit budget
+
+        Returns:
+            tuple: (data, links, stale) with the decoded JSON (None for a
+                   non-200 response), the parsed Link header and whether an
+                   unvalidated entry was served
+
+        Raises:
+            GitHubRateLimited: When the rate limit is used up and nothing is stored
+        """
+        key = self.key(url, params)
+        entry = await asyncio.to_thread(self.load, RESPONSES, key)
+        if entry and time.time() - entry['validated_at'] < self.fresh_seconds:
+            self._record(HIT)
+            return entry['data'], entry['links'], False
+        if entry and prefer_stale:
+            self._record(STALE)
+            return entry['data'], entry['links'], True
+
+        headers = dict(headers or {})
+        if entry:
+            if entry.get('etag'):
+                headers["If-None-Match"] = entry['etag']
+            if entry.get('last_modified'):
+                headers["If-Modified-Since"] = entry['last_modified']
+
+        try:
+            response = await send(url, params, headers)
+        except GitHubRateLimited:
+            if not entry:
+                raise
+            self._record(STALE)
+            return entry['data'], entry['links'], True
+
+        if response.status_code == 304 and entry:
+            self._record(NOT_MODIFIED)
+            entry['validated_at'] = time.time()
+            await asyncio.to_thread(self.save, RESPONSES, key, entry)
+            return entry['data'], entry['links'], False
+
+        self._record(MISS)
+        if response.status_code == NOT_FOUND_STATUS:
+            data, links = None, {}
+        elif response.status_code != 200:
+            return None, {}, False
+        else:
+            data = response.json()
+            links = dict(response.links)
+        if response.status_code == NOT_FOUND_STATUS or response.headers.get("ETag") or response.headers.get("Last-Modified"):
+            await asyncio.to_thread(self.save, RESPONSES, key, {
+                'validated_at': time.time(),
+                'etag': response.headers.get("ETag"),
+                'last_modified': response.headers.get("Last-Modified"),
+                'data': data,
+                'links': links,
+            })
+        return data, links, False
+
+    def peek(self, url, params=None):
+        """
+        Return the stored entry for an endpoint without counting a lookup.
+        """
+        return self.load(RESPONSES, self.key(url, params))
+
+    def is_fresh(self, url, params=None) -> bool:
+        """
+        Whether a lookup of an endpoint would be served without a request.
+        """
+        entry = self.peek(url, params)
+        return bool(entry) and time.time() - entry['validated_at'] < self.fresh_seconds
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Hit, 304, miss and stale counts with their share of all lookups
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        rates = {f"{outcome}_rate": round(count / total, 3) if total else 0.0 for outcome, count in counts.items()}
+        return {**counts, **rates}
+
+
+github_cache = GitHubCache()
@@ -1,112 +1,425 @@
-import requests
-from datetime import datetime
+import asyncio
+import base64
+import os
+import re
+import sys
+import time
+from pathlib import Path
 
-def get_github_profile_info(github_url):
+import httpx
+from dotenv import load_dotenv
+
+# Add parent directory to path to import shared_client
+sys.path.append(str(Path(__file__).parent.parent))
+from shared_client import get_http_client
+from Scraper.github_cache import github_cache
+from Scraper.github_tokens import GitHubRateLimited, github_tokens
+from pipeline.token_budget import rank_repositories
+
+load_dotenv()
+
+GITHUB_API_URL = "https://api.github.com"
+REPOS_PER_PAGE = 100
+
+# Repository pages fetched at once, and the most pages fetched per profile
+GITHUB_PAGE_CONCURRENCY = int(os.getenv("GITHUB_PAGE_CONCURRENCY", "4"))
+GITHUB_MAX_REPO_PAGES = int(os.getenv("GITHUB_MAX_REPO_PAGES", "30"))
+
+# Top repositories enriched with a README excerpt and language byte counts,
+# how many are fetched at once, and the README excerpt size
+GITHUB_ENRICH_TOP_REPOS = int(os.getenv("GITHUB_ENRICH_TOP_REPOS", "5"))
+GITHUB_ENRICH_CONCURRENCY = int(os.getenv("GITHUB_ENRICH_CONCURRENCY", "5"))
+GITHUB_README_CHARS = int(os.getenv("GITHUB_README_CHARS", "1200"))
+# Enrichment is optional: it only spends rate-limit budget beyond this many
+# requests, which stay available for the core collection of later profiles
+GITHUB_ENRICH_MIN_REMAINING = int(os.getenv("GITHUB_ENRICH_MIN_REMAINING", "20"))
+# READMEs larger than this are not decoded at all
+GITHUB_README_MAX_BYTES = 512 * 1024
+
+HEADERS = {"Accept": "application/vnd.github.v3+json"}
+
+
+def _github_username(github_url):
+    return github_url.strip("/").split("/")[-1]
+
+
+def _last_page(links):
+    """
+    Number of the last repository page, from the Link header of the first page.
+    """
+    last = links.get("last")
+    if not last:
+        return 1
+    try:
+        return int(httpx.URL(last["url"]).params.get("page", 1))
+    except ValueError:
+        return 1
+
+
+async def _send(client, url, params, headers):
+    """
+    Send one GitHub API request with the least-used token of the pool.
+    """
+    budget = github_tokens.acquire()
+    response = None
+    try:
+        response = await client.get(url, params=params, headers={**headers, **budget.headers()})
+    finally:
+        github_tokens.release(budget, response)
+    if response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+        raise GitHubRateLimited(float(response.headers.get("X-RateLimit-Reset", 0)) - time.time())
+    return response
+
+
+async def _get_json(client, url, params=None, state=None):
+    """
+    Conditional request through the disk cache.
+
+    Args:
+        state: Collection state; "prefer_stale" serves stored entries without
+               a request and "stale" is set when an unvalidated entry was served
+
+    Returns:
+        tuple: (data, links)
+    """
+    state = state if state is not None else {}
+    data, links, stale = await github_cache.get_json(
+        lambda url, params, headers: _send(client, url, params, headers),
+        url, params, HEADERS, prefer_stale=state.get("prefer_stale", False)
+    )
+    if stale:
+        state["stale"] = True
+    return data, links
+
+
+def _estimated_requests(username):
+    """
+    Requests the core collection needs: user, events and every repository
+    page (known from the stored first page, if any), less those answered by
+    a fresh stored response, and whether the profile is stored. Repository
+    enrichment is planned separately, from the budget left afterwards.
+    """
+    repos_url = f"{GITHUB_API_URL}/users/{username}/repos"
+    first_page = github_cache.peek(repos_url, {"per_page": REPOS_PER_PAGE, "sort": "updated", "page": 1})
+    cached = github_cache.peek(f"{GITHUB_API_URL}/users/{username}") is not None
+    pages = _last_page(first_page['links']) if first_page else 1
+    endpoints = [(f"{GITHUB_API_URL}/users/{username}", None),
+                 (f"{GITHUB_API_URL}/users/{username}/events/public", {"per_page": 30})]
+    endpoints += [(repos_url, {"per_page": REPOS_PER_PAGE, "sort": "updated", "page": page})
+                  for page in range(1, min(pages, GITHUB_MAX_REPO_PAGES or pages) + 1)]
+    return sum(not github_cache.is_fresh(url, params) for url, params in endpoints), cached
+
+
+async def _partial(request, default, state):
+    """
+    Await one request of a collection. When the rate limit runs out part-way,
+    the request gives default and state["cut_short"] the seconds until the
+    budget resets, so the data fetched so far is kept.
+    """
+    try:
+        return await request
+    except GitHubRateLimited as e:
+        state["cut_short"] = e.reset_in
+        return default
+
+
+async def plan_github_collection(github_url):
+    """
+    Check in advance whether a GitHub profile can be collected fresh with the
+    remaining rate-limit budget.
+
+    Args:
+        github_url (str): The GitHub profile URL
+
+    Returns:
+        dict: remaining budget, estimated requests, whether the budget is
+              sufficient, seconds until the first token's budget resets and
+              whether a stored profile can be served instead
+    """
+    requests_needed, cached = await asyncio.to_thread(_estimated_requests, _github_username(github_url))
+    return {**github_tokens.plan(requests_needed), "requests_needed": requests_needed, "cached": cached}
+
+
+async def fetch_repositories(client, username, first_page=None, state=None):
+    """
+    Fetch every repository page of a user, a few pages at a time.
+
+    Args:
+        client: httpx.AsyncClient
+        username: GitHub username
+        first_page: Already running request for page 1 (optional)
+        state: Collection state passed to _get_json (optional)
+
+    Returns:
+        list: Raw repository objects from the GitHub API, most recently updated first
+    """
+    state = state if state is not None else {}
+    params = {"per_page": REPOS_PER_PAGE, "sort": "updated"}
+    url = f"{GITHUB_API_URL}/users/{username}/repos"
+    repos_data, links = await (first_page or _get_json(client, url, {**params, "page": 1}, state))
+    if repos_data is None:
+        return []
+
+    last_page = _last_page(links)
+    if GITHUB_MAX_REPO_PAGES and last_page > GITHUB_MAX_REPO_PAGES:
+        print(f"GitHub user {username} has {last_page} repository pages, fetching the first {GITHUB_MAX_REPO_PAGES}")
+        last_page = GITHUB_MAX_REPO_PAGES
+
+    semaphore = asyncio.Semaphore(GITHUB_PAGE_CONCURRENCY)
+
+    async def fetch_page(page):
+        async with semaphore:
+            page_data, _ = await _partial(_get_json(client, url, {**params, "page": page}, state), (None, {}), state)
+            return page_data or []
+
+    pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+    for page_data in pages:
+        repos_data.extend(page_data)
+    return repos_data
+
+
+def readme_excerpt(markdown, max_chars=GITHUB_README_CHARS):
+    """
+    Plain-text start of a README: badges, images, HTML tags and link targets
+    are dropped and whitespace is collapsed.
+    """
+    text = re.sub(r"!\[[^\]]*\]\([^)]*\)", " ", markdown)          # images and badges
+    text = re.sub(r"<[^>]+>", " ", text)                           # HTML tags
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)           # links keep their label
+    text = re.sub(r"^\s*#+\s*", "", text, flags=re.MULTILINE)      # heading markers
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) > max_chars:
+        text = text[:max_chars].rsplit(" ", 1)[0] + " …"
+    return text
+
+
+def _repository_endpoints(repo):
+    base = f"{GITHUB_API_URL}/repos/{repo['full_name']}"
+    return f"{base}/readme", f"{base}/languages"
+
+
+async def _repository_details(client, repo, state):
+    """
+    Fetch the README excerpt and language byte counts of one repository.
+    """
+    readme_url, languages_url = _repository_endpoints(repo)
+    readme, languages = await asyncio.gather(
+        _get_json(client, readme_url, state=state),
+        _get_json(client, languages_url, state=state),
+        return_exceptions=True
+    )
+    details = {}
+    if not isinstance(readme, BaseException):
+        readme_data = readme[0] or {}
+        if readme_data.get("encoding") == "base64" and (readme_data.get("size") or 0) <= GITHUB_README_MAX_BYTES:
+            try:
+                markdown = base64.b64decode(readme_data.get("content") or "").decode("utf-8", errors="replace")
+            except ValueError:
+                markdown = ""
+            if markdown:
+                details["readme_excerpt"] = readme_excerpt(markdown)
+    if not isinstance(languages, BaseException) and languages[0]:
+        details["language_bytes"] = languages[0]
+    return details
+
+
+def _affordable_repositories(repositories, prefer_stale=False):
+    """
+    The repositories, in order, whose enrichment fits the rate-limit budget
+    beyond GITHUB_ENRICH_MIN_REMAINING. Endpoints answered from the cache
+    without a request cost nothing.
+    """
+    budget = github_tokens.remaining() - GITHUB_ENRICH_MIN_REMAINING
+    affordable = []
+    for repo in repositories:
+        cost = sum(not (github_cache.is_fresh(url) or prefer_stale and github_cache.peek(url))
+                   for url in _repository_endpoints(repo))
+        if cost <= budget:
+            budget -= cost
+            affordable.append(repo)
+    return affordable
+
+
+async def enrich_top_repositories(client, repositories, state=None, top_n=GITHUB_ENRICH_TOP_REPOS):
+    """
+    Add "readme_excerpt" and "language_bytes" to the top original repositories,
+    a few at a time. Enrichment is optional: only repositories whose requests
+    fit the budget left after the core collection are enriched. Repositories
+    whose requests fail or hit the rate limit are left as they are.
+
+    Args:
+        client: httpx.AsyncClient
+        repositories: Repository dicts from build_profile_info (updated in place)
+        state: Collection state passed to _get_json (optional)
+        top_n: Number of repositories to enrich
+
+    Returns:
+        int: Number of repositories enriched
+    """
+    top = [repo for repo in rank_repositories(repositories) if not repo.get("fork") and repo.get("full_name")][:top_n]
+    top = await asyncio.to_thread(_affordable_repositories, top, (state or {}).get("prefer_stale", False))
+    semaphore = asyncio.Semaphore(GITHUB_ENRICH_CONCURRENCY)
+
+    async def enrich(repo):
+        async with semaphore:
+            details = await _repository_details(client, repo, state)
+        repo.update(details)
+        return bool(details)
+
+    return sum(await asyncio.gather(*(enrich(repo) for repo in top)))
+
+
+def build_profile_info(user_data, repos_data, events_data):
+    """
+    Compile the profile dictionary from the raw user, repository and event data.
+    """
+    # Process repositories
+    repos_info = []
+    languages_used = set()
+    repo_topics = set()
+    total_stars = 0
+
+    for repo in repos_data:
+        repo_info = {
+            "name": repo.get("name"),
+            "full_name": repo.get("full_name"),
+            "description": repo.get("description"),
+            "language": repo.get("language"),
+            "fork": repo.get("fork"),
+            "stars": repo.get("stargazers_count"),
+            "forks": repo.get("forks_count"),
+            "created_at": repo.get("created_at"),
+            "updated_at": repo.get("updated_at"),
+            "url": repo.get("html_url"),
+            "topics": repo.get("topics", [])
+        }
+        repos_info.append(repo_info)
+        if repo.get("language"):
+            languages_used.add(repo.get("language"))
+        repo_topics.update(repo.get("topics", []))
+        total_stars += repo.get("stargazers_count", 0)
+
+    # Process recent events
+    recent_events = []
+    for event in events_data[:10]:  # Last 10 events
+        event_info = {
+            "type": event.get("type"),
+            "repo": event.get("repo", {}).get("name"),
+            "created_at": event.get("created_at"),
+            "payload": event.get("payload")
+        }
+        recent_events.append(event_info)
+
+    # Compile final profile dictionary
+    return {
+        "username": user_data.get("login"),
+        "name": user_data.get("name"),
+        "bio": user_data.get("bio"),
+        "location": user_data.get("location"),
+        "blog": user_data.get("blog"),
+        "company": user_data.get("company"),
+        "email": user_data.get("email"),
+        "public_repos": user_data.get("public_repos"),
+        "public_gists": user_data.get("public_gists"),
+        "followers": user_data.get("followers"),
+        "following": user_data.get("following"),
+        "created_at": user_data.get("created_at"),
+        "updated_at": user_data.get("updated_at"),
+        "avatar_url": user_data.get("avatar_url"),
+        "html_url": user_data.get("html_url"),
+        "total_stars": total_stars,
+        "languages_used": sorted(languages_used),
+        "repo_topics": sorted(repo_topics),
+        "repositories": repos_info,
+        "recent_events": recent_events,
+        "api_note": (
+            "Contribution graph data is not available via the API. "
+            "For detailed contributions, see the profile's contribution graph on GitHub."
+        )
+    }
+
+
+async def fetch_github_profile_info(github_url, client=None):
     """
     Fetches all publicly available information for a given GitHub profile.
+    The user, repository and event endpoints are requested concurrently on the
+    shared HTTP pool, and every repository page is followed. The top
+    repositories then get a README excerpt and their language byte counts.
+
+    When the rate-limit budget cannot cover the collection, stored responses
+    are served without revalidation and the profile is marked "stale" with
+    "rate_limit_reset_in" seconds. The same applies when the rate limit runs
+    out part-way: the data fetched so far is returned.
 
     Args:
         github_url (str): The GitHub profile URL (e.g., "https://github.com/jayanta8509")
+        client (httpx.AsyncClient, optional): Client to use instead of the shared one
 
     Returns:
         dict: A dictionary containing user profile, repositories, and recent activity.
               Returns None if the profile is not found or an error occurs.
+
+    Raises:
+        GitHubRateLimited: When the rate limit is used up and the profile is not stored
     """
-    # Extract username from URL
-    username = github_url.strip("/").split("/")[-1]
+    username = _github_username(github_url)
     if not username:
         return None
+    client = client or await get_http_client()
 
-    base_url = "https://api.github.com"
-    headers = {"Accept": "application/vnd.github.v3+json"}
+    plan = await plan_github_collection(github_url)
+    state = {"prefer_stale": not plan["sufficient"], "stale": False}
+    if state["prefer_stale"]:
+        if not plan["cached"]:
+            # Spending the last requests on a profile that cannot be completed would only starve others
+            raise GitHubRateLimited(plan["reset_in"])
+        print(f"⚠️ GitHub budget too low for {username} ({plan['remaining']} requests left, "
+              f"{plan['requests_needed']} needed, resets in {plan['reset_in']}s); serving cached data")
 
     try:
-        # Fetch user profile
-        user_response = requests.get(f"{base_url}/users/{username}", headers=headers)
-        if user_response.status_code != 200:
-            return None
-        user_data = user_response.json()
-
-        # Fetch user repositories
-        repos_response = requests.get(f"{base_url}/users/{username}/repos?per_page=100", headers=headers)
-        repos_data = repos_response.json() if repos_response.status_code == 200 else []
-
-        # Fetch recent public events (activity)
-        events_response = requests.get(f"{base_url}/users/{username}/events/public?per_page=30", headers=headers)
-        events_data = events_response.json() if events_response.status_code == 200 else []
-
-        # Process repositories
-        repos_info = []
-        languages_used = set()
-        repo_topics = set()
-        total_stars = 0
-
-        for repo in repos_data:
-            repo_info = {
-                "name": repo.get("name"),
-                "full_name": repo.get("full_name"),
-                "description": repo.get("description"),
-                "language": repo.get("language"),
-                "fork": repo.get("fork"),
-                "stars": repo.get("stargazers_count"),
-                "forks": repo.get("forks_count"),
-                "created_at": repo.get("created_at"),
-                "updated_at": repo.get("updated_at"),
-                "url": repo.get("html_url"),
-                "topics": repo.get("topics", [])
-            }
-            repos_info.append(repo_info)
-            if repo.get("language"):
-                languages_used.add(repo.get("language"))
-            repo_topics.update(repo.get("topics", []))
-            total_stars += repo.get("stargazers_count", 0)
-
-        # Process recent events
-        recent_events = []
-        for event in events_data[:10]:  # Last 10 events
-            event_info = {
-                "type": event.get("type"),
-                "repo": event.get("repo", {}).get("name"),
-                "created_at": event.get("created_at"),
-                "payload": event.get("payload")
-            }
-            recent_events.append(event_info)
-
-        # Compile final profile dictionary
-        profile_info = {
-            "username": user_data.get("login"),
-            "name": user_data.get("name"),
-            "bio": user_data.get("bio"),
-            "location": user_data.get("location"),
-            "blog": user_data.get("blog"),
-            "company": user_data.get("company"),
-            "email": user_data.get("email"),
-            "public_repos": user_data.get("public_repos"),
-            "public_gists": user_data.get("public_gists"),
-            "followers": user_data.get("followers"),
-            "following": user_data.get("following"),
-            "created_at": user_data.get("created_at"),
-            "updated_at": user_data.get("updated_at"),
-            "avatar_url": user_data.get("avatar_url"),
-            "html_url": user_data.get("html_url"),
-            "total_stars": total_stars,
-            "languages_used": sorted(languages_used),
-            "repo_topics": sorted(repo_topics),
-            "repositories": repos_info,
-            "recent_events": recent_events,
-            "api_note": (
-                "Contribution graph data is not available via the API. "
-                "For detailed contributions, see the profile's contribution graph on GitHub."
+        user_request = asyncio.create_task(_get_json(client, f"{GITHUB_API_URL}/users/{username}", state=state))
+        first_repos_page = asyncio.create_task(_partial(_get_json(
+            client, f"{GITHUB_API_URL}/users/{username}/repos",
+            {"per_page": REPOS_PER_PAGE, "sort": "updated", "page": 1}, state
+        ), (None, {}), state))
+        events_request = asyncio.create_task(_partial(_get_json(
+            client, f"{GITHUB_API_URL}/users/{username}/events/public", {"per_page": 30}, state
+        ), (None, {}), state))
+        try:
+            (user_data, _), repos_data, (events_data, _) = await asyncio.gather(
+                user_request, fetch_repositories(client, username, first_repos_page, state), events_request
             )
-        }
+        except BaseException:
+            for task in (user_request, first_repos_page, events_request):
+                task.cancel()
+            raise
 
+        if user_data is None:
+            return None
+        profile_info = build_profile_info(user_data, repos_data, events_data or [])
+        await enrich_top_repositories(client, profile_info["repositories"], state)
+        if state["stale"] or "cut_short" in state:
+            # Served from the cache or cut short by the rate limit
+            profile_info["stale"] = True
+            profile_info["rate_limit_reset_in"] = github_tokens.plan(0)["reset_in"]
         return profile_info
 
-    except Exception as e:
+    except (httpx.HTTPError, ValueError) as e:
         print(f"Error fetching GitHub profile info: {e}")
         return None
 
 
+def get_github_profile_info(github_url):
+    """
+    Blocking wrapper around fetch_github_profile_info for scripts and threads
+    without a running event loop.
+    """
+    async def fetch():
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            return await fetch_github_profile_info(github_url, client)
+    return asyncio.run(fetch())
+
+
 # # Example usage
 # if __name__ == "__main__":
 #     profile_url = "https://github.com/jayanta8509"
@@ -116,4 +429,4 @@ def get_github_profile_info(github_url):
 #         pp = pprint.PrettyPrinter(indent=2)
 #         pp.pprint(profile_data)
 #     else:
-#         print("Profile not found or error occurred.")
\ No newline at end of file
+#         print("Profile not found or error occurred.")
@@ -0,0 +1,162 @@
+"""
+GitHub Token Pool
+
+GitHub allows 60 unauthenticated API requests per hour per IP and 5000 per
+hour per personal access token. Tokens are read from GITHUB_TOKENS (comma
+separated) or GITHUB_TOKEN; without any the pool has a single anonymous
+entry.
+
+Each request takes the token with the most budget left in its current
+window (the least used one), reserving one request until the response
+arrives. The X-RateLimit-Limit, -Remaining and -Reset headers of every
+response update the token's budget, so the pool knows before sending a
+request whether it can be served. When no token has budget left,
+GitHubRateLimited is raised instead of sending a request that would fail.
+The budget per token is reported by the /health endpoint under
+github_tokens.
+"""
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ANONYMOUS_LIMIT = 60
+TOKEN_LIMIT = 5000
+WINDOW_SECONDS = 3600
+
+
+def _configured_tokens():
+    raw = os.getenv("GITHUB_TOKENS") or os.getenv("GITHUB_TOKEN") or ""
+    return [token.strip() for token in raw.split(",") if token.strip()]
+
+
+class GitHubRateLimited(Exception):
+    """
+    Raised when every token has used up its GitHub API budget.
+
+    Args:
+        reset_in: Seconds until the first token's budget resets
+    """
+    def __init__(self, reset_in: float):
+        self.reset_in = max(0, int(reset_in))
+        super().__init__(f"GitHub API rate limit exhausted, resets in {self.reset_in}s")
+
+
+class TokenBudget:
+    """
+    Rate-limit state of one token (or of anonymous access when token is None).
+    """
+    def __init__(self, name: str, token=None):
+        self.name = name
+        self.token = token
+        self.limit = TOKEN_LIMIT if token else ANONYMOUS_LIMIT
+        self.remaining = self.limit
+        self.reset_at = time.time() + WINDOW_SECONDS
+        self.in_flight = 0
+        self.requests = 0
+
+    def available(self, now: float) -> int:
+        if now >= self.reset_at:
+            # The window has rolled over; the next response reports the new one
+            return self.limit - self.in_flight
+        return self.remaining - self.in_flight
+
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+
+class GitHubTokenPool:
+    """
+    Least-used token selection with rate-limit accounting.
+
+    Args:
+        tokens: Personal access tokens; an empty list means anonymous access
+    """
+    def __init__(self, tokens=None):
+        tokens = _configured_tokens() if tokens is None else tokens
+        self._budgets = [TokenBudget(f"token-{i + 1}", token) for i, token in enumerate(tokens)] or [TokenBudget("anonymous")]
+        self._lock = threading.Lock()
+
+    def acquire(self) -> TokenBudget:
+        """
+        Reserve one request on the token with the most budget left.
+
+        Returns:
+            TokenBudget: The token to send the request with
+
+        Raises:
+            GitHubRateLimited: When no token has budget left
+        """
+        now = time.time()
+        with self._lock:
+            budget = max(self._budgets, key=lambda b: (b.available(now), -b.requests))
+            if budget.available(now) <= 0:
+                raise GitHubRateLimited(self._reset_in(now))
+            budget.in_flight += 1
+            return budget
+
+    def release(self, budget: TokenBudget, response=None):
+        """
+        Return a reservation and update the token's budget from the response headers.
+        """
+        with self._lock:
+            budget.in_flight -= 1
+            if response is None:
+                return
+            budget.requests += 1
+            headers = response.headers
+            try:
+                if "X-RateLimit-Limit" in headers:
+                    budget.limit = int(headers["X-RateLimit-Limit"])
+                if "X-RateLimit-Remaining" in headers:
+                    budget.remaining = int(headers["X-RateLimit-Remaining"])
+                if "X-RateLimit-Reset" in headers:
+                    budget.reset_at = float(headers["X-RateLimit-Reset"])
+            except ValueError:
+                pass
+            if response.status_code in (403, 429) and headers.get("X-RateLimit-Remaining") == "0":
+                budget.remaining = 0
+
+    def _reset_in(self, now: float) -> float:
+        return min(b.reset_at for b in self._budgets) - now
+
+    def remaining(self) -> int:
+        """
+        Requests that can still be sent across all tokens.
+        """
+        now = time.time()
+        with self._lock:
+            return sum(max(0, b.available(now)) for b in self._budgets)
+
+    def plan(self, requests_needed: int) -> dict:
+        """
+        Check in advance whether a collection needing `requests_needed` requests
+        can be served fresh.
+
+        Returns:
+            dict: remaining budget, whether it is sufficient and seconds until
+                  the first reset
+        """
+        remaining = self.remaining()
+        with self._lock:
+            reset_in = max(0, int(self._reset_in(time.time())))
+        return {"remaining": remaining, "sufficient": remaining >= requests_needed, "reset_in": reset_in}
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        with self._lock:
+            return {
+                b.name: {
+                    "limit": b.limit,
+                    "remaining": max(0, b.available(now)),
+                    "reset_in": max(0, int(b.reset_at - now)),
+                    "requests": b.requests,
+                }
+                for b in self._budgets
+            }
+
+
+github_tokens = GitHubTokenPool()
@@ -0,0 +1,192 @@
+"""
+HTML Text Extraction
+
+Portfolio pages are turned into plain text before they reach the portfolio
+agent. Extraction backends are registered by name and chosen with
+HTML_EXTRACTOR:
+- "lxml" (default): libxml2's C parser. With HTML_MAIN_CONTENT on it also
+  drops boilerplate before taking the text: navigation, sidebars, forms,
+  hidden elements, cookie / newsletter / share widgets, comments,
+  link-dense menus, and everything outside <main> (or the only <article>)
+  when the page marks its main content; the <title> is kept
+- "bs4": BeautifulSoup with the pure-Python html.parser, the original
+  extractor. Used when lxml is not installed
+
+Every backend returns the text with whitespace collapsed and the page's
+links resolved against base_url (collected before anything is removed,
+since navigation is where subpages are linked from).
+"""
+import os
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from dotenv import load_dotenv
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; the bs4 backend is used instead
+    etree = None
+
+load_dotenv()
+
+HTML_EXTRACTOR = os.getenv("HTML_EXTRACTOR", "lxml")
+HTML_MAIN_CONTENT = os.getenv("HTML_MAIN_CONTENT", "true").lower() == "true"
+
+# Never part of the visible text
+NON_CONTENT_TAGS = ("script", "style", "noscript", "template", "svg", "canvas", "iframe", "object", "meta", "link")
+# Page chrome removed by every backend
+CHROME_TAGS = ("header", "footer", "nav")
+# Removed as well when main-content detection is on
+BOILERPLATE_TAGS = ("aside", "form", "dialog", "button", "select")
+BOILERPLATE_ROLES = {"navigation", "banner", "contentinfo", "complementary", "dialog", "alertdialog", "search", "menu", "menubar"}
+# Whole class tokens / ids of widgets that are never the page's content. Words
+# like "social" or "related" are left out: portfolios use them for content
+# ("social-links", "related-projects")
+BOILERPLATE_NAMES = {"cookie", "cookies", "cookie-banner", "cookie-consent", "cookie-notice", "consent", "gdpr",
+                     "newsletter", "newsletter-signup", "subscribe", "share-buttons", "sharing-buttons",
+                     "sidebar", "breadcrumb", "breadcrumbs", "popup", "modal", "advert", "ads", "skip-link",
+                     "navbar", "nav", "menu", "mobile-menu", "topbar", "footer", "site-footer", "footer-links",
+                     "comments", "comment", "disqus", "disqus_thread"}
+# A list is a menu when most of its words are in short links
+LINK_DENSITY_LIMIT = 0.6
+MENU_LINK_WORDS = 4
+MENU_MIN_LINKS = 3
+# <main> (or a page's only <article>) is only trusted when it holds at least this much text
+MAIN_MIN_CHARS = 200
+
+_WHITESPACE = re.compile(r"\s+")
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+Extractor = Callable[[str, Optional[str], bool], Tuple[str, List[str]]]
+EXTRACTORS: Dict[str, Extractor] = {}
+
+
+def register_extractor(name: str, extractor: Extractor):
+    """
+    Register an extraction backend under a name usable in HTML_EXTRACTOR.
+
+    Args:
+        name (str): Backend name
+        extractor (Callable): Function (html, base_url, main_content) -> (text, links)
+    """
+    EXTRACTORS[name] = extractor
+
+
+def _bs4_extract(html: str, base_url: Optional[str], main_content: bool) -> Tuple[str, List[str]]:
+    soup = BeautifulSoup(html, 'html.parser')
+
+    links = []
+    if base_url:
+        links = [urljoin(base_url, anchor['href']) for anchor in soup.find_all('a', href=True)]
+
+    # Remove script, style, and other non-content elements
+    for element in soup(["script", "style", "meta", "noscript", *CHROME_TAGS]):
+        element.decompose()
+
+    # Get text content and clean it up
+    text_content = soup.get_text(separator=' ', strip=True)
+    return _WHITESPACE.sub(' ', text_content), links
+
+
+def _is_boilerplate(element) -> bool:
+    if element.get("role") in BOILERPLATE_ROLES:
+        return True
+    names = (element.get("class") or "").lower().split()
+    if element.get("id"):
+        names.append(element.get("id").lower())
+    return not BOILERPLATE_NAMES.isdisjoint(names)
+
+
+def _is_menu(element) -> bool:
+    anchors = element.xpath(".//a")
+    link_words = sum(len(anchor.xpath("string()").split()) for anchor in anchors)
+    text_words = len(element.xpath("string()").split())
+    return (text_words and link_words / text_words > LINK_DENSITY_LIMIT
+            and link_words / len(anchors) <= MENU_LINK_WORDS)
+
+
+def _drop(elements):
+    """
+    Remove elements with their subtree, keeping the text that follows them.
+    """
+    for element in elements:
+        parent = element.getparent()
+        if parent is None:
+            continue
+        if element.tail:
+            previous = element.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or "") + element.tail
+            else:
+                parent.text = (parent.text or "") + element.tail
+        parent.remove(element)
+
+
+def _lxml_extract(html: str, base_url: Optional[str], main_content: bool) -> Tuple[str, List[str]]:
+    # lxml refuses str input that declares its own encoding
+    html = _XML_DECLARATION.sub("", html, count=1)
+    if not html.strip():
+        return "", []
+    # Parsers are not shared: extraction runs in worker threads
+    parser = etree.HTMLParser(remove_comments=True, remove_pis=True)
+    try:
+        root = etree.fromstring(html, parser)
+    except (etree.ParserError, ValueError):
+        return "", []
+    if root is None:
+        return "", []
+
+    links = []
+    if base_url:
+        links = [urljoin(base_url, href.strip()) for href in root.xpath("//a/@href")]
+
+    etree.strip_elements(root, *NON_CONTENT_TAGS, etree.Comment, with_tail=False)
+    _drop(list(root.iter(*CHROME_TAGS)))
+
+    content = [root]
+    if main_content:
+        _drop(list(root.iter(*BOILERPLATE_TAGS)))
+        _drop([element for element in root.xpath("//*[@hidden or @aria-hidden='true']")])
+        _drop([element for element in root.xpath("//*[@role or @class or @id]") if _is_boilerplate(element)])
+        mains = root.xpath("//main|//*[@role='main']")
+        mains = [element for element in mains if not any(ancestor in mains for ancestor in element.iterancestors())]
+        articles = root.xpath("//article")
+        if not mains and len(articles) == 1:
+            mains = articles
+
+        # Only innermost lists are menu candidates: a list holding another
+        # list or the main content is a layout wrapper, not a menu
+        candidates = root.xpath(f"(//nav|//ul|//ol|//menu)[count(.//a) >= {MENU_MIN_LINKS}]")
+        outer = {ancestor for element in candidates + mains for ancestor in element.iterancestors()}
+        _drop([element for element in candidates if element not in outer and element not in mains and _is_menu(element)])
+        if sum(len(element.xpath("string()").strip()) for element in mains) >= MAIN_MIN_CHARS:
+            # The title usually names the person; keep it with the main content
+            content = root.xpath("//head/title") + mains
+
+    text = " ".join(" ".join(element.itertext()) for element in content)
+    return _WHITESPACE.sub(" ", text).strip(), links
+
+
+register_extractor("bs4", _bs4_extract)
+if etree is not None:
+    register_extractor("lxml", _lxml_extract)
+
+
+def extract_page(html: str, base_url: Optional[str] = None, backend: Optional[str] = None,
+                 main_content: bool = HTML_MAIN_CONTENT) -> Tuple[str, List[str]]:
+    """
+    Extract the visible text of an HTML page and its links.
+
+    Args:
+        html (str): Page HTML
+        base_url (str, optional): URL the page was served from, to resolve relative links
+        backend (str, optional): Registered backend name (defaults to HTML_EXTRACTOR)
+        main_content (bool): Drop boilerplate and keep the main content where the backend supports it
+
+    Returns:
+        Tuple[str, List[str]]: (text content, absolute link URLs in page order)
+    """
+    extractor = EXTRACTORS.get(backend or HTML_EXTRACTOR) or EXTRACTORS["bs4"]
+    return extractor(html, base_url, main_content)
@@ -0,0 +1,169 @@
+"""
+Portfolio Content Cache
+
+Portfolio and other links repeat across a user's requests, and most sites
+rarely change. Two kinds of disk-backed entries, one pickle each:
+- pages, keyed by normalized URL: the extracted text and links with the
+  ETag / Last-Modified validators
+  - within PORTFOLIO_CACHE_FRESH_SECONDS of the last validation the page is
+    served without a request (hit)
+  - after that a conditional GET is sent and a 304 answer reuses the stored
+    text (not_modified)
+  - otherwise the page is fetched, extracted and stored (miss)
+  - when the site is unreachable or failing, the stored page is served as
+    it is (stale); a 404 / 410 removes it
+- portfolio summaries, keyed by a hash of the merged page text: an
+  unchanged site is not summarized again (summary_hit / summary_miss)
+
+Entries not validated for PORTFOLIO_CACHE_TTL seconds are evicted when read
+and by the periodic sweep in pipeline/disk_store.py. The
+counts and rates are reported by the /health endpoint under portfolio_cache.
+"""
+import asyncio
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+
+from pipeline.disk_store import DiskStore
+from pipeline.result_store import content_hash
+
+load_dotenv()
+
+DEFAULT_CACHE_DIR = os.getenv("PORTFOLIO_CACHE_DIR", os.path.join(os.getenv("RESUME_CACHE_DIR", "./resume_cache"), "portfolio"))
+DEFAULT_TTL_SECONDS = int(os.getenv("PORTFOLIO_CACHE_TTL", str(7 * 24 * 3600)))
+DEFAULT_FRESH_SECONDS = int(os.getenv("PORTFOLIO_CACHE_FRESH_SECONDS", str(6 * 3600)))
+
+PAGES = "pages"
+SUMMARIES = "summaries"
+
+HIT = "hit"
+NOT_MODIFIED = "not_modified"
+MISS = "miss"
+STALE = "stale"
+SUMMARY_HIT = "summary_hit"
+SUMMARY_MISS = "summary_miss"
+
+# Pages that are gone rather than temporarily failing
+GONE_STATUS_CODES = {404, 410}
+
+
+class PortfolioCache(DiskStore):
+    """
+    Conditional-request cache for portfolio pages and their summaries.
+
+    Args:
+        cache_dir: Directory holding the entries
+        ttl_seconds: Lifetime of an entry since it was last validated
+        fresh_seconds: Age up to which a page is served without a request
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: int = DEFAULT_TTL_SECONDS, fresh_seconds: int = DEFAULT_FRESH_SECONDS):
+        super().__init__(cache_dir, ttl_seconds, kinds=(PAGES, SUMMARIES), label="portfolio cache entry")
+        self.fresh_seconds = fresh_seconds
+        self._counts = dict.fromkeys((HIT, NOT_MODIFIED, MISS, STALE, SUMMARY_HIT, SUMMARY_MISS), 0)
+        self._lock = threading.Lock()
+
+    def _record(self, outcome: str):
+        with self._lock:
+            self._counts[outcome] += 1
+
+    async def get_page(self, fetch, parse, url: str):
+        """
+        Fetch and extract a page through the cache.
+
+        Args:
+            fetch: Coroutine function (url, headers) -> (html, status code, final URL, validators),
+                   see protflow_other_link.fetch_html
+            parse: Function (html, base_url) -> (text, links), run in a worker thread
+            url: Normalized page URL
+
+        Returns:
+            tuple: (text or None, links, status code of the request, or None when none was sent)
+        """
+        # Versioned like the summaries, so pages extracted by an older extractor are not reused
+        key = content_hash(PAGES, url)
+        entry = await asyncio.to_thread(self.load, PAGES, key)
+        if entry and time.time() - entry['validated_at'] < self.fresh_seconds:
+            self._record(HIT)
+            return entry['text'], entry['links'], None
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers["If-None-Match"] = entry['etag']
+            if entry.get('last_modified'):
+                headers["If-Modified-Since"] = entry['last_modified']
+
+        html, status_code, final_url, validators = await fetch(url, headers)
+
+        if status_code == 304 and entry:
+            self._record(NOT_MODIFIED)
+            entry['validated_at'] = time.time()
+            await asyncio.to_thread(self.save, PAGES, key, entry)
+            return entry['text'], entry['links'], status_code
+
+        if html is None:
+            if entry and status_code not in GONE_STATUS_CODES:
+                self._record(STALE)
+                return entry['text'], entry['links'], status_code
+            if entry:
+                await asyncio.to_thread(self.delete, PAGES, key)
+            self._record(MISS)
+            return None, [], status_code
+
+        self._record(MISS)
+        # Parsing is CPU-bound; keep it off the event loop
+        text, links = await asyncio.to_thread(parse, html, final_url)
+        await asyncio.to_thread(self.save, PAGES, key, {
+            'validated_at': time.time(),
+            'etag': validators.get("ETag"),
+            'last_modified': validators.get("Last-Modified"),
+            'text': text,
+            'links': links,
+        })
+        return text, links, status_code
+
+    async def get_summary(self, analyze, text: str):
+        """
+        Summarize merged portfolio text, reusing the stored summary of identical text.
+
+        Args:
+            analyze: Coroutine function (text) -> (summary, tokens), e.g. analyze_portfolio_website
+            text: Merged page text
+
+        Returns:
+            tuple: (summary, tokens used; 0 for a stored summary)
+        """
+        if not text:
+            return await analyze(text)
+        key = content_hash(SUMMARIES, text)
+        entry = await asyncio.to_thread(self.load, SUMMARIES, key)
+        if entry:
+            self._record(SUMMARY_HIT)
+            return entry['summary'], 0
+
+        self._record(SUMMARY_MISS)
+        summary, tokens = await analyze(text)
+        if summary:
+            await asyncio.to_thread(self.save, SUMMARIES, key, {'validated_at': time.time(), 'summary': summary})
+        return summary, tokens
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Page hit, 304, miss and stale counts and summary hit / miss
+                  counts, each with its share of the lookups of its kind
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        page_total = sum(counts[outcome] for outcome in (HIT, NOT_MODIFIED, MISS, STALE))
+        summary_total = counts[SUMMARY_HIT] + counts[SUMMARY_MISS]
+        rates = {}
+        for outcome, count in counts.items():
+            total = summary_total if outcome in (SUMMARY_HIT, SUMMARY_MISS) else page_total
+            rates[f"{outcome}_rate"] = round(count / total, 3) if total else 0.0
+        return {**counts, **rates}
+
+
+portfolio_cache = PortfolioCache()
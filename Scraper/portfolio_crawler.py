@@ -0,0 +1,190 @@
+"""
+Portfolio Crawler
+
+Most developer portfolios keep projects, experience and the CV on subpages,
+so reading only the landing page misses them. crawl_portfolio follows links
+breadth-first within the site:
+- same origin only (www. and bare host count as one site), http(s) pages
+  only, no assets or documents
+- URLs are normalized (fragment, default port, tracking parameters and
+  trailing slash dropped, query sorted) so each page is fetched once
+- at most PORTFOLIO_MAX_PAGES pages up to PORTFOLIO_MAX_DEPTH links away,
+  with links that look like project / experience / about pages first
+- pages of a level are fetched concurrently, PORTFOLIO_HOST_CONCURRENCY
+  at a time per host
+- pages whose text is identical or nearly identical (SimHash) to one
+  already kept are dropped
+- the merged text is capped to PORTFOLIO_INPUT_TOKENS, shared fairly
+  between pages, and the crawl as a whole stops at PORTFOLIO_CRAWL_DEADLINE
+"""
+import asyncio
+import hashlib
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+
+# Add parent directory to path to import shared_client
+sys.path.append(str(Path(__file__).parent.parent))
+from shared_client import get_http_client
+from Scraper.protflow_other_link import fetch_page, logger, normalize_url
+from pipeline.token_budget import PORTFOLIO_INPUT_TOKENS, count_tokens, truncate_to_tokens
+
+load_dotenv()
+
+PORTFOLIO_MAX_PAGES = int(os.getenv("PORTFOLIO_MAX_PAGES", "6"))
+PORTFOLIO_MAX_DEPTH = int(os.getenv("PORTFOLIO_MAX_DEPTH", "2"))
+PORTFOLIO_HOST_CONCURRENCY = int(os.getenv("PORTFOLIO_HOST_CONCURRENCY", "3"))
+PORTFOLIO_CRAWL_DEADLINE = float(os.getenv("PORTFOLIO_CRAWL_DEADLINE", "30"))
+
+# Path words of subpages worth reading first
+PRIORITY_WORDS = ("project", "work", "portfolio", "case-stud", "experience", "about", "resume", "cv", "skill")
+# Pages whose SimHash differs in at most this many bits are near-duplicates
+NEAR_DUPLICATE_BITS = 3
+
+
+def site_key(url: str) -> str:
+    host = urlsplit(url).netloc
+    return host[4:] if host.startswith("www.") else host
+
+
+def _link_priority(url: str) -> int:
+    path = urlsplit(url).path.lower()
+    return 0 if any(word in path for word in PRIORITY_WORDS) else 1
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash over word 3-shingles; similar texts get hashes a few bits apart.
+    """
+    words = re.findall(r"\w+", text.lower())
+    shingles = [" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2))]
+    weights = [0] * 64
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+class _PageSet:
+    """
+    Pages kept so far, with exact and near-duplicate detection.
+    """
+    def __init__(self):
+        self.pages: List[Tuple[str, str]] = []
+        self._digests = set()
+        self._simhashes = []
+        self.duplicates = 0
+
+    def add(self, url: str, text: str) -> bool:
+        normalized = re.sub(r"\s+", " ", text).strip().lower()
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        fingerprint = simhash(normalized)
+        if digest in self._digests or any(bin(fingerprint ^ other).count("1") <= NEAR_DUPLICATE_BITS for other in self._simhashes):
+            self.duplicates += 1
+            return False
+        self._digests.add(digest)
+        self._simhashes.append(fingerprint)
+        self.pages.append((url, text))
+        return True
+
+
+def merge_pages(pages: List[Tuple[str, str]], max_tokens: int = PORTFOLIO_INPUT_TOKENS) -> str:
+    """
+    Join page texts under a heading per page, sharing the token budget fairly:
+    pages shorter than their share leave the rest to the longer ones.
+    """
+    if len(pages) == 1:
+        return truncate_to_tokens(pages[0][1], max_tokens)
+    sizes = {index: count_tokens(text) for index, (_, text) in enumerate(pages)}
+    allowance = {}
+    remaining = max_tokens
+    for position, index in enumerate(sorted(sizes, key=sizes.get)):
+        share = remaining // (len(pages) - position)
+        allowance[index] = min(sizes[index], share)
+        remaining -= allowance[index]
+    sections = []
+    for index, (url, text) in enumerate(pages):
+        if allowance[index] <= 0:
+            continue
+        path = urlsplit(url).path or "/"
+        sections.append(f"## Page {path}\n{truncate_to_tokens(text, allowance[index])}")
+    return "\n\n".join(sections)
+
+
+async def crawl_portfolio(start_url: str, client=None, max_pages: int = PORTFOLIO_MAX_PAGES, max_depth: int = PORTFOLIO_MAX_DEPTH,
+                          max_tokens: int = PORTFOLIO_INPUT_TOKENS, deadline: float = PORTFOLIO_CRAWL_DEADLINE) -> Tuple[Optional[str], Dict]:
+    """
+    Crawl a portfolio site breadth-first and merge the text of its pages.
+
+    Args:
+        start_url (str): Portfolio URL
+        client (httpx.AsyncClient, optional): Client to use instead of the shared one
+        max_pages (int): Most pages fetched (1 reads only start_url)
+        max_depth (int): Most links followed from start_url
+        max_tokens (int): Token budget of the merged text
+        deadline (float): Seconds for the whole crawl; pages fetched by then are used
+
+    Returns:
+        Tuple[Optional[str], Dict]: (merged text or None when no page could be read,
+                                     crawl statistics)
+    """
+    client = client or await get_http_client()
+    start = normalize_url(start_url)
+    stats = {"fetched": 0, "failed": 0, "duplicates": 0, "pages": 0}
+    if not start:
+        logger.error(f"Not a web page URL: {start_url}")
+        return None, stats
+
+    site = site_key(start)
+    page_set = _PageSet()
+    seen = {start}
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def fetch(url):
+        semaphore = host_limits.setdefault(urlsplit(url).netloc, asyncio.Semaphore(PORTFOLIO_HOST_CONCURRENCY))
+        async with semaphore:
+            text, links, _ = await fetch_page(url, client)
+        if text is None:
+            stats["failed"] += 1
+            return None
+        stats["fetched"] += 1
+        return text, links
+
+    async def crawl():
+        frontier = [start]
+        for depth in range(max_depth + 1):
+            frontier = frontier[:max_pages - stats["fetched"] - stats["failed"]]
+            if not frontier:
+                return
+            results = await asyncio.gather(*(fetch(url) for url in frontier))
+            next_frontier = []
+            for url, result in zip(frontier, results):
+                if result is None:
+                    continue
+                text, links = result
+                if text:
+                    page_set.add(url, text)
+                if depth == max_depth:
+                    continue
+                for link in links:
+                    link = normalize_url(link)
+                    if link and link not in seen and site_key(link) == site:
+                        seen.add(link)
+                        next_frontier.append(link)
+            frontier = sorted(next_frontier, key=_link_priority)
+
+    try:
+        await asyncio.wait_for(crawl(), deadline)
+    except asyncio.TimeoutError:
+        logger.warning(f"Crawl of {start_url} stopped at the {deadline}s deadline with {len(page_set.pages)} pages")
+
+    stats.update(duplicates=page_set.duplicates, pages=len(page_set.pages))
+    if not page_set.pages:
+        return None, stats
+    return merge_pages(page_set.pages, max_tokens), stats
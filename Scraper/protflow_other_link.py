@@ -1,68 +1,249 @@
+import asyncio
+import os
 import re
-import requests
-from bs4 import BeautifulSoup
-import time
-from typing import Optional, Tuple
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import logging
 
+import httpx
+from dotenv import load_dotenv
+
+# Add parent directory to path to import shared_client
+sys.path.append(str(Path(__file__).parent.parent))
+from shared_client import get_http_client
+from Scraper.html_extract import extract_page
+from Scraper.portfolio_cache import portfolio_cache
+
+load_dotenv()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def get_portfolio_content(portfolio_link: str, max_retries: int = 3, timeout: int = 10) -> Tuple[Optional[str], Optional[int]]:
+# Per-request connect/read timeouts and the deadline for all attempts of one fetch
+PORTFOLIO_CONNECT_TIMEOUT = float(os.getenv("PORTFOLIO_CONNECT_TIMEOUT", "5"))
+PORTFOLIO_READ_TIMEOUT = float(os.getenv("PORTFOLIO_READ_TIMEOUT", "10"))
+PORTFOLIO_FETCH_DEADLINE = float(os.getenv("PORTFOLIO_FETCH_DEADLINE", "20"))
+# Pages larger than this are cut off, and redirect chains longer than this are abandoned
+PORTFOLIO_MAX_BYTES = int(os.getenv("PORTFOLIO_MAX_BYTES", str(2 * 1024 * 1024)))
+PORTFOLIO_MAX_REDIRECTS = int(os.getenv("PORTFOLIO_MAX_REDIRECTS", "5"))
+
+# Retried status codes; other errors (404, 403, ...) will not change on retry
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+BACKOFF_SECONDS = 0.5
+TEXT_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|ref|source)$", re.IGNORECASE)
+SKIPPED_EXTENSIONS = (
+    ".pdf", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".zip", ".gz",
+    ".mp4", ".mp3", ".mov", ".css", ".js", ".json", ".xml", ".rss", ".woff", ".woff2", ".ttf",
+)
+
+# Set headers to mimic a browser request
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """
+    Canonical form of a page URL (fragment, default port, tracking parameters and
+    trailing slash dropped, query sorted), or None for anything that is not an
+    http(s) page.
     """
-    Fetches and processes content from a given portfolio URL.
-    
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if path.lower().endswith(SKIPPED_EXTENSIONS):
+        return None
+    if len(path) > 1:
+        path = path.rstrip("/")
+    netloc = parts.hostname.lower()
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                             if not TRACKING_PARAMS.match(key)))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+class PortfolioFetchError(Exception):
+    """
+    A response that retrying cannot fix (too many redirects, not a web page).
+    """
+
+
+def parse_page(html: str, base_url: Optional[str] = None) -> Tuple[str, List[str]]:
+    """
+    Extract the visible text of an HTML page and its links with the
+    configured extractor (see Scraper.html_extract).
+
     Args:
-        portfolio_link (str): URL of the portfolio website
-        max_retries (int): Maximum number of retry attempts
-        timeout (int): Request timeout in seconds
-        
+        html (str): Page HTML
+        base_url (str, optional): URL the page was served from, to resolve relative links
+
     Returns:
-        Tuple[Optional[str], Optional[int]]: (processed text content, status code)
+        Tuple[str, List[str]]: (text content, absolute link URLs in page order)
+    """
+    return extract_page(html, base_url)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Extract the visible text of an HTML page.
+    """
+    return parse_page(html)[0]
+
+
+async def _read_limited(response, max_bytes: int) -> bytes:
     """
-    # Set headers to mimic a browser request
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
-    
+    Read a streamed response body, stopping at max_bytes.
+    """
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body.extend(chunk)
+        if len(body) >= max_bytes:
+            logger.warning(f"Page larger than {max_bytes} bytes, keeping the first {max_bytes}")
+            return bytes(body[:max_bytes])
+    return bytes(body)
+
+
+async def _fetch_once(client, url: str, timeout: httpx.Timeout, headers: Dict[str, str]) -> Tuple[Optional[str], int, str, Dict[str, str]]:
+    """
+    GET a page following at most PORTFOLIO_MAX_REDIRECTS redirects.
+
+    Returns:
+        Tuple[Optional[str], int, str, Dict[str, str]]: (decoded page for a 200 response, status code,
+                                                         final URL, ETag / Last-Modified validators)
+    """
+    for _ in range(PORTFOLIO_MAX_REDIRECTS + 1):
+        async with client.stream("GET", url, headers={**HEADERS, **headers}, timeout=timeout, follow_redirects=False) as response:
+            # 304 counts as a redirect status in httpx but has no Location
+            if response.is_redirect and "Location" in response.headers:
+                url = str(response.url.join(response.headers["Location"]))
+                continue
+            if response.status_code != 200:
+                return None, response.status_code, url, {}
+
+            content_type = response.headers.get("Content-Type", "text/html").split(";")[0].strip().lower()
+            if content_type not in TEXT_CONTENT_TYPES:
+                raise PortfolioFetchError(f"{url} is not a web page ({content_type})")
+            body = await _read_limited(response, PORTFOLIO_MAX_BYTES)
+            validators = {name: response.headers[name] for name in VALIDATOR_HEADERS if name in response.headers}
+            return body.decode(response.encoding or "utf-8", errors="replace"), response.status_code, url, validators
+    raise PortfolioFetchError(f"More than {PORTFOLIO_MAX_REDIRECTS} redirects for {url}")
+
+
+async def _fetch_with_retries(client, url: str, max_retries: int, timeout: httpx.Timeout,
+                             headers: Dict[str, str]) -> Tuple[Optional[str], Optional[int], str, Dict[str, str]]:
+    status_code = None
     for attempt in range(max_retries):
         try:
-            # Send GET request to the URL
-            response = requests.get(portfolio_link, headers=headers, timeout=timeout)
-            
-            # Check if request was successful
-            if response.status_code == 200:
-                # Parse HTML and extract text content
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Remove script, style, and other non-content elements
-                for element in soup(["script", "style", "meta", "noscript", "header", "footer", "nav"]):
-                    element.decompose()
-                
-                # Get text content and clean it up
-                text_content = soup.get_text(separator=' ', strip=True)
-                
-                # Remove excessive whitespace
-                text_content = re.sub(r'\s+', ' ', text_content)
-                
-                return text_content, response.status_code
-            else:
-                logger.warning(f"Attempt {attempt + 1}: Received status code {response.status_code}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                continue
-                
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Attempt {attempt + 1}: Request failed: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-            continue
-    
-    logger.error(f"Failed to fetch content after {max_retries} attempts")
-    return None, None
\ No newline at end of file
+            html, status_code, final_url, validators = await _fetch_once(client, url, timeout, headers)
+            if html is not None or status_code == 304:
+                return html, status_code, final_url, validators
+            logger.warning(f"Attempt {attempt + 1}: Received status code {status_code}")
+            if status_code not in RETRY_STATUS_CODES:
+                break
+        except httpx.HTTPError as e:
+            logger.warning(f"Attempt {attempt + 1}: Request failed: {e!r}")
+        if attempt < max_retries - 1:
+            await asyncio.sleep(BACKOFF_SECONDS * 2 ** attempt)  # Exponential backoff without blocking the worker
+    return None, status_code, url, {}
+
+
+async def fetch_html(url: str, client=None, max_retries: int = 3, deadline: float = PORTFOLIO_FETCH_DEADLINE,
+                     headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[str], Optional[int], str, Dict[str, str]]:
+    """
+    Fetch the HTML of a page on the shared HTTP pool.
+
+    Args:
+        url (str): Page URL
+        client (httpx.AsyncClient, optional): Client to use instead of the shared one
+        max_retries (int): Maximum number of attempts for connection errors and 429/5xx responses
+        deadline (float): Seconds allowed for all attempts together
+        headers (Dict[str, str], optional): Extra request headers, e.g. If-None-Match
+
+    Returns:
+        Tuple[Optional[str], Optional[int], str, Dict[str, str]]: (HTML or None, status code,
+            URL after redirects, ETag / Last-Modified validators of the response)
+    """
+    client = client or await get_http_client()
+    timeout = httpx.Timeout(PORTFOLIO_READ_TIMEOUT, connect=PORTFOLIO_CONNECT_TIMEOUT)
+    try:
+        html, status_code, final_url, validators = await asyncio.wait_for(
+            _fetch_with_retries(client, url, max_retries, timeout, headers or {}), deadline)
+    except asyncio.TimeoutError:
+        logger.error(f"Fetching {url} exceeded {deadline}s")
+        return None, None, url, {}
+    except (PortfolioFetchError, httpx.InvalidURL) as e:
+        logger.error(f"Failed to fetch content: {e}")
+        return None, None, url, {}
+
+    if html is None and status_code != 304:
+        logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+    return html, status_code, final_url, validators
+
+
+async def fetch_page(url: str, client=None, max_retries: int = 3, deadline: float = PORTFOLIO_FETCH_DEADLINE) -> Tuple[Optional[str], List[str], Optional[int]]:
+    """
+    Fetch a page through the portfolio cache and extract its text and links.
+    Fresh cached pages are served without a request; older ones are
+    revalidated with a conditional GET.
+
+    Args:
+        url (str): Page URL
+        client (httpx.AsyncClient, optional): Client to use instead of the shared one
+        max_retries (int): Maximum number of attempts for connection errors and 429/5xx responses
+        deadline (float): Seconds allowed for all attempts together
+
+    Returns:
+        Tuple[Optional[str], List[str], Optional[int]]: (text content or None, absolute link URLs, status code)
+    """
+    client = client or await get_http_client()
+
+    async def fetch(page_url, headers):
+        return await fetch_html(page_url, client, max_retries, deadline, headers)
+
+    return await portfolio_cache.get_page(fetch, parse_page, normalize_url(url) or url)
+
+
+async def fetch_portfolio_content(portfolio_link: str, client=None, max_retries: int = 3, deadline: float = PORTFOLIO_FETCH_DEADLINE) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Fetches and processes content from a given portfolio URL on the shared HTTP pool.
+
+    Args:
+        portfolio_link (str): URL of the portfolio website
+        client (httpx.AsyncClient, optional): Client to use instead of the shared one
+        max_retries (int): Maximum number of attempts for connection errors and 429/5xx responses
+        deadline (float): Seconds allowed for all attempts together
+
+    Returns:
+        Tuple[Optional[str], Optional[int]]: (processed text content, status code)
+    """
+    text, _, status_code = await fetch_page(portfolio_link, client, max_retries, deadline)
+    return text, status_code
+
+
+def get_portfolio_content(portfolio_link: str, max_retries: int = 3, timeout: int = 10) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Blocking wrapper around fetch_portfolio_content for scripts and threads
+    without a running event loop.
+    """
+    async def fetch():
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            return await fetch_portfolio_content(portfolio_link, client, max_retries)
+    return asyncio.run(fetch())
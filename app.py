@@ -1,15 +1,27 @@
 from typing import List, Dict, Optional
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, field_validator, Field, HttpUrl
 from typing import Optional, List
 import uvicorn
 from datetime import datetime
 import os
+import asyncio
 import aiofiles
+from contextlib import asynccontextmanager
 from pathlib import Path
-from processing import resume_data, process_all_agents
-from ats_processing import resume_data as ats_resume_data, process_all_agents as ats_process_all_agents,collect_jd_data
+from processing import resume_data, process_all_agents, run_analysis
+from ats_processing import resume_data as ats_resume_data, process_all_agents as ats_process_all_agents, run_analysis as ats_run_analysis,collect_jd_data
+from pipeline.disk_store import evict_periodically
+from pipeline.result_store import ResumeStore, resume_fingerprint
+from Scraper.github_cache import github_cache
+from Scraper.portfolio_cache import portfolio_cache
+from Scraper.github_tokens import github_tokens
+from pipeline.deadline import Deadline
+from pipeline.disconnect import DisconnectWatcher, ClientDisconnected
+from pipeline.metrics import metrics
+from pipeline.scheduler import RequestFlowMiddleware, llm_scheduler
+from pipeline.agent_profiles import agent_usage
 
 from processing_txt import resume_data as resume_data_text, process_all_agents as process_all_agents_text
 
@@ -24,11 +36,20 @@ from chat_section.Experience_agent import improve_experience_description
 from chat_section.vectordata import FAISSVectorDB
 from question_process import collect_resume_andlinkdin_data , generate_questions , collect_resume_andlinkdin_data_text
 
+@asynccontextmanager
+async def lifespan(app):
+    """Remove expired stored resume data and cached GitHub / portfolio responses at startup and then periodically"""
+    eviction_task = asyncio.create_task(evict_periodically([ResumeStore(), github_cache, portfolio_cache]))
+    yield
+    eviction_task.cancel()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Resume Maker API",
     description="A FastAPI application for resume generation with cross validation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for cross-origin requests
@@ -40,6 +61,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Attributes each request's LLM calls to its own flow in the fair scheduler
+app.add_middleware(RequestFlowMiddleware)
+
 # Pydantic models for request validation
 class ResumeImprovementData(BaseModel):
     github_profile: Optional[HttpUrl] = Field(None, description="GitHub profile URL")
@@ -66,6 +90,17 @@ UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
 
+def delete_uploaded_files(*paths):
+    """Delete uploaded files once a request is done, whether it succeeded, failed or was abandoned"""
+    for path in paths:
+        try:
+            if path and path.exists():
+                path.unlink()
+                print(f"Successfully deleted uploaded file: {path}")
+        except Exception as delete_error:
+            print(f"Warning: Could not delete file {path}: {delete_error}")
+
+
 @app.get("/")
 async def root():
     """Root endpoint with basic API information"""
@@ -76,7 +111,8 @@ async def root():
         "endpoints": {
             "health": "/health",
             "improvement_resume": "/improvement-resume",
-            "ats_resume": "/ATS-resume"
+            "ats_resume": "/ATS-resume",
+            "improvement_ats_resume": "/improvement-ATS-resume"
         }
     }
 @app.get("/health")
@@ -85,7 +121,13 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "service": "Resume Maker API"
+        "service": "Resume Maker API",
+        "pipeline_metrics": metrics.snapshot(),
+        "llm_scheduler": llm_scheduler.snapshot(),
+        "agent_usage": agent_usage.snapshot(),
+        "github_cache": github_cache.snapshot(),
+        "github_tokens": github_tokens.snapshot(),
+        "portfolio_cache": portfolio_cache.snapshot()
     }
 
 
@@ -119,6 +161,7 @@ class ATSRequestBody(BaseModel):
 
 @app.post("/improvement-resume")
 async def improve_resume(
+    request: Request,
     user_id: str = Form(..., description="User ID"),
     resume_file: UploadFile = File(..., description="Resume file (PDF, DOC, DOCX)"),
     github_profile: Optional[str] = Form(None, description="GitHub profile URL"),
@@ -127,6 +170,7 @@ async def improve_resume(
     other_link: Optional[str] = Form(None, description="Any other relevant link")
 ):
     """Improve resume using provided links and uploaded resume file"""
+    file_path = linkedin_file_path = None
     try:
         # Validate file type
         allowed_extensions = {'.pdf', '.doc', '.docx', '.txt'}
@@ -179,16 +223,19 @@ async def improve_resume(
                 linkedin_content = await linkedin_profile_file.read()
                 await f.write(linkedin_content)
 
-        # Process resume data from all sources
-        Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens = await resume_data(
-            file_path, linkedin_file_path, github_profile, other_link, portfolio_link
-        )
-        # Process all agents and get comprehensive analysis
-        analysis_results = await process_all_agents(
-            Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens
-        )
+        # Slow sources and sections are cancelled once the request deadline runs out
+        deadline = Deadline()
+        watcher = DisconnectWatcher(request)
+
+        # Process resume data from all sources and run all agents; the agents
+        # start on the resume alone while external sources are still loading
+        analysis_results = await watcher.run(run_analysis(
+            file_path, linkedin_file_path, github_profile, other_link, portfolio_link, deadline=deadline
+        ))
 
         # Generate questions based on user_id
+        # Question generation writes to FAISS and cannot be cancelled once started
+        await watcher.checkpoint()
         print(f"🎯 Starting question generation process for user_id: {user_id}")
         store_data = collect_resume_andlinkdin_data(user_id, file_path, linkedin_file_path)
         all_questions = generate_questions(user_id)
@@ -206,22 +253,6 @@ async def improve_resume(
                 ]
             }
 
-        # Clean up: delete the uploaded files after processing
-        try:
-            if file_path.exists():
-                file_path.unlink()
-                print(f"Successfully deleted uploaded resume file: {file_path}")
-        except Exception as delete_error:
-            print(f"Warning: Could not delete resume file {file_path}: {delete_error}")
-            
-        try:
-            if linkedin_file_path and linkedin_file_path.exists():
-                linkedin_file_path.unlink()
-                print(f"Successfully deleted uploaded LinkedIn file: {linkedin_file_path}")
-        except Exception as delete_error:
-            print(f"Warning: Could not delete LinkedIn file {linkedin_file_path}: {delete_error}")
-            # Continue execution even if file deletion fails
-
         return {
             "status_code": 200,
             "status": "success",
@@ -230,26 +261,35 @@ async def improve_resume(
             **analysis_results
         }
         
+    except ClientDisconnected:
+        # Nobody is waiting for the response any more
+        raise HTTPException(status_code=499, detail="Client disconnected")
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+    finally:
+        delete_uploaded_files(file_path, linkedin_file_path)
     
 
 @app.post("/improvement-resume-text")
 async def improve_resume(
+    request: Request,
     resume_txt : str = Form(description = "txt-data")
 ):
     """Improve resume using provided links and uploaded resume file"""
     try:
+        deadline = Deadline()
+        watcher = DisconnectWatcher(request)
+
         # Process resume data from all sources
-        Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens = await resume_data_text(
-            resume_txt
-        )
+        Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens = await watcher.run(resume_data_text(
+            resume_txt, deadline=deadline
+        ))
         # Process all agents and get comprehensive analysis
-        analysis_results = await process_all_agents(
-            Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens
-        )
+        analysis_results = await watcher.run(process_all_agents(
+            Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens, deadline=deadline
+        ))
         # store_data = collect_resume_andlinkdin_data_text(user_id, resume_txt)
         # all_questions = generate_questions(user_id)
 
@@ -274,6 +314,9 @@ async def improve_resume(
             **analysis_results
         }
         
+    except ClientDisconnected:
+        # Nobody is waiting for the response any more
+        raise HTTPException(status_code=499, detail="Client disconnected")
     except HTTPException:
         raise
     except Exception as e:
@@ -282,27 +325,39 @@ async def improve_resume(
 
 @app.post("/ATS-resume-text")
 async def ATS_resume(
+    request: Request,
     resume_file: str = Form(..., description="Resume text"),
     job_description: str = Form(..., description="Job description")
 ):
     """ATS resume using provided links and uploaded resume file"""
     try:
-        # Process job description to extract structured JD data
+        # Process job description concurrently - it does not depend on the resume
+        deadline = Deadline()
+        watcher = DisconnectWatcher(request)
         print("🔍 Processing job description...")
-        jd_data = await collect_jd_data_text(job_description)
+        jd_task = asyncio.create_task(collect_jd_data_text(job_description, deadline=deadline))
         # jd_tokens = jd_data.get('tokens', 0)
         
         # Process resume data from all sources using ATS processing
         print("📄 Processing resume and external sources...")
-        Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens = await ats_resume_data_text(
-            resume_file
-        )
+        # Repeat runs with a new JD reuse the stored resume data for this fingerprint
+        fingerprint = resume_fingerprint(resume_file)
+        try:
+            Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens = await watcher.run(ats_resume_data_text(
+                resume_file, fingerprint=fingerprint, deadline=deadline
+            ))
+        except BaseException:
+            jd_task.cancel()
+            raise
+
+        # Join the JD analysis only once the resume data is ready
+        jd_data = await watcher.run(jd_task)
         
         # Process all ATS agents with JD data for optimization
         print("🤖 Running ATS-optimized agent analysis...")
-        analysis_results = await ats_process_all_agents_text(
-            Basic_Information, jd_data, resume_tokens, github_tokens, protflow_tokens, other_link_tokens
-        )
+        analysis_results = await watcher.run(ats_process_all_agents_text(
+            Basic_Information, jd_data, resume_tokens, github_tokens, protflow_tokens, other_link_tokens, deadline=deadline
+        ))
         # store_data = collect_resume_andlinkdin_data_text(user_id, resume_file)
         # all_questions = generate_questions(user_id)
 
@@ -327,6 +382,9 @@ async def ATS_resume(
             **analysis_results
         }
         
+    except ClientDisconnected:
+        # Nobody is waiting for the response any more
+        raise HTTPException(status_code=499, detail="Client disconnected")
     except HTTPException:
         raise
     except Exception as e:
@@ -335,6 +393,7 @@ async def ATS_resume(
 
 @app.post("/ATS-resume")
 async def ATS_resume(
+    request: Request,
     user_id: str = Form(..., description="User ID"),
     resume_file: UploadFile = File(..., description="Resume file (PDF, DOC, DOCX)"),
     github_profile: Optional[str] = Form(None, description="GitHub profile URL"),
@@ -344,6 +403,7 @@ async def ATS_resume(
     job_description: str = Form(..., description="Job description")
 ):
     """ATS resume using provided links and uploaded resume file"""
+    file_path = linkedin_file_path = None
     try:
         # Validate file type
         allowed_extensions = {'.pdf', '.doc', '.docx', '.txt'}
@@ -407,24 +467,33 @@ async def ATS_resume(
 
         
 
-        # Process job description to extract structured JD data
+        # Process job description concurrently - it does not depend on the resume
+        deadline = Deadline()
+        watcher = DisconnectWatcher(request)
         print("🔍 Processing job description...")
-        jd_data = await collect_jd_data(job_description)
+        jd_task = asyncio.create_task(collect_jd_data(job_description, deadline=deadline))
         # jd_tokens = jd_data.get('tokens', 0)
         
         # Process resume data from all sources using ATS processing
         print("📄 Processing resume and external sources...")
-        Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens = await ats_resume_data(
-            file_path, linkedin_file_path, github_profile, other_link, portfolio_link
-        )
-        
-        # Process all ATS agents with JD data for optimization
-        print("🤖 Running ATS-optimized agent analysis...")
-        analysis_results = await ats_process_all_agents(
-            Basic_Information, jd_data, resume_tokens, github_tokens, protflow_tokens, other_link_tokens
+        # Repeat runs with a new JD reuse the stored resume data for this fingerprint
+        fingerprint = resume_fingerprint(
+            content, linkedin_content if linkedin_file_path else None, github_profile, portfolio_link, other_link
         )
+        # The ATS agents start once the resume and the JD are ready, while
+        # external sources may still be loading
+        try:
+            analysis_results = await watcher.run(ats_run_analysis(
+                file_path, linkedin_file_path, github_profile, other_link, portfolio_link,
+                jd_task=jd_task, fingerprint=fingerprint, deadline=deadline
+            ))
+        except BaseException:
+            jd_task.cancel()
+            raise
 
         # Generate questions based on user_id
+        # Question generation writes to FAISS and cannot be cancelled once started
+        await watcher.checkpoint()
         print(f"🎯 Starting question generation process for user_id: {user_id}")
         store_data = collect_resume_andlinkdin_data(user_id, file_path, linkedin_file_path)
         all_questions = generate_questions(user_id)
@@ -443,23 +512,6 @@ async def ATS_resume(
             }
         print(all_questions)
 
-        # Clean up: delete the uploaded file after processing
-        try:
-            if file_path.exists():
-                file_path.unlink()
-                print(f"Successfully deleted uploaded file: {file_path}")
-        except Exception as delete_error:
-            print(f"Warning: Could not delete file {file_path}: {delete_error}")
-            # Continue execution even if file deletion fails
-        
-        try:
-            if linkedin_file_path and linkedin_file_path.exists():
-                linkedin_file_path.unlink()
-                print(f"Successfully deleted uploaded LinkedIn file: {linkedin_file_path}")
-        except Exception as delete_error:
-            print(f"Warning: Could not delete LinkedIn file {linkedin_file_path}: {delete_error}")
-            # Continue execution even if file deletion fails
-
         return {
             "status_code": 200,
             "status": "success",
@@ -468,12 +520,150 @@ async def ATS_resume(
             **analysis_results
         }
         
+    except ClientDisconnected:
+        # Nobody is waiting for the response any more
+        raise HTTPException(status_code=499, detail="Client disconnected")
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+    finally:
+        delete_uploaded_files(file_path, linkedin_file_path)
     
 
+@app.post("/improvement-ATS-resume")
+async def improvement_and_ATS_resume(
+    request: Request,
+    user_id: str = Form(..., description="User ID"),
+    resume_file: UploadFile = File(..., description="Resume file (PDF, DOC, DOCX)"),
+    github_profile: Optional[str] = Form(None, description="GitHub profile URL"),
+    linkedin_profile_file: Optional[UploadFile] = File(None, description="LinkedIn profile file (PDF, DOC, DOCX)"),
+    portfolio_link: Optional[str] = Form(None, description="Portfolio website URL"),
+    other_link: Optional[str] = Form(None, description="Any other relevant link"),
+    job_description: str = Form(..., description="Job description")
+):
+    """Improvement and ATS resume analysis from a single extraction of the uploaded resume and links"""
+    file_path = linkedin_file_path = None
+    try:
+        # Validate file type
+        allowed_extensions = {'.pdf', '.doc', '.docx', '.txt'}
+        file_extension = Path(resume_file.filename).suffix.lower()
+        if file_extension not in allowed_extensions:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"File type {file_extension} not supported. Allowed types: {', '.join(allowed_extensions)}"
+            )
+
+        # Validate LinkedIn file only if provided
+        if linkedin_profile_file and linkedin_profile_file.filename:
+            linkedin_file_extension = Path(linkedin_profile_file.filename).suffix.lower()
+            if linkedin_file_extension not in allowed_extensions:
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"LinkedIn file type {linkedin_file_extension} not supported. Allowed types: {', '.join(allowed_extensions)}"
+                )
+
+        # Validate job description
+        if not job_description:
+            raise HTTPException(status_code=400, detail="Job description is required")
+
+        if github_profile and 'github.com' not in github_profile:
+            raise HTTPException(status_code=400, detail="Invalid GitHub URL")
+
+        # Save uploaded resume file
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_filename = f"{timestamp}_{resume_file.filename}"
+        file_path = UPLOAD_DIR / safe_filename
+
+        async with aiofiles.open(file_path, 'wb') as f:
+            content = await resume_file.read()
+            await f.write(content)
+
+        # Save LinkedIn profile file if provided
+        linkedin_file_path = None
+        if linkedin_profile_file and linkedin_profile_file.filename:
+            linkedin_safe_filename = f"{timestamp}_linkedin_{linkedin_profile_file.filename}"
+            linkedin_file_path = UPLOAD_DIR / linkedin_safe_filename
+
+            async with aiofiles.open(linkedin_file_path, 'wb') as f:
+                linkedin_content = await linkedin_profile_file.read()
+                await f.write(linkedin_content)
+
+        # Process job description concurrently - it does not depend on the resume
+        deadline = Deadline()
+        watcher = DisconnectWatcher(request)
+        print("🔍 Processing job description...")
+        jd_task = asyncio.create_task(collect_jd_data(job_description, deadline=deadline))
+
+        # Extract resume and external sources once for both outputs; the result is
+        # stored so later /ATS-resume calls for the same upload can reuse it
+        print("📄 Processing resume and external sources...")
+        fingerprint = resume_fingerprint(
+            content, linkedin_content if linkedin_file_path else None, github_profile, portfolio_link, other_link
+        )
+        try:
+            Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens = await watcher.run(ats_resume_data(
+                file_path, linkedin_file_path, github_profile, other_link, portfolio_link, fingerprint=fingerprint, deadline=deadline
+            ))
+        except BaseException:
+            jd_task.cancel()
+            raise
+        jd_data = await watcher.run(jd_task)
+
+        # Run the general and the JD-tailored section agents concurrently
+        print("🤖 Running standard and ATS-optimized agent analysis...")
+        improvement_results, ats_results = await watcher.run(asyncio.gather(
+            process_all_agents(
+                Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens, deadline=deadline
+            ),
+            ats_process_all_agents(
+                Basic_Information, jd_data, resume_tokens, github_tokens, protflow_tokens, other_link_tokens, deadline=deadline
+            )
+        ))
+
+        # Generate questions based on user_id
+        # Question generation writes to FAISS and cannot be cancelled once started
+        await watcher.checkpoint()
+        print(f"🎯 Starting question generation process for user_id: {user_id}")
+        store_data = collect_resume_andlinkdin_data(user_id, file_path, linkedin_file_path)
+        all_questions = generate_questions(user_id)
+
+        # Ensure we always return some questions, even if generation fails
+        if not all_questions:
+            print("⚠️ No questions generated, providing default questions")
+            all_questions = {
+                "Based on your Company": [
+                    "What were your key responsibilities and achievements in this role?",
+                    "Can you quantify the impact you made on the business or team?",
+                    "What specific skills or technologies did you utilize or learn?",
+                    "What challenges did you overcome and how did you solve them?",
+                    "What projects were you most proud of and why?"
+                ]
+            }
+
+        return {
+            "status_code": 200,
+            "status": "success",
+            "message": "Improvement and ATS-optimized resume analysis completed successfully",
+            "generated_questions": all_questions,
+            "improvement": improvement_results,
+            "ats": ats_results,
+            # Sources and JD were extracted once for both sides; each side's section totals repeat them
+            "total_tokens_consumed": (resume_tokens + github_tokens + protflow_tokens + other_link_tokens + jd_data.get('tokens', 0)
+                                      + improvement_results["agent_tokens_consumed"] + ats_results["agent_tokens_consumed"])
+        }
+
+    except ClientDisconnected:
+        # Nobody is waiting for the response any more
+        raise HTTPException(status_code=499, detail="Client disconnected")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+    finally:
+        delete_uploaded_files(file_path, linkedin_file_path)
+
+
 @app.post("/ATS-score")
 async def ATS_score(
    resume_text: str = Form(..., description="structured resume data"),
@@ -0,0 +1,200 @@
+"""
+GitHub Collector Benchmark
+
+Serves a simulated GitHub API through httpx.MockTransport, with a fixed
+latency per request, for a user with several hundred repositories. Compares:
+- sequential: user, repos (first page only) and events one after another,
+  as the original requests-based scraper did
+- concurrent: fetch_github_profile_info, which requests the three endpoints
+  at once and follows every repository page with bounded concurrency
+- the same collector against a warm response cache, once within the
+  freshness window (no requests) and once revalidating with ETags (304s,
+  which do not count against the GitHub rate limit)
+- a rate-limit scenario with a small hourly budget, where the token pool
+  serves the stored profile marked stale and refuses requests that would be
+  answered 403 instead of returning None
+
+Usage:
+    python -m benchmarks.bench_github [--repos 350] [--latency 0.1]
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import tempfile
+import time
+
+import httpx
+
+from Scraper import github_scraper
+from Scraper.github_cache import GitHubCache
+from Scraper.github_tokens import GitHubRateLimited, GitHubTokenPool
+from Scraper.github_scraper import GITHUB_API_URL, build_profile_info, fetch_github_profile_info
+from pipeline.github_digest import build_github_digest
+from pipeline.prompt_format import compact
+from pipeline.token_budget import count_tokens
+
+USERNAME = "janedoe"
+PROFILE_URL = f"https://github.com/{USERNAME}"
+
+
+def make_repos(count):
+    return [
+        {
+            "name": f"repo-{i}",
+            "full_name": f"{USERNAME}/repo-{i}",
+            "description": f"Sample repository {i}",
+            "language": ("Python", "TypeScript", "Go", "Rust")[i % 4],
+            "fork": i % 7 == 0,
+            "stargazers_count": i % 13,
+            "forks_count": i % 5,
+            "created_at": "2020-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "html_url": f"https://github.com/{USERNAME}/repo-{i}",
+            "topics": [f"topic-{i % 9}"],
+        }
+        for i in range(count)
+    ]
+
+
+def github_transport(repos, latency, stats, rate_limit=None):
+    """
+    MockTransport answering the user, repos (paginated with a Link header),
+    events, README and languages endpoints after `latency` seconds, with
+    ETags and 304 responses. With `rate_limit` ({"remaining": n}) full responses use up the
+    budget and are answered 403 once it is gone.
+    """
+    events = [{"type": "PushEvent", "repo": {"name": f"{USERNAME}/repo-0"}}] * 30
+    readme = ("# Project\n[![CI](https://ci/badge.svg)](https://ci)\n"
+              + "A command line tool for streaming data pipelines with Kafka and PostgreSQL. " * 60).encode()
+    reset_at = str(int(time.time()) + 3600)
+
+    def respond(request, body, headers=None):
+        etag = f'"{hashlib.sha256(json.dumps(body).encode()).hexdigest()[:16]}"'
+        headers = {**(headers or {}), "ETag": etag}
+        if rate_limit is not None:
+            headers.update({"X-RateLimit-Remaining": str(rate_limit["remaining"]), "X-RateLimit-Reset": reset_at})
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers)
+        if rate_limit is not None:
+            if rate_limit["remaining"] == 0:
+                stats["forbidden"] += 1
+                return httpx.Response(403, json={"message": "API rate limit exceeded"}, headers=headers)
+            rate_limit["remaining"] -= 1
+            headers["X-RateLimit-Remaining"] = str(rate_limit["remaining"])
+        stats["rate_limited"] += 1
+        return httpx.Response(200, json=body, headers=headers)
+
+    async def handler(request):
+        stats["requests"] += 1
+        await asyncio.sleep(latency)
+        parts = request.url.path.strip("/").split("/")
+        if parts[0] == "repos" and len(parts) == 4:
+            if parts[3] == "readme":
+                return respond(request, {"encoding": "base64", "size": len(readme), "content": base64.b64encode(readme).decode()})
+            return respond(request, {"Python": 52000, "Shell": 3100, "Dockerfile": 400})
+        if parts[0] != "users" or len(parts) < 2:
+            return httpx.Response(404, json={"message": "Not Found"})
+        username, endpoint = parts[1], "/".join(parts[2:])
+        if endpoint == "":
+            return respond(request, {"login": username, "name": "Jane Doe", "public_repos": len(repos)})
+        if endpoint == "events/public":
+            return respond(request, events)
+        if endpoint == "repos":
+            per_page = int(request.url.params.get("per_page", 30))
+            page = int(request.url.params.get("page", 1))
+            last_page = max(1, -(-len(repos) // per_page))
+            headers = {}
+            if last_page > 1:
+                last_url = request.url.copy_merge_params({"page": last_page})
+                headers["Link"] = f'<{last_url}>; rel="last"'
+            return respond(request, repos[(page - 1) * per_page:page * per_page], headers)
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    return httpx.MockTransport(handler)
+
+
+async def sequential_profile(client):
+    """The original flow: three requests in a row, first repository page only."""
+    base = f"{GITHUB_API_URL}/users/{USERNAME}"
+    user_data = (await client.get(base)).json()
+    repos_data = (await client.get(f"{base}/repos", params={"per_page": 100})).json()
+    events_data = (await client.get(f"{base}/events/public", params={"per_page": 30})).json()
+    return build_profile_info(user_data, repos_data, events_data)
+
+
+async def main(args):
+    repos = make_repos(args.repos)
+    github_scraper.GITHUB_PAGE_CONCURRENCY = args.page_concurrency
+    print(f"{args.repos} repositories, {args.latency * 1000:.0f} ms per request, "
+          f"page concurrency {args.page_concurrency}\n")
+    print(f"{'Collector':<28}{'wall (s)':>10}{'requests':>10}{'rate-limited':>14}{'repos':>8}{'enriched':>10}{'digest tokens':>15}")
+
+    def concurrent(client):
+        return fetch_github_profile_info(PROFILE_URL, client)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = GitHubCache(cache_dir, fresh_seconds=3600)
+        github_scraper.github_cache = cache
+        for label, collect, fresh_seconds in (
+            ("sequential", sequential_profile, 3600),
+            ("concurrent (cold cache)", concurrent, 3600),
+            ("concurrent (fresh cache)", concurrent, 3600),
+            ("concurrent (revalidated)", concurrent, 0),
+        ):
+            cache.fresh_seconds = fresh_seconds
+            stats = {"requests": 0, "rate_limited": 0}
+            async with httpx.AsyncClient(transport=github_transport(repos, args.latency, stats)) as client:
+                start = time.perf_counter()
+                profile = await collect(client)
+                elapsed = time.perf_counter() - start
+            enriched = sum(1 for repo in profile['repositories'] if repo.get('readme_excerpt'))
+            digest_tokens = count_tokens(compact(build_github_digest(profile)))
+            print(f"{label:<28}{elapsed:>10.2f}{stats['requests']:>10}{stats['rate_limited']:>14}"
+                  f"{len(profile['repositories']):>8}{enriched:>10}{digest_tokens:>15}")
+        print(f"\ncache: {cache.snapshot()}")
+
+    await rate_limit_scenario(repos, args)
+
+
+async def rate_limit_scenario(repos, args):
+    """
+    Hourly budget of two core collections and one enrichment beyond the
+    enrichment reserve. After the first profile a second, uncached profile is
+    requested and then the first one again.
+    """
+    core = -(-len(repos) // 100) + 2
+    enrichment = 2 * github_scraper.GITHUB_ENRICH_TOP_REPOS
+    budget = 2 * core + enrichment + github_scraper.GITHUB_ENRICH_MIN_REMAINING
+    print(f"\nRate limit: {budget} requests per hour, {core} core requests per profile, "
+          f"{enrichment} for enrichment, {github_scraper.GITHUB_ENRICH_MIN_REMAINING} kept for core collections\n")
+    print(f"{'Collection':<34}{'requests':>10}{'403s':>6}  result")
+    rate_limit = {"remaining": budget}
+    stats = {"requests": 0, "rate_limited": 0, "forbidden": 0}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        github_scraper.github_cache = GitHubCache(cache_dir, fresh_seconds=0)
+        github_scraper.github_tokens = GitHubTokenPool([])
+        async with httpx.AsyncClient(transport=github_transport(repos, args.latency, stats, rate_limit)) as client:
+            for label, url in (
+                (f"{USERNAME} (cold)", PROFILE_URL),
+                ("second user (uncached)", "https://github.com/johndoe"),
+                (f"{USERNAME} (again)", PROFILE_URL),
+            ):
+                before = dict(stats)
+                try:
+                    profile = await fetch_github_profile_info(url, client)
+                    enriched = sum(1 for repo in profile['repositories'] if repo.get('language_bytes')) if profile else 0
+                    result = (f"{len(profile['repositories'])} repos, {enriched} enriched"
+                              + (" (stale)" if profile.get("stale") else "")) if profile else "None"
+                except GitHubRateLimited as e:
+                    result = str(e)
+                print(f"{label:<34}{stats['requests'] - before['requests']:>10}{stats['forbidden'] - before['forbidden']:>6}  {result}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare sequential and concurrent GitHub profile collection")
+    parser.add_argument("--repos", type=int, default=350)
+    parser.add_argument("--latency", type=float, default=0.1, help="Simulated seconds per GitHub API request")
+    parser.add_argument("--page-concurrency", type=int, default=github_scraper.GITHUB_PAGE_CONCURRENCY)
+    asyncio.run(main(parser.parse_args()))
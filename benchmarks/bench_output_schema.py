@@ -0,0 +1,72 @@
+"""
+Agent Output Size Benchmark
+
+Generation time grows with the number of output tokens. This benchmark
+renders a realistic response for every section agent in the old layout
+(results wrapped in {"steps": [...]}, contact details regenerated by the
+basic information agent) and the current one (a single Step, email and
+phone echoed from the resume), counts output tokens with tiktoken and
+models the wall time of the concurrent section agents:
+time to first token plus output tokens at a fixed generation rate.
+
+Usage:
+    python -m benchmarks.bench_output_schema [--tokens-per-second 60] [--first-token 0.6]
+"""
+import argparse
+import importlib
+import json
+
+from benchmarks.fake_llm import load_fixture
+from pipeline.engine import SECTION_AGENTS
+from pipeline.token_budget import count_tokens
+from Multiagent.Basic_Information_agent import BasicInformation, ProfileInformation
+
+
+def section_step_model(section):
+    # The general agents' module defines the Step (or BasicInformation) model
+    module = importlib.import_module(section.analyze.__module__)
+    return getattr(module, "Step", None) or BasicInformation
+
+
+def render(value):
+    # Structured outputs are generated as compact JSON
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens-per-second", type=float, default=60.0, help="Modeled output generation rate")
+    parser.add_argument("--first-token", type=float, default=0.6, help="Modeled seconds to first token")
+    args = parser.parse_args()
+
+    outputs = json.loads(load_fixture("sample_outputs.json"))
+    rows = []
+    for section in SECTION_AGENTS:
+        step = section_step_model(section).model_validate(outputs[section.name]).model_dump()
+        before = render({"steps": [step]})
+        if section.echo_fields:
+            step = ProfileInformation.model_validate(step).model_dump()
+        after = render(step)
+        rows.append((section.name, count_tokens(before), count_tokens(after)))
+
+    def wall(tokens):
+        return args.first_token + tokens / args.tokens_per_second
+
+    print(f"{'section agent':<20}{'before (tokens)':>17}{'after (tokens)':>16}{'saved':>8}")
+    for name, before, after in rows:
+        print(f"{name:<20}{before:>17}{after:>16}{before - after:>8}")
+    total_before = sum(before for _, before, _ in rows)
+    total_after = sum(after for _, _, after in rows)
+    print(f"{'total':<20}{total_before:>17}{total_after:>16}{total_before - total_after:>8}")
+
+    # The section agents run concurrently, so the slowest one sets the wall time
+    wall_before = max(wall(before) for _, before, _ in rows)
+    wall_after = max(wall(after) for _, _, after in rows)
+    basic_before, basic_after = next((wall(b), wall(a)) for name, b, a in rows if name == "basic_information")
+    print(f"\nModeled wall time at {args.tokens_per_second:.0f} tokens/s, {args.first_token:.1f}s to first token:")
+    print(f"  all section agents (slowest agent):  {wall_before:.2f}s -> {wall_after:.2f}s")
+    print(f"  basic_information agent:             {basic_before:.2f}s -> {basic_after:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Pipeline Engine Benchmark
+
+Runs the shared pipeline engine for every endpoint configuration
+(file/text input, standard/ATS agents) against a simulated LLM backend and
+reports wall time, LLM call counts and prompt sizes. Every pipeline change
+is measured once here for all endpoints. The estimated token column counts
+each agent's system prompt as well as its input.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--latency 0.05] [--runs 5]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+
+from benchmarks.fake_llm import install_fake_llm, load_fixture
+from pipeline import engine
+from pipeline.deadline import Deadline
+from pipeline.result_store import ResumeStore, resume_fingerprint
+
+SOURCES = {
+    'linkedin_profile_link': "linkedin.pdf",
+    'github_profile_link': "https://github.com/janedoe",
+    'other_link': "https://blog.janedoe.dev",
+    'protflow_profile_link': "https://janedoe.dev",
+}
+
+
+async def run_endpoint(pipeline, resume_source, ats, with_sources, fingerprint=None, job_description="Backend Engineer", deadline=None):
+    sources = SOURCES if with_sources else {}
+    jd_task = asyncio.create_task(engine.collect_jd_data(job_description, deadline=deadline)) if ats else None
+    Basic_Information, *tokens = await pipeline.resume_data(resume_source, **sources, fingerprint=fingerprint, deadline=deadline)
+    jd_data = await jd_task if ats else None
+    return await pipeline.process_all_agents(Basic_Information, jd_data, *tokens, deadline=deadline)
+
+
+async def bench_repeat_jd(recorder, resume_text, runs):
+    """
+    Second ATS run for an already-seen resume: only the JD-dependent work is repeated.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as store_dir:
+        pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput(), store=ResumeStore(store_dir))
+        fingerprint = resume_fingerprint(
+            resume_text, SOURCES['linkedin_profile_link'], SOURCES['github_profile_link'],
+            SOURCES['protflow_profile_link'], SOURCES['other_link']
+        )
+        await run_endpoint(pipeline, resume_text, True, True, fingerprint)
+        timings = []
+        for run in range(runs):
+            recorder.reset()
+            start = time.perf_counter()
+            await run_endpoint(pipeline, resume_text, True, True, fingerprint, job_description=f"Platform Engineer {run}")
+            timings.append(time.perf_counter() - start)
+        rows.append(("ATS-resume (repeat, new JD)", True, statistics.mean(timings), recorder.count, recorder.prompt_chars, recorder.estimated_prompt_tokens))
+    return rows
+
+
+async def bench_edited_resume(recorder, resume_text, runs):
+    """
+    Resubmission after editing one section: only that section agent runs again.
+    """
+    with tempfile.TemporaryDirectory() as store_dir:
+        pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput(), store=ResumeStore(store_dir))
+        Basic_Information, *tokens = await pipeline.resume_data(resume_text)
+        await pipeline.process_all_agents(Basic_Information, None, *tokens)
+        timings = []
+        for run in range(runs):
+            Basic_Information.Resume_Skills = ["Python", "Go", f"edit {run}"]
+            recorder.reset()
+            start = time.perf_counter()
+            await pipeline.process_all_agents(Basic_Information, None, *tokens)
+            timings.append(time.perf_counter() - start)
+    return [("improvement (edited skills)", False, statistics.mean(timings), recorder.count, recorder.prompt_chars, recorder.estimated_prompt_tokens)]
+
+
+async def bench_consolidated(recorder, resume_text, runs):
+    """
+    Short resume without external sources: eight section agents (fan-out)
+    against one consolidated call. The simulated backend charges a fixed
+    latency per call, so this compares call counts and prompt sizes; in
+    production the consolidated call also generates every section in one
+    response.
+    """
+    rows = []
+    for label, max_chars in (("improvement (fan-out)", 0), ("improvement (consolidated)", engine.CONSOLIDATED_MAX_INPUT_CHARS)):
+        pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput(), consolidated_max_chars=max_chars)
+        Basic_Information, *tokens = await pipeline.resume_data(resume_text)
+        timings = []
+        for _ in range(runs):
+            recorder.reset()
+            start = time.perf_counter()
+            results = await pipeline.process_all_agents(Basic_Information, None, *tokens)
+            timings.append(time.perf_counter() - start)
+        rows.append((f"{label} [{results['agent_mode']}]", False, statistics.mean(timings),
+                     recorder.count, recorder.prompt_chars, recorder.estimated_prompt_tokens))
+    return rows
+
+
+async def bench_junior_resume(recorder, runs):
+    """
+    Junior resume without projects, certifications, achievements or
+    languages: those section agents are skipped without a model call.
+    """
+    resume_text = load_fixture("junior_resume.txt")
+    pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput(), consolidated_max_chars=0)
+    rows = []
+    for label, ats in (("improvement (junior, fan-out)", False), ("ATS-resume (junior)", True)):
+        timings = []
+        for _ in range(runs):
+            recorder.reset()
+            start = time.perf_counter()
+            results = await run_endpoint(pipeline, resume_text, ats, False)
+            timings.append(time.perf_counter() - start)
+        print(f"{label} skipped sections: {results['skipped_sections']}")
+        rows.append((label, False, statistics.mean(timings), recorder.count, recorder.prompt_chars, recorder.estimated_prompt_tokens))
+    return rows
+
+
+async def bench_speculative(recorder, resume_text, latency, runs):
+    """
+    GitHub link whose scraper takes four LLM latencies, with and without
+    speculative section analysis. When the profile yields nothing every
+    speculative section is kept; when it has data, the sections that read
+    GitHub fields (experience, skills, projects) are run again.
+    """
+    fast_github = engine.fetch_github_profile_info
+
+    async def slow_github(*args, **kwargs):
+        await asyncio.sleep(latency * 4)
+        return {"username": "janedoe", "public_repos": 12}
+
+    async def missing_github(*args, **kwargs):
+        await asyncio.sleep(latency * 4)
+        raise ValueError("GitHub user not found")
+
+    rows = []
+    try:
+        for case, scraper in (("GitHub, no data", missing_github), ("GitHub with data", slow_github)):
+            engine.fetch_github_profile_info = scraper
+            for speculative in (False, True):
+                pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput(), speculative=speculative)
+                timings = []
+                for _ in range(runs):
+                    recorder.reset()
+                    start = time.perf_counter()
+                    results = await pipeline.run_analysis(resume_text, github_profile_link=SOURCES['github_profile_link'])
+                    timings.append(time.perf_counter() - start)
+                label = f"improvement ({case}) [{results['agent_mode']}]"
+                if speculative:
+                    print(f"{label} re-ran: {results['speculative_reruns']}")
+                rows.append((label, True, statistics.mean(timings), recorder.count, recorder.prompt_chars, recorder.estimated_prompt_tokens))
+    finally:
+        engine.fetch_github_profile_info = fast_github
+    return rows
+
+
+async def bench_slow_source(recorder, resume_text, latency, runs):
+    """
+    A portfolio site that hangs for far longer than the request deadline:
+    the portfolio source is cancelled and the section agents still run.
+    """
+    fast_portfolio = engine.crawl_portfolio
+
+    async def slow_portfolio(*args, **kwargs):
+        await asyncio.sleep(latency * 40)
+        return "", {"fetched": 1, "failed": 0, "duplicates": 0, "pages": 1}
+
+    engine.crawl_portfolio = slow_portfolio
+    try:
+        pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput())
+        timings = []
+        for _ in range(runs):
+            recorder.reset()
+            start = time.perf_counter()
+            results = await run_endpoint(pipeline, resume_text, True, True, deadline=Deadline(latency * 10))
+            timings.append(time.perf_counter() - start)
+        print(f"Slow portfolio run degraded sources: {results['degraded_sources']}")
+    finally:
+        engine.crawl_portfolio = fast_portfolio
+    return [("ATS-resume (slow portfolio)", True, statistics.mean(timings), recorder.count, recorder.prompt_chars, recorder.estimated_prompt_tokens)]
+
+
+async def bench(latency, runs):
+    recorder = install_fake_llm(engine, latency=latency)
+    resume_text = load_fixture("sample_resume.txt")
+    configurations = [
+        ("improvement-resume", engine.FileResumeInput(), "resume.pdf", False),
+        ("improvement-resume-text", engine.TextResumeInput(), resume_text, False),
+        ("ATS-resume", engine.FileResumeInput(), "resume.pdf", True),
+        ("ATS-resume-text", engine.TextResumeInput(), resume_text, True),
+    ]
+
+    rows = []
+    for label, adapter, resume_source, ats in configurations:
+        pipeline = engine.ResumePipeline(input_adapter=adapter)
+        for with_sources in (False, True):
+            timings = []
+            for _ in range(runs):
+                recorder.reset()
+                start = time.perf_counter()
+                await run_endpoint(pipeline, resume_source, ats, with_sources)
+                timings.append(time.perf_counter() - start)
+            rows.append((label, with_sources, statistics.mean(timings), recorder.count, recorder.prompt_chars, recorder.estimated_prompt_tokens))
+    rows.extend(await bench_repeat_jd(recorder, resume_text, runs))
+    rows.extend(await bench_edited_resume(recorder, resume_text, runs))
+    rows.extend(await bench_consolidated(recorder, resume_text, runs))
+    rows.extend(await bench_junior_resume(recorder, runs))
+    rows.extend(await bench_speculative(recorder, resume_text, latency, runs))
+    rows.extend(await bench_slow_source(recorder, resume_text, latency, runs))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per LLM call")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per configuration")
+    args = parser.parse_args()
+
+    rows = asyncio.run(bench(args.latency, args.runs))
+
+    print(f"\n{'endpoint':<50}{'sources':<9}{'wall (s)':>10}{'LLM calls':>11}{'prompt chars':>14}{'est. tokens':>13}")
+    for label, with_sources, wall, calls, chars, est_tokens in rows:
+        print(f"{label:<50}{'yes' if with_sources else 'no':<9}{wall:>10.3f}{calls:>11}{chars:>14}{est_tokens:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Portfolio Fetcher Benchmark
+
+Serves simulated portfolio sites through httpx mock transports and compares
+the blocking fetcher the pipeline used (requests-style GET with
+time.sleep(2 ** attempt) backoff, run in a worker thread) with the async
+fetch_portfolio_content on the shared pool:
+- a burst of dead portfolio links answering 503, fetched concurrently:
+  wall time and worker threads held
+- a redirect loop and an oversized page: requests sent and bytes read
+- a multi-page portfolio site with duplicate URLs (fragments, tracking
+  parameters, www. host), a near-identical page and external links:
+  landing page only vs crawl_portfolio, pages fetched and merged tokens
+- the same site requested again through the portfolio cache: cold, fresh
+  (no requests) and revalidated with conditional GETs (304), counting
+  bytes transferred and portfolio agent calls
+
+Each section uses its own temporary cache.
+
+Usage:
+    python -m benchmarks.bench_portfolio [--dead-links 20] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+
+import httpx
+
+from Scraper import protflow_other_link
+from Scraper import portfolio_crawler
+from Scraper.portfolio_cache import PortfolioCache
+from Scraper.portfolio_crawler import crawl_portfolio
+from Scraper.protflow_other_link import fetch_portfolio_content
+from pipeline.token_budget import count_tokens
+
+PAGE = "<html><body><main><h1>Jane Doe</h1><p>Backend engineer building data pipelines.</p></main></body></html>"
+
+
+def blocking_fetch(url, latency, max_retries=3):
+    """The previous fetcher: blocking GET, 2 ** attempt seconds between attempts."""
+    def handler(request):
+        time.sleep(latency)
+        return httpx.Response(503)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        for attempt in range(max_retries):
+            response = client.get(url)
+            if response.status_code == 200:
+                return response.text
+            if attempt < max_retries - 1:
+                time.sleep(2 ** attempt)
+    return None
+
+
+async def dead_links(args):
+    urls = [f"https://dead-{i}.example.com" for i in range(args.dead_links)]
+
+    threads_before = threading.active_count()
+    start = time.perf_counter()
+    await asyncio.gather(*(asyncio.to_thread(blocking_fetch, url, args.latency) for url in urls))
+    blocking_wall = time.perf_counter() - start
+    blocking_threads = threading.active_count() - threads_before
+
+    async def handler(request):
+        await asyncio.sleep(args.latency)
+        return httpx.Response(503)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        threads_before = threading.active_count()
+        start = time.perf_counter()
+        await asyncio.gather(*(fetch_portfolio_content(url, client) for url in urls))
+        async_wall = time.perf_counter() - start
+        async_threads = threading.active_count() - threads_before
+
+    print(f"{args.dead_links} dead links (503), {args.latency * 1000:.0f} ms per request\n")
+    print(f"{'Fetcher':<28}{'wall (s)':>10}{'new threads':>13}")
+    print(f"{'blocking + time.sleep':<28}{blocking_wall:>10.2f}{blocking_threads:>13}")
+    print(f"{'async + asyncio.sleep':<28}{async_wall:>10.2f}{async_threads:>13}")
+
+
+async def limits(args):
+    stats = {"requests": 0}
+    big_page = PAGE.encode() + b"<p>filler</p>" * (10 * 1024 * 1024 // 13)
+
+    async def handler(request):
+        stats["requests"] += 1
+        if request.url.host == "loop.example.com":
+            return httpx.Response(302, headers={"Location": f"/step-{stats['requests']}"})
+        return httpx.Response(200, content=big_page, headers={"Content-Type": "text/html"})
+
+    print(f"\n{'Site':<28}{'requests':>10}{'MB read':>10}  result")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        for label, url in (("redirect loop", "https://loop.example.com"), ("10 MB page", "https://big.example.com")):
+            stats["requests"] = 0
+            text, status = await fetch_portfolio_content(url, client)
+            read_mb = min(len(big_page), protflow_other_link.PORTFOLIO_MAX_BYTES) / 1e6 if text else 0
+            result = f"{len(text)} chars of text" if text else "no content"
+            print(f"{label:<28}{stats['requests']:>10}{read_mb:>10.1f}  {result}")
+
+
+def _site_page(title, body, links):
+    anchors = "".join(f'<a href="{href}">{href}</a>' for href in links)
+    return f"<html><body><nav>{anchors}</nav><main><h1>{title}</h1><p>{body}</p></main></body></html>"
+
+
+SITE_LINKS = [
+    "/projects", "/projects/#top", "https://www.jane.example.com/about/", "/experience?utm_source=nav",
+    "/blog", "/blog/print", "mailto:jane@example.com", "/cv.pdf", "https://github.com/jane",
+]
+SITE = {
+    "/": _site_page("Jane Doe", "Backend engineer building data pipelines.", SITE_LINKS),
+    "/projects": _site_page("Projects", " ".join(f"Project {i}: a streaming ETL service in Python and Kafka with "
+                                                  f"observability and autoscaling." for i in range(60)), SITE_LINKS),
+    "/about": _site_page("About", "Ten years of backend work across fintech and logistics. " * 20, SITE_LINKS),
+    "/experience": _site_page("Experience", " ".join(f"{2014 + i}: Senior engineer at Company {i}, led a team of "
+                                                      f"{i + 3} on payment systems." for i in range(10)), SITE_LINKS),
+    "/blog": _site_page("Blog", " ".join(f"Post {i} on distributed systems and database internals." for i in range(40)), SITE_LINKS),
+    "/blog/print": _site_page("Blog", " ".join(f"Post {i} on distributed systems and database internals." for i in range(40))
+                              + " Printed version.", SITE_LINKS),
+}
+
+
+def site_handler(latency, requested, transferred):
+    """Serve SITE with ETags, recording requested URLs and body bytes sent."""
+    async def handler(request):
+        await asyncio.sleep(latency)
+        requested.append(str(request.url))
+        page = SITE.get(request.url.path.rstrip("/") or "/")
+        if page is None or "jane.example.com" not in request.url.host:
+            return httpx.Response(404)
+        etag = f'"{hashlib.sha256(page.encode()).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        transferred.append(len(page))
+        return httpx.Response(200, text=page, headers={"Content-Type": "text/html", "ETag": etag})
+    return handler
+
+
+async def crawl(args):
+    requested = []
+    handler = site_handler(args.latency, requested, [])
+
+    print(f"\n{'Portfolio site':<28}{'wall (s)':>10}{'requests':>10}{'pages':>7}{'dupes':>7}{'tokens':>8}")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        for label, max_pages in (("landing page only", 1), (f"crawl ({portfolio_crawler.PORTFOLIO_MAX_PAGES} pages)", portfolio_crawler.PORTFOLIO_MAX_PAGES)):
+            requested.clear()
+            start = time.perf_counter()
+            text, stats = await crawl_portfolio("https://jane.example.com/", client, max_pages=max_pages)
+            wall = time.perf_counter() - start
+            print(f"{label:<28}{wall:>10.2f}{len(requested):>10}{stats['pages']:>7}{stats['duplicates']:>7}{count_tokens(text or ''):>8}")
+    print(f"Crawled: {', '.join(sorted(set(url.split('.com', 1)[1] or '/' for url in requested)))}")
+
+
+async def repeat(args, cache):
+    requested, transferred = [], []
+    agent_calls = []
+
+    async def analyze(text):
+        # Stands in for the portfolio agent call
+        agent_calls.append(text)
+        await asyncio.sleep(args.latency * 20)
+        return f"summary of {len(text)} chars", 1500
+
+    print(f"\n{'Repeat request':<28}{'wall (s)':>10}{'requests':>10}{'KB sent':>9}{'agent calls':>13}")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site_handler(args.latency, requested, transferred))) as client:
+        for label, fresh_seconds in (("cold cache", 3600), ("fresh cache", 3600), ("revalidated (304)", 0)):
+            cache.fresh_seconds = fresh_seconds
+            requested.clear()
+            transferred.clear()
+            agent_calls.clear()
+            start = time.perf_counter()
+            text, _ = await crawl_portfolio("https://jane.example.com/", client)
+            await cache.get_summary(analyze, text)
+            wall = time.perf_counter() - start
+            print(f"{label:<28}{wall:>10.2f}{len(requested):>10}{sum(transferred) / 1024:>9.1f}{len(agent_calls):>13}")
+    print(f"cache: {cache.snapshot()}")
+
+
+async def main(args):
+    # Per-request and per-attempt log lines would drown the tables
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    protflow_other_link.logger.setLevel(logging.CRITICAL)
+    for section in (dead_links, limits, crawl, repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = PortfolioCache(cache_dir, fresh_seconds=0)
+            protflow_other_link.portfolio_cache = cache
+            await (section(args, cache) if section is repeat else section(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the blocking and async portfolio fetchers")
+    parser.add_argument("--dead-links", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per request")
+    asyncio.run(main(parser.parse_args()))
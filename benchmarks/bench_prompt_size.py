@@ -0,0 +1,148 @@
+"""
+Prompt Size Benchmark
+
+Compares the section agent inputs built with the compact prompt serializer
+(pipeline/prompt_format.py) against interpolating the raw Basic_Information
+fields, which renders pydantic reprs. Basic_Information is built from
+benchmarks/fixtures/sample_sources.json using the agents' own models, so
+the reprs match what the pipeline produced before.
+
+A second table measures the GitHub agent input for prolific profiles
+(events with commit payloads) as raw interpolation, ranked and capped at
+GITHUB_INPUT_TOKENS, and as the digest from
+pipeline/github_digest.py that the pipeline now sends.
+
+Usage:
+    python -m benchmarks.bench_prompt_size
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.fake_llm import load_fixture
+from pipeline import engine
+from pipeline.prompt_format import compact
+from pipeline.github_digest import build_github_digest
+from pipeline.token_budget import GITHUB_INPUT_TOKENS, count_tokens, rank_repositories
+from Agent.resume_agent import EducationItem, Languages, Projects, Certifications, Achievements, Skills
+from Agent.resume_experince_agent import resume_experience_data
+from linkedin_agent.LinkedIn_Basic_Info_position_agent import LinkedInBasicInfo
+from linkedin_agent.LinkedIn_experience_agent import ExperienceItem as LinkedInExperienceItem
+from linkedin_agent.LinkedIn_eduction_agent import EducationItem as LinkedInEducationItem
+from linkedin_agent.LinkedIn_certification_language_agent import CertificationItem, LanguageItem
+from linkedin_agent.LinkedIn_project import ProjectItem
+
+
+def estimate_tokens(text):
+    return count_tokens(text)
+
+
+def load_basic_information():
+    sources = json.loads(load_fixture("sample_sources.json"))
+    resume = sources['resume']
+    resume.update(
+        experience=resume_experience_data.model_validate(resume['experience']),
+        education=[EducationItem.model_validate(item) for item in resume['education']],
+        languages=[Languages.model_validate(item) for item in resume['languages']],
+        projects=[Projects.model_validate(item) for item in resume['projects']],
+        certifications=[Certifications.model_validate(item) for item in resume['certifications']],
+        achievements=[Achievements.model_validate(item) for item in resume['achievements']],
+        skills=[Skills.model_validate(item) for item in resume['skills']],
+    )
+    linkedin = sources['linkedin']
+    basic_info = LinkedInBasicInfo.model_validate(linkedin['basic_information'])
+    linkedin = {
+        'basic_information': basic_info,
+        'professional_summary': basic_info.position,
+        'experience': [LinkedInExperienceItem.model_validate(item) for item in linkedin['experience']],
+        'education': [LinkedInEducationItem.model_validate(item) for item in linkedin['education']]
+                     + [CertificationItem.model_validate(item) for item in linkedin['certifications']],
+        'projects': [ProjectItem.model_validate(item) for item in linkedin['projects']],
+        'languages': [LanguageItem.model_validate(item) for item in linkedin['languages']],
+    }
+    return engine.BasicInformationData(
+        resume=resume,
+        linkedin=linkedin,
+        github=sources['github'],
+        protflow_summary=sources['protflow_summary'],
+        other_link_summary=sources['other_link_summary'],
+    )
+
+
+def prolific_github_profile(repo_count=100, event_count=10):
+    """
+    A get_github_profile_info() result shaped like a prolific user's profile.
+    """
+    now = datetime.now(timezone.utc)
+    repositories = [{
+        "name": f"project-{index}",
+        "full_name": f"janedoe/project-{index}",
+        "description": f"Tooling experiment number {index} for distributed systems and data pipelines.",
+        "language": ("Go", "Python", "TypeScript", "Rust")[index % 4],
+        "fork": index % 5 == 0,
+        "stars": (index * 37) % 400,
+        "forks": index % 13,
+        "created_at": (now - timedelta(days=900 + index)).isoformat(),
+        "updated_at": (now - timedelta(days=index * 9)).isoformat(),
+        "url": f"https://github.com/janedoe/project-{index}",
+        "topics": ["distributed-systems", "cli"] if index % 3 == 0 else [],
+    } for index in range(repo_count)]
+    events = [{
+        "type": "PushEvent" if index % 3 else "PullRequestEvent",
+        "repo": f"janedoe/project-{index % 4}",
+        "created_at": (now - timedelta(hours=index * 5)).isoformat(),
+        "payload": {"commits": [{
+            "sha": f"{index:02d}{commit:038d}",
+            "message": f"Refactor module {commit} and update tests for the scheduler",
+            "author": {"name": "Jane Doe", "email": "jane.doe@example.com"},
+            "url": f"https://api.github.com/repos/janedoe/project-{index % 4}/commits/{commit}",
+        } for commit in range(20)]},
+    } for index in range(event_count)]
+    return {
+        "username": "janedoe", "name": "Jane Doe", "bio": "Backend engineer", "location": "San Francisco",
+        "blog": "https://janedoe.dev", "company": "Acme Payments", "email": None,
+        "public_repos": repo_count, "public_gists": 3, "followers": 850, "following": 12,
+        "avatar_url": "https://avatars.githubusercontent.com/u/1", "html_url": "https://github.com/janedoe",
+        "total_stars": sum(repo["stars"] for repo in repositories),
+        "languages_used": ["Go", "Python", "Rust", "TypeScript"],
+        "repositories": repositories, "recent_events": events,
+        "api_note": "Contribution graph data is not available via the API.",
+    }
+
+
+def github_table():
+    print(f"\n{'GitHub agent input':<22}{'raw tokens':>13}{'budgeted':>10}{'digest':>8}{'budget':>8}")
+    for repo_count, event_count in ((100, 10), (350, 10)):
+        profile = prolific_github_profile(repo_count, event_count)
+        raw_input = f"Extract structured data from this GitHub profile: {profile}"
+        ranked = {**profile, "repositories": rank_repositories(profile["repositories"])}
+        budgeted_input = f"Extract structured data from this GitHub profile: {compact(ranked, GITHUB_INPUT_TOKENS)}"
+        digest_input = f"Extract structured data from this GitHub profile digest: {compact(build_github_digest(profile))}"
+        label = f"{repo_count} repos, {event_count} events"
+        print(f"{label:<22}{count_tokens(raw_input):>13}{count_tokens(budgeted_input):>10}{count_tokens(digest_input):>8}{GITHUB_INPUT_TOKENS:>8}")
+
+
+def main():
+    Basic_Information = load_basic_information()
+
+    compact_inputs = {section.name: section.build_input(Basic_Information) for section in engine.SECTION_AGENTS}
+    engine.compact = lambda value, max_tokens=None: str(value)  # plain f-string interpolation, as before the serializer
+    try:
+        repr_inputs = {section.name: section.build_input(Basic_Information) for section in engine.SECTION_AGENTS}
+    finally:
+        engine.compact = compact
+
+    print(f"\n{'agent':<20}{'repr tokens':>13}{'compact tokens':>16}{'saved':>8}")
+    total_repr = total_compact = 0
+    for name in compact_inputs:
+        repr_tokens = estimate_tokens(repr_inputs[name])
+        compact_tokens = estimate_tokens(compact_inputs[name])
+        total_repr += repr_tokens
+        total_compact += compact_tokens
+        print(f"{name:<20}{repr_tokens:>13}{compact_tokens:>16}{1 - compact_tokens / repr_tokens:>8.0%}")
+    print(f"{'total':<20}{total_repr:>13}{total_compact:>16}{1 - total_compact / total_repr:>8.0%}")
+
+    github_table()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+LLM Scheduler Benchmark
+
+One heavy request (e.g. a large LinkedIn profile fanned out into many agent
+calls) arrives just before a burst of small requests. With a plain FIFO
+semaphore the small requests queue behind every call of the heavy one; the
+fair scheduler serves requests round-robin, so they finish after a few
+slots. Reports completion times of the small requests for both limiters.
+
+Usage:
+    python -m benchmarks.bench_scheduler [--concurrency 8] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from contextlib import asynccontextmanager
+
+from pipeline.scheduler import FairScheduler, set_request_flow, PRIORITY_BULK
+
+
+class FifoLimiter:
+    def __init__(self, max_concurrency):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._semaphore:
+            yield
+
+
+async def simulated_request(limiter, flow_id, calls, latency, priority=0):
+    set_request_flow(flow_id, priority)
+    start = time.perf_counter()
+
+    async def call():
+        async with limiter.slot():
+            await asyncio.sleep(latency)
+
+    await asyncio.gather(*(call() for _ in range(calls)))
+    return time.perf_counter() - start
+
+
+async def run_mix(limiter, args):
+    heavy = asyncio.create_task(simulated_request(limiter, "heavy", args.heavy_calls, args.latency))
+    bulk = asyncio.create_task(simulated_request(limiter, "bulk", args.small_calls, args.latency, PRIORITY_BULK))
+    await asyncio.sleep(0)
+    small = await asyncio.gather(*(
+        simulated_request(limiter, f"small-{i}", args.small_calls, args.latency)
+        for i in range(args.small_requests)
+    ))
+    return sorted(small), await heavy, await bulk
+
+
+def p90(values):
+    return values[min(len(values) - 1, int(len(values) * 0.9))]
+
+
+async def main(args):
+    print(f"{args.heavy_calls}-call request + {args.small_requests} requests of {args.small_calls} calls, "
+          f"concurrency {args.concurrency}, {args.latency * 1000:.0f} ms per call\n")
+    print(f"{'Limiter':<16}{'small p50 (s)':>15}{'small p90 (s)':>15}{'heavy (s)':>12}{'bulk (s)':>11}")
+    for label, limiter in (("FIFO semaphore", FifoLimiter(args.concurrency)), ("fair scheduler", FairScheduler(args.concurrency))):
+        small, heavy, bulk = await run_mix(limiter, args)
+        print(f"{label:<16}{statistics.median(small):>15.2f}{p90(small):>15.2f}{heavy:>12.2f}{bulk:>11.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare FIFO and fair scheduling of LLM calls")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per LLM call")
+    parser.add_argument("--heavy-calls", type=int, default=100)
+    parser.add_argument("--small-requests", type=int, default=10)
+    parser.add_argument("--small-calls", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
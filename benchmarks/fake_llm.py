@@ -0,0 +1,175 @@
+"""
+Simulated LLM backend for the pipeline benchmarks.
+
+The benchmarks measure pipeline scheduling, call counts and prompt sizes
+without spending API quota. install_fake_llm() swaps every LLM-calling
+function used by pipeline.engine for a coroutine that sleeps for a fixed
+latency and records the call, then returns an object shaped like the real
+agent response.
+
+Each simulated call also records the size of the real agent's system prompt,
+so benchmarks can compare the full prompt cost (system prompt plus input)
+of different agent layouts.
+"""
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Allow running the benchmarks from the repository root
+sys.path.append(str(Path(__file__).parent.parent))
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name):
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def system_prompt_chars(agent_function):
+    """
+    Size of an agent's system prompt: the longest string constant in its code.
+    """
+    code = getattr(agent_function, '__code__', None)
+    if code is None:
+        return 0
+    return max((len(const) for const in code.co_consts if isinstance(const, str)), default=0)
+
+
+class CallRecorder:
+    """
+    Records every simulated LLM call with its input and system prompt sizes.
+    """
+    def __init__(self):
+        self.calls = []
+
+    def record(self, name, prompt, system_chars=0):
+        self.calls.append((name, len(str(prompt)), system_chars))
+
+    @property
+    def count(self):
+        return len(self.calls)
+
+    @property
+    def prompt_chars(self):
+        return sum(size for _, size, _ in self.calls)
+
+    @property
+    def system_chars(self):
+        return sum(size for _, _, size in self.calls)
+
+    @property
+    def estimated_prompt_tokens(self):
+        # Same rough estimate the portfolio agent falls back to (1 token ≈ 4 characters)
+        return (self.prompt_chars + self.system_chars) // 4
+
+    def reset(self):
+        self.calls = []
+
+
+def _step(**fields):
+    return SimpleNamespace(**fields)
+
+
+def _resume_response(prompt):
+    # Optional sections are only filled in when the resume has a heading for them
+    def section(heading):
+        return [heading.title()] if heading in str(prompt) else []
+
+    return SimpleNamespace(steps=[_step(
+        SuggestedRole="Backend Engineer", CandidateFullName="Jane Doe",
+        EmailAddress="jane.doe@example.com", PhoneNumber="+1 (415) 555-0134",
+        ProfessionalTitle="Senior Backend Engineer", Summary="Backend engineer.",
+        YearsOfExperienceRequired="7 years", Education=section("EDUCATION"),
+        Languages=section("LANGUAGES"), Projects=section("PROJECTS"),
+        Certifications=section("CERTIFICATIONS"), Achievements=section("ACHIEVEMENTS"),
+        Skills=section("SKILLS")
+    )])
+
+
+def _section_response(prompt):
+    return SimpleNamespace(steps=[_step()])
+
+
+def _analysis_response(**fields):
+    return SimpleNamespace(analysis=SimpleNamespace(**fields))
+
+
+def _consolidated_response(prompt):
+    return SimpleNamespace(steps=[_step(
+        basic_information=_step(), experience=_step(), education=_step(), skills=_step(),
+        languages=_step(), projects=_step(), certifications=_step(), achievements=_step()
+    )])
+
+
+def _jd_response(prompt):
+    # Every JD field echoes the job description so a new JD changes all of them
+    return _analysis_response(
+        job_title=prompt, hard_skills=[prompt], soft_skills=[prompt],
+        tools_and_technologies=[prompt], responsibilities=[prompt],
+        required_qualifications=[prompt], preferred_qualifications=[prompt],
+        action_verbs=[prompt])
+
+
+def _make_fake(recorder, name, latency, response_factory, system_chars=0):
+    async def fake(*args, **kwargs):
+        prompt = args[0] if args else ""
+        recorder.record(name, prompt, system_chars)
+        await asyncio.sleep(latency)
+        return response_factory(prompt), 1000
+    return fake
+
+
+def install_fake_llm(engine, latency=0.05):
+    """
+    Replace the LLM-calling functions of the engine module with simulated ones.
+
+    Args:
+        engine: The pipeline.engine module
+        latency: Simulated seconds per LLM call
+
+    Returns:
+        CallRecorder: Recorder collecting every simulated call
+    """
+    recorder = CallRecorder()
+    section = _section_response
+    linkedin = lambda prompt: None
+
+    fakes = {
+        'analyze_resume': _resume_response,
+        'analyze_resume_Experience': section,
+        'analyze_jd': _jd_response,
+        'analyze_all_sections': _consolidated_response,
+        'analyze_github_profile': lambda prompt: _analysis_response(
+            overall_analysis="Active backend developer.",
+            summary_of_all_repositories="api-gateway (Go), billing-service (Python)",
+            skills=["Go", "Python"]),
+        'analyze_portfolio_website': lambda prompt: _analysis_response(
+            summary_of_portfolio="Portfolio of backend and platform projects."),
+        'analyze_basic_info_position': linkedin,
+        'linkedin_analyze_experience': linkedin,
+        'analyze_linkedin_education': linkedin,
+        'analyze_linkedin_certification_language': linkedin,
+        'analyze_linkedin_projects': linkedin,
+    }
+    for name, factory in fakes.items():
+        system_chars = system_prompt_chars(getattr(engine, name))
+        setattr(engine, name, _make_fake(recorder, name, latency, factory, system_chars))
+
+    for agent in engine.SECTION_AGENTS:
+        agent.analyze = _make_fake(recorder, agent.name, latency, section, system_prompt_chars(agent.analyze))
+        agent.ats_analyze = _make_fake(recorder, f"ats_{agent.name}", latency, section, system_prompt_chars(agent.ats_analyze))
+
+    # External scrapers are network-bound; simulate them with the same latency
+    async def fake_github(*args, **kwargs):
+        await asyncio.sleep(latency)
+        return ""
+    engine.fetch_github_profile_info = fake_github
+
+    async def fake_portfolio(*args, **kwargs):
+        await asyncio.sleep(latency)
+        return "", {"fetched": 1, "failed": 0, "duplicates": 0, "pages": 1}
+    engine.crawl_portfolio = fake_portfolio
+    engine.get_resume_content = lambda path: load_fixture("sample_resume.txt")
+
+    return recorder
@@ -10,6 +10,7 @@ from typing import List, Dict, Optional
 # Add parent directory to path to import shared_client
 sys.path.append(str(Path(__file__).parent.parent))
 from shared_client import get_async_client
+from pipeline.agent_profiles import parse_completion
 
 load_dotenv()
 openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -164,7 +165,7 @@ For each company's projects:
     
     print("Generating improved experience descriptions...")
     
-    completion = await client.beta.chat.completions.parse(
+    completion = await parse_completion(client, "experience_improvement",
         model="gpt-4o-mini",
         messages=[
             {"role": "system", "content": prompt_template},
@@ -0,0 +1,174 @@
+"""
+Agent Reasoning Profiles
+
+Every gpt-5.1 structured-output call goes through parse_completion(), which
+applies the agent's reasoning effort and output verbosity from
+AGENT_PROFILES and records the call's token usage per agent, with hidden
+reasoning tokens counted separately. Extraction agents that copy data out
+of their input (the ATS score, the JD, LinkedIn sections) need no
+reasoning; agents that merge sources or rewrite content get a little.
+
+Section agents that return a list of steps ask for a single Step as the
+response_format and add the steps wrapper themselves (e.g.
+Achievements_data(steps=[parsed])), so the wrapper is never generated.
+
+The table can be overridden without a deploy through AGENT_PROFILE_OVERRIDES,
+a JSON object such as {"jd": {"reasoning_effort": "low"}}. The per-agent
+usage is reported by the /health endpoint under agent_usage.
+"""
+import json
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EXTRACTION = {"reasoning_effort": "none", "verbosity": "low"}
+MERGE = {"reasoning_effort": "low", "verbosity": "low"}
+REWRITE = {"reasoning_effort": "low", "verbosity": "medium"}
+
+# Profile used for agents missing from the table
+DEFAULT_PROFILE = {"reasoning_effort": "low", "verbosity": "medium"}
+
+AGENT_PROFILES = {
+    # Source extraction
+    "resume": EXTRACTION,
+    "resume_experience": EXTRACTION,
+    "jd": EXTRACTION,
+    "github": MERGE,
+    "portfolio": MERGE,
+    "linkedin_basic_info": EXTRACTION,
+    "linkedin_experience": EXTRACTION,
+    "linkedin_education": EXTRACTION,
+    "linkedin_certification_language": EXTRACTION,
+    "linkedin_projects": EXTRACTION,
+
+    # Scores returning a single number
+    "ats_score": EXTRACTION,
+    "ats_score_with_jd": MERGE,
+
+    # Section agents merging the sources
+    "basic_information": REWRITE,
+    "experience": REWRITE,
+    "education": MERGE,
+    "skills": MERGE,
+    "languages": EXTRACTION,
+    "projects": REWRITE,
+    "certifications": MERGE,
+    "achievements": MERGE,
+    "consolidated": REWRITE,
+
+    # ATS section agents tailor the content to the job description
+    "ats_basic_information": REWRITE,
+    "ats_experience": REWRITE,
+    "ats_education": MERGE,
+    "ats_skills": MERGE,
+    "ats_languages": EXTRACTION,
+    "ats_projects": REWRITE,
+    "ats_certifications": MERGE,
+    "ats_achievements": MERGE,
+
+    # Rewriting endpoints
+    "experience_improvement": REWRITE,
+    "linkedin_rewrite_personal_info": REWRITE,
+    "linkedin_rewrite_experience": REWRITE,
+    "linkedin_rewrite_education": REWRITE,
+    "linkedin_rewrite_skill": MERGE,
+    "linkedin_rewrite_language": EXTRACTION,
+    "linkedin_rewrite_courses": REWRITE,
+    "linkedin_rewrite_honors_awards": REWRITE,
+}
+
+
+def _load_overrides():
+    raw = os.getenv("AGENT_PROFILE_OVERRIDES", "")
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        print(f"Warning: ignoring invalid AGENT_PROFILE_OVERRIDES ({e})")
+        return {}
+
+
+PROFILE_OVERRIDES = _load_overrides()
+
+
+def agent_profile(agent_name):
+    """
+    Reasoning effort and verbosity for an agent, with overrides applied.
+    """
+    return {**AGENT_PROFILES.get(agent_name, DEFAULT_PROFILE), **PROFILE_OVERRIDES.get(agent_name, {})}
+
+
+class AgentUsage:
+    """
+    Thread-safe per-agent call counts, token usage and call time.
+    """
+    FIELDS = ("calls", "prompt_tokens", "completion_tokens", "reasoning_tokens", "seconds")
+
+    def __init__(self):
+        self._usage = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent_name, usage, seconds):
+        details = getattr(usage, "completion_tokens_details", None)
+        values = (
+            1,
+            getattr(usage, "prompt_tokens", 0) or 0,
+            getattr(usage, "completion_tokens", 0) or 0,
+            getattr(details, "reasoning_tokens", 0) or 0,
+            seconds,
+        )
+        with self._lock:
+            totals = self._usage.setdefault(agent_name, dict.fromkeys(self.FIELDS, 0))
+            for field, value in zip(self.FIELDS, values):
+                totals[field] += value
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Agent name mapped to its totals plus average seconds and
+                  reasoning tokens per call
+        """
+        with self._lock:
+            return {
+                agent_name: {
+                    **totals,
+                    "seconds": round(totals["seconds"], 2),
+                    "avg_seconds": round(totals["seconds"] / totals["calls"], 2),
+                    "avg_reasoning_tokens": round(totals["reasoning_tokens"] / totals["calls"]),
+                }
+                for agent_name, totals in self._usage.items()
+            }
+
+
+agent_usage = AgentUsage()
+
+
+async def parse_completion(client, agent_name, **request):
+    """
+    Send a structured-output chat completion with the agent's profile and
+    record its usage.
+
+    Args:
+        client: AsyncOpenAI client
+        agent_name: Key in AGENT_PROFILES
+        **request: Arguments for client.beta.chat.completions.parse
+
+    Returns:
+        ParsedChatCompletion: The completion
+    """
+    profile = agent_profile(agent_name)
+    if profile.get("reasoning_effort"):
+        request.setdefault("reasoning_effort", profile["reasoning_effort"])
+    if profile.get("verbosity"):
+        # Not a named parameter in this openai client version
+        request.setdefault("extra_body", {}).setdefault("verbosity", profile["verbosity"])
+
+    start = time.perf_counter()
+    completion = await client.beta.chat.completions.parse(**request)
+    agent_usage.record(agent_name, completion.usage, time.perf_counter() - start)
+    return completion
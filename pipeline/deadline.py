@@ -0,0 +1,118 @@
+"""
+Request Deadlines
+
+A Deadline is created per request and passed through resume_data and
+process_all_agents. Source collection gets a share of the request budget so
+a slow portfolio site or GitHub profile cannot starve the section agents;
+anything still running when its slice runs out is cancelled and reported as
+degraded instead of holding the whole response hostage.
+"""
+import asyncio
+import os
+import time
+
+from dotenv import load_dotenv
+
+from pipeline.metrics import metrics
+
+load_dotenv()
+
+DEFAULT_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "240"))
+
+# Share of the request deadline available to resume, JD and external source collection
+SOURCE_SHARE = float(os.getenv("SOURCE_DEADLINE_SHARE", "0.5"))
+
+
+class DeadlineExceeded(Exception):
+    """
+    Placeholder result for work that was cancelled because its slice ran out.
+    """
+    def __init__(self, name=""):
+        super().__init__(f"{name} cancelled: request deadline exceeded" if name else "request deadline exceeded")
+        self.name = name
+
+
+class Deadline:
+    """
+    Absolute per-request deadline.
+
+    Args:
+        seconds: Total time budget for the request
+    """
+    def __init__(self, seconds: float = DEFAULT_DEADLINE_SECONDS):
+        self.seconds = seconds
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + seconds
+        # Fixed once, so the resume wait and the link collection after it share one slice
+        self.source_end = self.started_at + seconds * SOURCE_SHARE
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def budget(self, share: float = 1.0) -> float:
+        """
+        Time left until `share` of the total budget has passed since the
+        request started, never more than what is left of the request.
+        Stages waiting one after another with the same share end together.
+        """
+        end = min(self.expires_at, self.started_at + self.seconds * share)
+        return max(0.0, end - time.monotonic())
+
+    def source_budget(self) -> float:
+        """
+        Time left until the source collection slice ends.
+        """
+        return max(0.0, min(self.expires_at, self.source_end) - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+async def wait_with_deadline(named_tasks, deadline=None, share=1.0):
+    """
+    Wait for tasks until their slice of the deadline runs out and cancel the rest.
+
+    Args:
+        named_tasks: List of (name, asyncio.Task) pairs
+        deadline: Deadline or None to wait for every task
+        share: Share of the total request budget, counted from the request
+               start, by which these tasks must finish
+
+    Returns:
+        list: Results in the order of named_tasks. Failed tasks give their
+              exception and cancelled tasks give a DeadlineExceeded instance.
+    """
+    tasks = [task for _, task in named_tasks]
+    if not tasks:
+        return []
+
+    timeout = deadline.budget(share) if deadline else None
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+    except BaseException:
+        # The caller was cancelled (e.g. the client disconnected); stop all outstanding work
+        metrics.increment("cancelled_tasks", sum(1 for task in tasks if not task.done()))
+        for task in tasks:
+            task.cancel()
+        raise
+
+    for task in pending:
+        task.cancel()
+    if pending:
+        metrics.increment("deadline_cancellations", len(pending))
+        # Let the cancelled tasks unwind before their results are inspected
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results = []
+    for name, task in named_tasks:
+        if task in pending:
+            print(f"⏰ {name} cancelled: request deadline exceeded")
+            results.append(DeadlineExceeded(name))
+        elif task.cancelled():
+            results.append(DeadlineExceeded(name))
+        elif task.exception() is not None:
+            results.append(task.exception())
+        else:
+            results.append(task.result())
+    return results
@@ -0,0 +1,81 @@
+"""
+Client Disconnect Handling
+
+A resume request runs around twenty LLM calls. When the client goes away
+mid-request (closed tab, client timeout) there is nobody to return the
+result to, so the endpoints run their pipeline stages through a
+DisconnectWatcher that polls the connection and cancels the outstanding
+stage as soon as the client is gone.
+"""
+import asyncio
+import os
+
+from dotenv import load_dotenv
+
+from pipeline.metrics import metrics
+
+load_dotenv()
+
+DISCONNECT_POLL_SECONDS = float(os.getenv("DISCONNECT_POLL_SECONDS", "1.0"))
+
+
+class ClientDisconnected(Exception):
+    """
+    Raised when a stage was cancelled because the client disconnected.
+    """
+    def __init__(self):
+        super().__init__("client disconnected")
+
+
+class DisconnectWatcher:
+    """
+    Runs pipeline stages and cancels them when the client disconnects.
+
+    Args:
+        request: The incoming starlette Request
+        poll_interval: Seconds between connection checks
+    """
+    def __init__(self, request, poll_interval: float = DISCONNECT_POLL_SECONDS):
+        self.request = request
+        self.poll_interval = poll_interval
+        self.disconnected = False
+
+    def _mark_disconnected(self):
+        if not self.disconnected:
+            self.disconnected = True
+            metrics.increment("client_disconnects")
+            print(f"🔌 Client disconnected from {self.request.url.path}, cancelling pipeline work")
+
+    async def run(self, awaitable):
+        """
+        Await a coroutine, task or future while watching the connection.
+
+        Returns:
+            The result of the awaitable
+
+        Raises:
+            ClientDisconnected: The client went away and the work was cancelled
+        """
+        task = asyncio.ensure_future(awaitable)
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.poll_interval)
+                if done:
+                    return task.result()
+                if await self.request.is_disconnected():
+                    self._mark_disconnected()
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    raise ClientDisconnected()
+        except BaseException:
+            task.cancel()
+            raise
+
+    async def checkpoint(self):
+        """
+        Raise ClientDisconnected if the client is already gone. Used before
+        blocking steps that cannot be cancelled once started.
+        """
+        if self.disconnected or await self.request.is_disconnected():
+            self._mark_disconnected()
+            raise ClientDisconnected()
@@ -0,0 +1,132 @@
+"""
+Disk Store
+
+Pickle-per-key directory shared by the result store (pipeline/result_store.py)
+and the GitHub and portfolio caches (Scraper/github_cache.py,
+Scraper/portfolio_cache.py):
+- entries are dicts pickled one file per key, grouped in one subdirectory
+  per kind
+- writes go to a temporary file that replaces the entry, so readers never
+  see a partial pickle
+- an entry whose timestamp field is older than the TTL is deleted when read,
+  and evict_expired sweeps every entry not written within the TTL
+
+evict_periodically runs the sweep for each store at API startup and then
+every RESUME_CACHE_EVICT_INTERVAL seconds.
+"""
+import asyncio
+import os
+import pickle
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EVICT_INTERVAL_SECONDS = int(os.getenv("RESUME_CACHE_EVICT_INTERVAL", "3600"))
+
+
+class DiskStore:
+    """
+    Pickle-per-key store with TTL eviction.
+
+    Args:
+        root_dir: Directory holding the entries
+        ttl_seconds: Entry lifetime in seconds
+        kinds: Subdirectory names, one per kind of entry ("" for root_dir itself)
+        timestamp_field: Entry field holding the time the TTL counts from
+        label: Entry name used in warnings
+    """
+    def __init__(self, root_dir: str, ttl_seconds: int, kinds=("",), timestamp_field: str = "validated_at", label: str = "entry"):
+        self.root_dir = root_dir
+        self.ttl_seconds = ttl_seconds
+        self.kinds = tuple(kinds)
+        self.timestamp_field = timestamp_field
+        self.label = label
+
+    def _path(self, kind: str, key: str) -> str:
+        return os.path.join(self.root_dir, kind, f"{key}.pkl")
+
+    def load(self, kind: str, key: str):
+        """
+        Return the stored entry for a key, or None when missing or expired.
+        """
+        path = self._path(kind, key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not read {self.label} {path}: {e}")
+            return None
+
+        if time.time() - entry.get(self.timestamp_field, 0) > self.ttl_seconds:
+            self.delete(kind, key)
+            return None
+        return entry
+
+    def save(self, kind: str, key: str, entry: dict):
+        path = self._path(kind, key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Warning: Could not store {self.label} {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def delete(self, kind: str, key: str):
+        try:
+            os.remove(self._path(kind, key))
+        except FileNotFoundError:
+            pass
+
+    def evict_expired(self) -> int:
+        """
+        Remove every entry not written within the TTL.
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        now = time.time()
+        for kind in self.kinds:
+            kind_dir = os.path.join(self.root_dir, kind)
+            if not os.path.isdir(kind_dir):
+                continue
+            for filename in os.listdir(kind_dir):
+                if not filename.endswith(".pkl"):
+                    continue
+                path = os.path.join(kind_dir, filename)
+                try:
+                    if now - os.path.getmtime(path) > self.ttl_seconds:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
+
+
+async def evict_periodically(stores, interval: int = EVICT_INTERVAL_SECONDS):
+    """
+    Remove expired entries from each store now and then every interval seconds.
+
+    Args:
+        stores: DiskStore objects
+        interval: Seconds between sweeps
+    """
+    while True:
+        for store in stores:
+            try:
+                removed = await asyncio.to_thread(store.evict_expired)
+            except Exception as e:
+                print(f"Warning: Could not evict expired entries from {type(store).__name__}: {e}")
+                continue
+            if removed:
+                print(f"🧹 Removed {removed} expired entries from {type(store).__name__}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,1304 @@
+"""
+Resume Pipeline Engine
+
+This module contains the single pipeline engine shared by the standard and
+ATS endpoints, for both uploaded files and pasted resume text.
+
+The engine is built from three pluggable pieces:
+- an input adapter that turns the request's resume source into text
+  (FileResumeInput for uploads, TextResumeInput for pasted text)
+- the external source collectors (LinkedIn, GitHub, portfolio, other link)
+- the section agents, each of which has a general (Multiagent) and an
+  ATS-optimized (Atsagent) implementation; the ATS implementation is used
+  whenever job description data is passed to process_all_agents
+
+processing.py, processing_txt.py, ats_processing.py and ats_processing_text.py
+are thin wrappers around a configured ResumePipeline instance.
+"""
+import asyncio
+import os
+import re
+
+from Multiagent.Basic_Information_agent import analyze_basic_information
+from Multiagent.Experience_agent import analyze_experience
+from Multiagent.Education_agent import analyze_education
+from Multiagent.Skills_agent import analyze_skills
+from Multiagent.Languages_agent import analyze_languages, Step as LanguagesStep
+from Multiagent.Projects_agent import analyze_projects, Step as ProjectsStep
+from Multiagent.Certifications_agent import analyze_certifications, Step as CertificationsStep
+from Multiagent.Achievements_agent import analyze_achievements, Step as AchievementsStep
+from Multiagent.Consolidated_agent import analyze_all_sections, Step as ConsolidatedStep
+
+from Atsagent.Ats_basic_Information_agent import analyze_basic_information as ats_analyze_basic_information
+from Atsagent.Ats_experience_agent import analyze_experience as ats_analyze_experience
+from Atsagent.Ats_education_agent import analyze_education as ats_analyze_education
+from Atsagent.Ats_skills_agent import analyze_skills as ats_analyze_skills
+from Atsagent.Ats_languages_agent import analyze_languages as ats_analyze_languages, Step as AtsLanguagesStep
+from Atsagent.Ats_projects_agent import analyze_projects as ats_analyze_projects, Step as AtsProjectsStep
+from Atsagent.Ats_certifications_agent import analyze_certifications as ats_analyze_certifications, Step as AtsCertificationsStep
+from Atsagent.Ats_achievements_agent import analyze_achievements as ats_analyze_achievements, Step as AtsAchievementsStep
+
+#linkedin_agent
+from linkedin_agent.LinkedIn_Basic_Info_position_agent import analyze_basic_info_position
+from linkedin_agent.LinkedIn_experience_agent import linkedin_analyze_experience
+from linkedin_agent.LinkedIn_eduction_agent import analyze_linkedin_education
+from linkedin_agent.LinkedIn_certification_language_agent import analyze_linkedin_certification_language
+from linkedin_agent.LinkedIn_project import analyze_linkedin_projects
+
+from Scraper.github_scraper import fetch_github_profile_info
+from Scraper.github_tokens import GitHubRateLimited
+from Agent.github_agent import analyze_github_profile
+from Scraper.portfolio_crawler import PORTFOLIO_MAX_PAGES, crawl_portfolio
+from Scraper.portfolio_cache import portfolio_cache
+from Agent.protflow_agent import analyze_portfolio_website
+from Scraper.resume_scraper import get_resume_content
+from Scraper.contact_extractor import extract_contact_facts
+from Agent.resume_agent import analyze_resume
+from Agent.resume_experince_agent import analyze_resume_Experience
+from Agent.jd_agent import analyze_jd
+from pipeline.result_store import content_hash
+from pipeline.prompt_format import compact
+from pipeline.token_budget import SOURCE_FIELD_TOKENS
+from pipeline.github_digest import build_github_digest
+from pipeline.deadline import DeadlineExceeded, SOURCE_SHARE, wait_with_deadline
+from pipeline.metrics import metrics
+
+# Combined section input size (characters) below which short resumes without
+# external sources are analyzed with one consolidated call; 0 disables it
+CONSOLIDATED_MAX_INPUT_CHARS = int(os.getenv("CONSOLIDATED_MAX_INPUT_CHARS", "12000"))
+
+# Start the section agents on resume-only data while external sources load
+SPECULATIVE_ANALYSIS = os.getenv("SPECULATIVE_ANALYSIS", "true").lower() == "true"
+
+# Copy fields known verbatim (resume contact details) into agent results instead of generating them
+ECHO_UNCHANGED_FIELDS = os.getenv("ECHO_UNCHANGED_FIELDS", "true").lower() == "true"
+
+
+class FileResumeInput:
+    """
+    Input adapter for uploaded resume files. The file is converted to text
+    with MarkItDown in a worker thread so the event loop is not blocked.
+    """
+    name = "file"
+
+    async def load(self, resume_source):
+        return await asyncio.to_thread(get_resume_content, resume_source)
+
+
+class TextResumeInput:
+    """
+    Input adapter for resumes submitted as plain text; the text is used as-is.
+    """
+    name = "text"
+
+    async def load(self, resume_source):
+        return resume_source
+
+
+class BasicInformationData:
+    """
+    Structured container for all data collected from the resume and the
+    external sources. Section agents read their inputs from this object.
+    """
+    def __init__(self, resume=None, linkedin=None, github=None, protflow_summary="", other_link_summary="", degraded_sources=None, stale_sources=None):
+        resume = resume or {}
+        linkedin = linkedin or {}
+        github = github or {}
+
+        # Resume data
+        self.Resume_SuggestedRole = resume.get('suggested_role', "")
+        self.Resume_CandidateFullName = resume.get('full_name', "")
+        self.Resume_EmailAddress = resume.get('email', "")
+        self.Resume_PhoneNumber = resume.get('phone', "")
+        self.Resume_ProfessionalTitle = resume.get('professional_title', "")
+        self.Resume_Summary = resume.get('summary', "")
+        self.Resume_Experience = resume.get('experience', [])
+        self.Resume_Education = resume.get('education', [])
+        self.Resume_Languages = resume.get('languages', [])
+        self.Resume_Projects = resume.get('projects', [])
+        self.Resume_Certifications = resume.get('certifications', [])
+        self.Resume_Achievements = resume.get('achievements', [])
+        self.Resume_Skills = resume.get('skills', [])
+        self.Resume_Experience_in_years = resume.get('experience_in_years', "")
+        self.Resume_Links = resume.get('links', [])
+
+        # LinkedIn data
+        self.linkedin_basic_information_data = linkedin.get('basic_information')
+        self.linkedin_Professional_Summary = linkedin.get('professional_summary')
+        self.linkedin_Experience = linkedin.get('experience')
+        self.linkedin_Education = linkedin.get('education')
+        self.linkedin_Projects = linkedin.get('projects')
+        self.linkedin_Languages = linkedin.get('languages')
+
+        # GitHub data
+        self.github_overall_analysis_data = github.get('overall_analysis', "")
+        self.github_summary_of_all_repositories = github.get('summary_repositories', "")
+        self.github_skills_data = github.get('skills', [])
+
+        # Portfolio and other links data
+        self.protflow_summary = protflow_summary
+        self.other_link_summary = other_link_summary
+
+        # Sources cancelled because they missed their deadline slice
+        self.degraded_sources = degraded_sources or []
+        # Sources served from cache or skipped because their API rate limit was used up
+        self.stale_sources = stale_sources or []
+
+    def has_external_sources(self):
+        """
+        True when any LinkedIn, GitHub, portfolio or other link data was collected.
+        """
+        return any([
+            self.linkedin_basic_information_data, self.linkedin_Professional_Summary,
+            self.linkedin_Experience, self.linkedin_Education, self.linkedin_Projects,
+            self.linkedin_Languages, self.github_overall_analysis_data,
+            self.github_summary_of_all_repositories, self.github_skills_data,
+            self.protflow_summary, self.other_link_summary,
+        ])
+
+
+def _empty_resume_result(error=None):
+    return {
+        'suggested_role': "",
+        'full_name': "",
+        'email': "",
+        'phone': "",
+        'professional_title': "",
+        'summary': "",
+        'experience': [],
+        'education': [],
+        'languages': [],
+        'projects': [],
+        'certifications': [],
+        'achievements': [],
+        'skills': [],
+        'links': [],
+        'tokens': 0,
+        'error': error
+    }
+
+
+def _empty_jd_result(error=None):
+    return {
+        'job_title': "",
+        'hard_skills': [],
+        'soft_skills': [],
+        'tools_and_technologies': [],
+        'responsibilities': [],
+        'required_qualifications': [],
+        'preferred_qualifications': [],
+        'action_verbs': [],
+        'tokens': 0,
+        'error': error
+    }
+
+
+async def collect_linkedin_data(linkedin_profile_data):
+    try:
+        linkedin_profile_data = await asyncio.to_thread(get_resume_content, linkedin_profile_data)
+
+        (
+            (linkedin_profile_basic_info_data, linkedin_profile_basic_info_tokens),
+            (linkedin_profile_experience_data, linkedin_profile_experience_tokens),
+            (linkedin_profile_education_data, linkedin_profile_education_tokens),
+            (linkedin_profile_certification_language_data, linkedin_profile_certification_language_tokens),
+            (linkedin_profile_projects_data, linkedin_profile_projects_tokens)
+
+        ) = await asyncio.gather(
+            analyze_basic_info_position(linkedin_profile_data),
+            linkedin_analyze_experience(linkedin_profile_data),
+            analyze_linkedin_education(linkedin_profile_data),
+            analyze_linkedin_certification_language(linkedin_profile_data),
+            analyze_linkedin_projects(linkedin_profile_data)
+        )
+        return {
+            'basic_information': linkedin_profile_basic_info_data.basic_info if linkedin_profile_basic_info_data else None,
+            'professional_summary': linkedin_profile_basic_info_data.basic_info.position if linkedin_profile_basic_info_data and linkedin_profile_basic_info_data.basic_info else "",
+            'experience': linkedin_profile_experience_data.data.experience if linkedin_profile_experience_data and linkedin_profile_experience_data.data else [],
+            'education': (linkedin_profile_education_data.data.education if linkedin_profile_education_data and linkedin_profile_education_data.data else []) + (linkedin_profile_certification_language_data.data.certifications if linkedin_profile_certification_language_data and linkedin_profile_certification_language_data.data else []),
+            'projects': linkedin_profile_projects_data.data.projects if linkedin_profile_projects_data and linkedin_profile_projects_data.data else [],
+            'languages': linkedin_profile_certification_language_data.data.languages if linkedin_profile_certification_language_data and linkedin_profile_certification_language_data.data else [],
+            'tokens': linkedin_profile_basic_info_tokens + linkedin_profile_experience_tokens + linkedin_profile_education_tokens + linkedin_profile_certification_language_tokens + linkedin_profile_projects_tokens,
+            'error': None
+        }
+    except Exception as e:
+        print(f"LinkedIn processing error: {e}")
+        return {
+            'basic_information': None,
+            'professional_summary': None,
+            'experience': None,
+            'education': None,
+            'projects': None,
+            'languages': None,
+            'error': str(e)
+        }
+
+
+async def collect_github_data(github_profile_link):
+    """
+    Collect GitHub profile data and summarize it with the GitHub agent.
+
+    Args:
+        github_profile_link: GitHub profile URL
+
+    Returns:
+        dict: Dictionary containing GitHub data or empty values if error.
+              'stale' is set when the GitHub rate limit was used up and the
+              profile came from the cache, was cut short or could not be fetched.
+    """
+    try:
+        github_profile_data = await fetch_github_profile_info(github_profile_link)
+        stale = bool(github_profile_data and github_profile_data.pop('stale', False))
+        if stale:
+            github_profile_data.pop('rate_limit_reset_in', None)
+        # Only the locally computed digest (totals, languages, cadence, top repositories) goes to the agent
+        github_profile_data = build_github_digest(github_profile_data)
+        github_profile_data_clean, github_tokens = await analyze_github_profile(compact(github_profile_data))
+
+        # Extract data from the analysis object
+        if github_profile_data_clean and github_profile_data_clean.analysis:
+            return {
+                'overall_analysis': github_profile_data_clean.analysis.overall_analysis,
+                'summary_repositories': github_profile_data_clean.analysis.summary_of_all_repositories,
+                'skills': github_profile_data_clean.analysis.skills,
+                'tokens': github_tokens,
+                'stale': stale,
+                'error': None
+            }
+        else:
+            return {
+                'overall_analysis': "",
+                'summary_repositories': "",
+                'skills': [],
+                'tokens': 0,
+                'stale': stale,
+                'error': None
+            }
+    except GitHubRateLimited as e:
+        print(f"⚠️ GitHub processing skipped: {e}")
+        return {
+            'overall_analysis': "",
+            'summary_repositories': "",
+            'skills': [],
+            'tokens': 0,
+            'stale': True,
+            'error': str(e)
+        }
+    except Exception as e:
+        print(f"GitHub processing error: {e}")
+        return {
+            'overall_analysis': "",
+            'summary_repositories': "",
+            'skills': [],
+            'tokens': 0,
+            'error': str(e)
+        }
+
+
+async def collect_link_summary(link, source_label="Portfolio", max_pages=PORTFOLIO_MAX_PAGES):
+    """
+    Crawl a website and summarize it with the portfolio agent. Used for both
+    the portfolio link and the "other" link.
+
+    Args:
+        link: Website URL
+        source_label: Label used in log messages
+        max_pages: Pages of the site to read (1 reads only the linked page)
+
+    Returns:
+        dict: Dictionary containing the summary or empty values if error
+    """
+    try:
+        link_data, crawl_stats = await crawl_portfolio(link, max_pages=max_pages)
+        if crawl_stats["fetched"] > 1:
+            print(f"🕸️ {source_label}: {crawl_stats['pages']} pages merged from {crawl_stats['fetched']} fetched "
+                  f"({crawl_stats['duplicates']} duplicates)")
+        # Identical site text reuses the stored summary instead of another agent call
+        link_data_clean, link_tokens = await portfolio_cache.get_summary(analyze_portfolio_website, link_data)
+
+        if link_data_clean and link_data_clean.analysis:
+            return {
+                'summary': link_data_clean.analysis.summary_of_portfolio,
+                'tokens': link_tokens,
+                'error': None
+            }
+        else:
+            return {
+                'summary': "",
+                'tokens': 0,
+                'error': None
+            }
+    except Exception as e:
+        print(f"{source_label} processing error: {e}")
+        return {
+            'summary': "",
+            'tokens': 0,
+            'error': str(e)
+        }
+
+
+async def collect_portfolio_data(protflow_profile_link):
+    return await collect_link_summary(protflow_profile_link, "Portfolio")
+
+
+async def collect_other_link_data(other_link):
+    # Other links are often a single article or profile page on a large site
+    return await collect_link_summary(other_link, "Other link", max_pages=1)
+
+
+async def collect_resume_data(resume_text):
+    """
+    Run the resume extraction agents over already-loaded resume text.
+    Contact details, links and dates are extracted locally first and passed
+    to the resume agent as verified facts.
+
+    Args:
+        resume_text: Resume text produced by the input adapter
+
+    Returns:
+        dict: Dictionary containing resume data and tokens
+    """
+    facts = extract_contact_facts(resume_text)
+    try:
+        (
+            (resume_profile_data_clean, resume_tokens),
+            (resume_experience_data, resume_experience_total_token)
+        ) = await asyncio.gather(
+            analyze_resume(resume_text, facts),
+            analyze_resume_Experience(resume_text)
+        )
+
+        # Extract data from the first step (assuming there's at least one step)
+        if resume_profile_data_clean and resume_profile_data_clean.steps:
+            resume_step = resume_profile_data_clean.steps[0]
+
+            return {
+                'suggested_role': resume_step.SuggestedRole,
+                # The extracted name and phone are hints; the model's reading wins
+                'full_name': resume_step.CandidateFullName or facts['full_name'],
+                'email': facts['email'] or getattr(resume_step, 'EmailAddress', ""),
+                'phone': resume_step.PhoneNumber or facts['phone'],
+                'professional_title': resume_step.ProfessionalTitle,
+                'summary': resume_step.Summary,
+                'experience': resume_experience_data,
+                'experience_in_years': resume_step.YearsOfExperienceRequired,
+                'education': resume_step.Education,
+                'languages': resume_step.Languages,
+                'projects': resume_step.Projects,
+                'certifications': resume_step.Certifications,
+                'achievements': resume_step.Achievements,
+                'skills': resume_step.Skills,
+                'links': facts['urls'],
+                'tokens': resume_tokens + resume_experience_total_token,
+                'error': None
+            }
+        else:
+            # Fallback values if no data is returned
+            return _with_contact_facts(_empty_resume_result(), facts)
+    except Exception as e:
+        print(f"Resume processing error: {e}")
+        return _with_contact_facts(_empty_resume_result(str(e)), facts)
+
+
+def _with_contact_facts(resume_result, facts):
+    # The locally extracted details survive a failed resume agent call
+    resume_result.update(full_name=facts['full_name'], email=facts['email'], phone=facts['phone'], links=facts['urls'])
+    return resume_result
+
+
+async def collect_jd_data(job_description, deadline=None):
+    """
+    Extract structured job description data with the JD agent.
+    With a deadline, the extraction is cancelled once the source collection
+    slice runs out and empty JD data is returned.
+    """
+    try:
+        timeout = deadline.source_budget() if deadline else None
+        jd_data, jd_tokens = await asyncio.wait_for(analyze_jd(job_description), timeout)
+        if jd_data and jd_data.analysis:
+            jd_step = jd_data.analysis
+            return {
+                'job_title': jd_step.job_title,
+                'hard_skills': jd_step.hard_skills,
+                'soft_skills': jd_step.soft_skills,
+                'tools_and_technologies': jd_step.tools_and_technologies,
+                'responsibilities': jd_step.responsibilities,
+                'required_qualifications': jd_step.required_qualifications,
+                'preferred_qualifications': jd_step.preferred_qualifications,
+                'action_verbs': jd_step.action_verbs,
+                'tokens': jd_tokens,
+                'error': None
+            }
+        else:
+            # Fallback values if no data is returned
+            return _empty_jd_result()
+    except Exception as e:
+        print(f"Job description processing error: {e}")
+        return _empty_jd_result(str(e))
+
+
+def build_basic_information_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive basic information:
+
+        **Resume Data:**
+        - Suggested Role: {compact(Basic_Information.Resume_SuggestedRole)}
+        - Full Name: {compact(Basic_Information.Resume_CandidateFullName)}
+        - Email: {compact(Basic_Information.Resume_EmailAddress)}
+        - Phone: {compact(Basic_Information.Resume_PhoneNumber)}
+        - Professional Title: {compact(Basic_Information.Resume_ProfessionalTitle)}
+        - Experience in Years: {compact(Basic_Information.Resume_Experience_in_years)}
+        - Summary: {compact(Basic_Information.Resume_Summary)}
+        - Links: {compact(Basic_Information.Resume_Links)}
+
+        Email, phone and links above were copied directly from the resume text; keep them unless LinkedIn clearly has a more complete version.
+
+
+        **LinkedIn Profile Data:**
+        - Basic Information: {compact(Basic_Information.linkedin_basic_information_data)}
+        - Professional Summary: {compact(Basic_Information.linkedin_Professional_Summary)}
+
+        Please analyze these sources, identify any discrepancies, and provide the most accurate and comprehensive basic information with proper suggestions for role suitability.
+        """
+
+
+def build_experience_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive experience information:
+
+        **Resume Experience Data:**
+        {compact(Basic_Information.Resume_Experience)}
+
+        **LinkedIn Experience Data:**
+        {compact(Basic_Information.linkedin_Experience)}
+
+        **GitHub Experience Data:**
+        {compact(Basic_Information.github_overall_analysis_data, SOURCE_FIELD_TOKENS)}
+        {compact(Basic_Information.github_summary_of_all_repositories, SOURCE_FIELD_TOKENS)}
+
+        **Portfolio Experience Data:**
+        {compact(Basic_Information.protflow_summary, SOURCE_FIELD_TOKENS)}
+
+        **Other Link Experience Data:**
+        {compact(Basic_Information.other_link_summary, SOURCE_FIELD_TOKENS)}
+
+        Please analyze these sources, cross-reference the experience information, and provide accurate, comprehensive, and well-structured experience data.
+        """
+
+
+def build_education_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive education information:
+
+        **Resume Education Data:**
+        {compact(Basic_Information.Resume_Education)}
+
+        **LinkedIn Education Data:**
+        {compact(Basic_Information.linkedin_Education)}
+
+        **Portfolio Education Data:**
+        {compact(Basic_Information.protflow_summary, SOURCE_FIELD_TOKENS)}
+
+        **Other Link Education Data:**
+        {compact(Basic_Information.other_link_summary, SOURCE_FIELD_TOKENS)}
+
+        Please analyze these sources, cross-reference the education information, and provide accurate, comprehensive, and well-structured education data.
+        """
+
+
+def build_skills_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive skills information:
+
+        **Resume Skills Data:**
+        {compact(Basic_Information.Resume_Skills)}
+
+        **GitHub Skills Data:**
+        {compact(Basic_Information.github_skills_data)}
+
+        **Portfolio Skills Data:**
+        {compact(Basic_Information.protflow_summary, SOURCE_FIELD_TOKENS)}
+
+        Please analyze these sources, identify technical and soft skills, categorize them appropriately, and provide accurate, comprehensive, and well-structured skills data.
+        """
+
+
+def build_languages_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive languages information:
+
+        **Resume Languages Data:**
+        {compact(Basic_Information.Resume_Languages)}
+
+        **LinkedIn Languages Data:**
+        {compact(Basic_Information.linkedin_Languages)}
+
+        **Portfolio Languages Information:**
+        - Portfolio Summary: {compact(Basic_Information.protflow_summary, SOURCE_FIELD_TOKENS)}
+
+        Please analyze these sources, cross-reference language proficiency levels, and provide accurate, comprehensive, and well-structured languages data.
+        """
+
+
+def build_projects_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive projects information:
+
+        **Resume Projects Data:**
+        {compact(Basic_Information.Resume_Projects)}
+
+        **LinkedIn Projects Data:**
+        {compact(Basic_Information.linkedin_Projects)}
+
+        **GitHub Repository Analysis:**
+        - Repository Summary: {compact(Basic_Information.github_summary_of_all_repositories, SOURCE_FIELD_TOKENS)}
+        - Overall Analysis: {compact(Basic_Information.github_overall_analysis_data, SOURCE_FIELD_TOKENS)}
+
+        Please analyze these sources, cross-reference project information, identify technologies used, and provide accurate, comprehensive, and well-structured projects data.
+        """
+
+
+def build_certifications_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive certifications information:
+
+        **Resume Certifications Data:**
+        {compact(Basic_Information.Resume_Certifications)}
+
+        **LinkedIn Certifications Data:**
+        {compact(Basic_Information.linkedin_Education)}
+
+        **Portfolio Certifications Information:**
+        - Portfolio Summary: {compact(Basic_Information.protflow_summary, SOURCE_FIELD_TOKENS)}
+
+        **Other Sources:**
+        - Other Link Summary: {compact(Basic_Information.other_link_summary, SOURCE_FIELD_TOKENS)}
+
+        Please analyze these sources, verify certification details, and provide accurate, comprehensive, and well-structured certifications data.
+        """
+
+
+def build_achievements_input(Basic_Information):
+    return f"""
+        Please analyze and compare the following information from multiple sources to create accurate and comprehensive achievements information:
+
+        **Resume Achievements Data:**
+        {compact(Basic_Information.Resume_Achievements)}
+
+        **LinkedIn Achievements Data:**
+        {compact(Basic_Information.linkedin_Education)}
+
+        **Portfolio Achievements Information:**
+        - Portfolio Summary: {compact(Basic_Information.protflow_summary, SOURCE_FIELD_TOKENS)}
+
+        **Other Sources:**
+        - Other Link Summary: {compact(Basic_Information.other_link_summary, SOURCE_FIELD_TOKENS)}
+
+        Please analyze these sources, identify notable achievements and recognitions, and provide accurate, comprehensive, and well-structured achievements data.
+        """
+
+
+# How a section result was produced
+RAN = "ran"
+REUSED = "reused"
+SKIPPED = "skipped"
+
+
+def _comparable(value):
+    """
+    Contact value without case, spaces and punctuation, so "+1 (415) 555-0132"
+    and "+1 415 555 0132" compare equal.
+    """
+    return re.sub(r"\W", "", value).lower()
+
+
+class SectionAgent:
+    """
+    Description of one resume section agent.
+
+    Args:
+        name: Key used for the section in analysis_results
+        build_input: Function building the agent prompt from Basic_Information
+        analyze: General (Multiagent) analysis function
+        ats_analyze: ATS-optimized (Atsagent) analysis function
+        jd_fields: JD fields passed to the ATS agent. A tuple builds a jd_input
+            dict, a single string passes that JD value directly and None means
+            the ATS agent does not use the job description.
+        input_fields: Basic_Information fields build_input reads. When given,
+            the agent is skipped if all of them are empty (optional sections
+            such as certifications on a junior resume).
+        empty_steps: (general Step model, ATS Step model) returned for a
+            skipped agent, with every list field empty
+        echo_fields: Output fields mapped to (Basic_Information field holding
+            the value copied verbatim from the resume, extract_contact_facts
+            key). When all are known they are passed to the agent as
+            echoed_fields and left out of the generated output.
+        echo_conflicts: Basic_Information fields of other sources that may
+            hold their own value for the echoed fields. When one of them has a
+            different value, nothing is echoed and the agent chooses.
+    """
+    def __init__(self, name, build_input, analyze, ats_analyze, jd_fields=None, input_fields=None, empty_steps=None, echo_fields=None, echo_conflicts=()):
+        self.name = name
+        self.build_input = build_input
+        self.analyze = analyze
+        self.ats_analyze = ats_analyze
+        self.jd_fields = jd_fields
+        self.input_fields = input_fields
+        self.empty_steps = empty_steps
+        self.echo_fields = echo_fields
+        self.echo_conflicts = echo_conflicts
+
+    def has_input(self, Basic_Information):
+        """
+        False when every source field this agent reads is empty, so a model
+        call could only return an empty section.
+        """
+        if not self.input_fields:
+            return True
+        return any(compact(getattr(Basic_Information, field, None)) for field in self.input_fields)
+
+    def empty_result(self, jd_data=None):
+        step_model = self.empty_steps[0 if jd_data is None else 1]
+        return step_model(**{field: [] for field in step_model.model_fields})
+
+    def jd_input(self, jd_data):
+        if isinstance(self.jd_fields, str):
+            return jd_data.get(self.jd_fields, '')
+        return {field: jd_data.get(field, []) for field in self.jd_fields}
+
+    def echoed_fields(self, Basic_Information):
+        if not (ECHO_UNCHANGED_FIELDS and self.echo_fields):
+            return {}
+        echoed = {field: getattr(Basic_Information, source, "") for field, (source, _) in self.echo_fields.items()}
+        if not all(echoed.values()):
+            return {}
+        other_sources = " ".join(compact(getattr(Basic_Information, field, None)) for field in self.echo_conflicts)
+        if other_sources.strip():
+            facts = extract_contact_facts(other_sources)
+            for field, (_, fact) in self.echo_fields.items():
+                if facts[fact] and _comparable(facts[fact]) != _comparable(echoed[field]):
+                    return {}
+        return echoed
+
+    async def run(self, Basic_Information, jd_data=None):
+        """
+        Run the section agent and return (analysis, agent_tokens).
+        """
+        agent_input = self.build_input(Basic_Information)
+        echoed = self.echoed_fields(Basic_Information)
+        options = {'echoed_fields': echoed} if echoed else {}
+        if jd_data is None:
+            analysis, tokens = await self.analyze(agent_input, **options)
+        elif self.jd_fields is None:
+            analysis, tokens = await self.ats_analyze(agent_input, **options)
+        else:
+            analysis, tokens = await self.ats_analyze(agent_input, self.jd_input(jd_data), **options)
+
+        if analysis:
+            return (analysis.steps[0] if analysis.steps else None), tokens
+        return None, tokens
+
+    def fingerprint(self, Basic_Information, jd_data=None):
+        """
+        Hash everything this agent's output depends on: the mode, the section
+        field group rendered into the agent input and the JD fields it uses.
+        Unchanged sections of an edited resume keep the same fingerprint.
+        """
+        mode = "general" if jd_data is None else "ats"
+        jd_part = repr(self.jd_input(jd_data)) if jd_data is not None and self.jd_fields is not None else None
+        return content_hash(mode, self.name, self.build_input(Basic_Information), jd_part)
+
+
+SECTION_AGENTS = [
+    SectionAgent('basic_information', build_basic_information_input,
+                 analyze_basic_information, ats_analyze_basic_information,
+                 jd_fields='job_title',
+                 echo_fields={'EmailAddress': ('Resume_EmailAddress', 'email'),
+                              'PhoneNumber': ('Resume_PhoneNumber', 'phone')},
+                 echo_conflicts=('linkedin_basic_information_data', 'linkedin_Professional_Summary')),
+    SectionAgent('experience', build_experience_input,
+                 analyze_experience, ats_analyze_experience,
+                 jd_fields=('hard_skills', 'tools_and_technologies', 'responsibilities', 'action_verbs')),
+    SectionAgent('education', build_education_input,
+                 analyze_education, ats_analyze_education,
+                 jd_fields=('required_qualifications',)),
+    SectionAgent('skills', build_skills_input,
+                 analyze_skills, ats_analyze_skills,
+                 jd_fields=('hard_skills', 'soft_skills', 'tools_and_technologies')),
+    SectionAgent('languages', build_languages_input,
+                 analyze_languages, ats_analyze_languages,
+                 input_fields=('Resume_Languages', 'linkedin_Languages', 'protflow_summary'),
+                 empty_steps=(LanguagesStep, AtsLanguagesStep)),
+    SectionAgent('projects', build_projects_input,
+                 analyze_projects, ats_analyze_projects,
+                 jd_fields=('hard_skills', 'tools_and_technologies', 'preferred_qualifications'),
+                 input_fields=('Resume_Projects', 'linkedin_Projects',
+                               'github_summary_of_all_repositories', 'github_overall_analysis_data'),
+                 empty_steps=(ProjectsStep, AtsProjectsStep)),
+    SectionAgent('certifications', build_certifications_input,
+                 analyze_certifications, ats_analyze_certifications,
+                 jd_fields=('preferred_qualifications', 'required_qualifications'),
+                 input_fields=('Resume_Certifications', 'linkedin_Education', 'protflow_summary', 'other_link_summary'),
+                 empty_steps=(CertificationsStep, AtsCertificationsStep)),
+    SectionAgent('achievements', build_achievements_input,
+                 analyze_achievements, ats_analyze_achievements,
+                 jd_fields=('soft_skills', 'action_verbs'),
+                 input_fields=('Resume_Achievements', 'linkedin_Education', 'protflow_summary', 'other_link_summary'),
+                 empty_steps=(AchievementsStep, AtsAchievementsStep)),
+]
+
+
+def build_consolidated_input(Basic_Information, sections=None):
+    """
+    Combine the section agent inputs into the single consolidated agent input.
+    """
+    sections = sections if sections is not None else SECTION_AGENTS
+    return "\n".join(
+        f"### {section.name}\n{section.build_input(Basic_Information)}" for section in sections
+    )
+
+
+def section_fingerprints(Basic_Information, jd_data=None, sections=None):
+    """
+    Fingerprint every section field group of a Basic_Information object.
+
+    Returns:
+        dict: Section name mapped to the hash of its agent input
+    """
+    sections = sections if sections is not None else SECTION_AGENTS
+    return {section.name: section.fingerprint(Basic_Information, jd_data) for section in sections}
+
+
+class ResumePipeline:
+    """
+    Resume analysis pipeline: source collection followed by the section agents.
+
+    Args:
+        input_adapter: Adapter turning the resume source into text
+            (FileResumeInput or TextResumeInput)
+        sections: Section agents to run (defaults to SECTION_AGENTS)
+        store: Optional ResumeStore. Section results are reused for any
+            section whose fingerprint is unchanged, and Basic_Information is
+            reused when a known resume fingerprint is passed to resume_data.
+        consolidated_max_chars: Combined section input size up to which the
+            general agents run as one consolidated call (0 disables it)
+        speculative: Let run_analysis start the section agents on resume-only
+            data while external sources are still loading
+    """
+    def __init__(self, input_adapter=None, sections=None, store=None, consolidated_max_chars=CONSOLIDATED_MAX_INPUT_CHARS, speculative=SPECULATIVE_ANALYSIS):
+        self.input_adapter = input_adapter or FileResumeInput()
+        self.sections = sections if sections is not None else SECTION_AGENTS
+        self.store = store
+        self.consolidated_max_chars = consolidated_max_chars
+        self.speculative = speculative
+
+    async def collect_resume(self, resume_source):
+        try:
+            resume_text = await self.input_adapter.load(resume_source)
+        except Exception as e:
+            print(f"Resume processing error: {e}")
+            return _empty_resume_result(str(e))
+        return await collect_resume_data(resume_text)
+
+    async def resume_data(self, resume_source, linkedin_profile_link=None, github_profile_link=None, other_link=None, protflow_profile_link=None, fingerprint=None, deadline=None):
+        """
+        Collect and process data from all sources (resume, LinkedIn, GitHub, portfolio, other links) using concurrent processing.
+
+        Args:
+            resume_source: Resume file path or resume text, depending on the input adapter
+            linkedin_profile_link: LinkedIn profile file (optional)
+            github_profile_link: GitHub profile URL (optional)
+            other_link: Other relevant link URL (optional)
+            protflow_profile_link: Portfolio link URL (optional)
+            fingerprint: Resume fingerprint from result_store.resume_fingerprint (optional)
+            deadline: Request Deadline (optional). Sources still running when the
+                source slice runs out are cancelled and listed in
+                Basic_Information.degraded_sources.
+
+        Returns:
+            tuple: (Basic_Information_object, resume_tokens, github_tokens, protflow_tokens, other_link_tokens)
+        """
+        if self.store and fingerprint:
+            Basic_Information = await asyncio.to_thread(self.store.get_basic_information, fingerprint)
+            if Basic_Information is not None:
+                print(f"♻️  Reusing stored resume data for fingerprint {fingerprint[:12]}")
+                return Basic_Information, 0, 0, 0, 0
+
+        concurrent_tasks = self._start_collection(resume_source, linkedin_profile_link, github_profile_link, other_link, protflow_profile_link)
+
+        concurrent_start = asyncio.get_event_loop().time()
+        results = await wait_with_deadline(concurrent_tasks, deadline, SOURCE_SHARE)
+        print(f"⏱️  Concurrent execution took: {asyncio.get_event_loop().time() - concurrent_start:.2f} seconds")
+
+        return await self._finish_collection(concurrent_tasks, results, fingerprint)
+
+    def _start_collection(self, resume_source, linkedin_profile_link=None, github_profile_link=None, other_link=None, protflow_profile_link=None):
+        """
+        Start the resume and external source collection tasks.
+
+        Returns:
+            list: (source name, task) pairs, with the resume first
+        """
+        # The resume is always required; external sources run alongside it
+        concurrent_tasks = [('resume', asyncio.create_task(self.collect_resume(resume_source)))]
+        if linkedin_profile_link:
+            concurrent_tasks.append(('linkedin', asyncio.create_task(collect_linkedin_data(linkedin_profile_link))))
+        if github_profile_link:
+            concurrent_tasks.append(('github', asyncio.create_task(collect_github_data(github_profile_link))))
+        if protflow_profile_link:
+            concurrent_tasks.append(('portfolio', asyncio.create_task(collect_portfolio_data(protflow_profile_link))))
+        if other_link:
+            concurrent_tasks.append(('other', asyncio.create_task(collect_other_link_data(other_link))))
+
+        print(f"Starting concurrent processing of the resume and {len(concurrent_tasks) - 1} external sources...")
+        for task_name, _ in concurrent_tasks:
+            print(f"   • {task_name}")
+        return concurrent_tasks
+
+    async def _finish_collection(self, concurrent_tasks, results, fingerprint=None):
+        """
+        Build Basic_Information from the collection results and store it when
+        every source completed.
+
+        Returns:
+            tuple: (Basic_Information_object, resume_tokens, github_tokens, protflow_tokens, other_link_tokens)
+        """
+        resume_tokens = 0
+        github_tokens = 0
+        protflow_tokens = 0
+        other_link_tokens = 0
+
+        resume_result = _empty_resume_result()
+        linkedin_result = None
+        github_result = None
+        protflow_summary = ""
+        other_link_summary = ""
+        degraded_sources = []
+        stale_sources = []
+
+        collection_complete = True
+        for (task_name, _), result in zip(concurrent_tasks, results):
+            if isinstance(result, DeadlineExceeded):
+                degraded_sources.append(task_name)
+                collection_complete = False
+                continue
+            if isinstance(result, Exception):
+                print(f"Error in {task_name} processing: {result}")
+                collection_complete = False
+                continue
+            if result.get('error'):
+                collection_complete = False
+            if result.get('stale'):
+                stale_sources.append(task_name)
+                collection_complete = False
+
+            if task_name == 'resume':
+                resume_result = result
+                resume_tokens = result['tokens']
+                print("✓ Resume processing completed")
+            elif task_name == 'linkedin':
+                linkedin_result = result
+                print("✓ LinkedIn processing completed")
+            elif task_name == 'github':
+                github_result = result
+                github_tokens = result['tokens']
+                print("✓ GitHub processing completed")
+            elif task_name == 'portfolio':
+                protflow_summary = result['summary']
+                protflow_tokens = result['tokens']
+                print("✓ Portfolio processing completed")
+            elif task_name == 'other':
+                other_link_summary = result['summary']
+                other_link_tokens = result['tokens']
+                print("✓ Other link processing completed")
+
+        print("All data collection completed!")
+
+        Basic_Information = BasicInformationData(
+            resume=resume_result,
+            linkedin=linkedin_result,
+            github=github_result,
+            protflow_summary=protflow_summary,
+            other_link_summary=other_link_summary,
+            degraded_sources=degraded_sources,
+            stale_sources=stale_sources
+        )
+
+        # Only store complete collections so a transient failure is not reused
+        if self.store and fingerprint and collection_complete:
+            await asyncio.to_thread(self.store.put_basic_information, fingerprint, Basic_Information)
+
+        return Basic_Information, resume_tokens, github_tokens, protflow_tokens, other_link_tokens
+
+    async def _run_section(self, section, Basic_Information, jd_data, source_tokens):
+        """
+        Run one section agent, reusing the stored result when its inputs are unchanged.
+
+        Returns:
+            tuple: (analysis, tokens, outcome), where outcome is "ran", "reused"
+                   (stored result) or "skipped" (no input, no model call)
+        """
+        if not section.has_input(Basic_Information):
+            print(f"⏭️  No {section.name} data in any source, skipping the agent")
+            metrics.increment("skipped_section_calls")
+            return section.empty_result(jd_data), source_tokens, SKIPPED
+
+        section_hash = section.fingerprint(Basic_Information, jd_data) if self.store else None
+        if section_hash:
+            found, analysis = await asyncio.to_thread(self.store.get_section, section_hash)
+            if found:
+                print(f"♻️  {section.name} inputs unchanged, reusing stored result")
+                return analysis, source_tokens, REUSED
+
+        analysis, tokens = await section.run(Basic_Information, jd_data)
+
+        if section_hash and analysis is not None:
+            await asyncio.to_thread(self.store.put_section, section_hash, analysis)
+
+        # Section totals include the source collection tokens, as before
+        return analysis, tokens + source_tokens, RAN
+
+    def use_consolidated(self, Basic_Information, jd_data=None):
+        """
+        Decide whether the general section agents can run as one consolidated call.
+
+        Consolidated mode is used for short resumes without external sources,
+        where the fixed system prompt overhead of the separate section agents
+        dominates. The ATS agents always fan out because each one works on
+        different job description fields.
+        """
+        if jd_data is not None or self.consolidated_max_chars <= 0:
+            return False
+        if any(section.name not in ConsolidatedStep.model_fields for section in self.sections):
+            return False
+        if Basic_Information.has_external_sources():
+            return False
+        return len(build_consolidated_input(Basic_Information, self.sections)) <= self.consolidated_max_chars
+
+    async def _run_consolidated(self, Basic_Information, source_tokens):
+        """
+        Run every section in one consolidated call. Sections without input are
+        left out of the call, and when some section inputs are unchanged their
+        stored results are reused and only the changed sections are run.
+
+        Returns:
+            list: (section, (analysis, tokens, outcome)) pairs, or None if the
+                  consolidated call returned nothing
+        """
+        results = {}
+        active = []
+        for section in self.sections:
+            if section.has_input(Basic_Information):
+                active.append(section)
+            else:
+                metrics.increment("skipped_section_calls")
+                results[section.name] = (section.empty_result(), source_tokens, SKIPPED)
+        if results:
+            print(f"⏭️  No data in any source for {', '.join(results)}, leaving them out of the call")
+
+        section_hashes = {section.name: section.fingerprint(Basic_Information) for section in active} if self.store else {}
+        for section in active:
+            if section.name in section_hashes:
+                found, analysis = await asyncio.to_thread(self.store.get_section, section_hashes[section.name])
+                if found:
+                    results[section.name] = (analysis, source_tokens, REUSED)
+        reused_count = sum(1 for result in results.values() if result[2] == REUSED)
+        missing = [section for section in active if section.name not in results]
+
+        if reused_count:
+            # Only part of the resume changed; the single-call saving applies to
+            # cold runs, so the changed sections go through their own agents
+            print(f"♻️  {reused_count}/{len(self.sections)} section inputs unchanged, running only the changed sections")
+            missing_results = await asyncio.gather(
+                *(self._run_section(section, Basic_Information, None, source_tokens) for section in missing)
+            )
+            results.update(zip((section.name for section in missing), missing_results))
+        elif missing:
+            analysis, tokens = await analyze_all_sections(build_consolidated_input(Basic_Information, missing),
+                                                         [section.name for section in missing])
+            step = analysis.steps[0] if analysis and analysis.steps else None
+            if step is None:
+                return None
+
+            # Split the call's tokens across the sections so totals stay comparable with fan-out mode
+            share, remainder = divmod(tokens, len(missing))
+            for index, section in enumerate(missing):
+                section_analysis = getattr(step, section.name)
+                if section.name in section_hashes:
+                    await asyncio.to_thread(self.store.put_section, section_hashes[section.name], section_analysis)
+                section_tokens = share + (remainder if index == 0 else 0) + source_tokens
+                results[section.name] = (section_analysis, section_tokens, RAN)
+
+        return [(section, results[section.name]) for section in self.sections]
+
+    async def process_all_agents_with_batching(self, Basic_Information, jd_data=None, resume_tokens=0, github_tokens=0, protflow_tokens=0, other_link_tokens=0, batch_size=4, deadline=None):
+        """
+        Process all section agents in batches to manage concurrency and API limits.
+
+        Args:
+            Basic_Information: Object containing all scraped data
+            jd_data: Structured job description data, or None for the general agents
+            resume_tokens: Tokens used for resume processing
+            github_tokens: Tokens used for GitHub processing
+            protflow_tokens: Tokens used for portfolio processing
+            other_link_tokens: Tokens used for other links processing
+            batch_size: Number of agents to run concurrently in each batch
+            deadline: Request Deadline (optional); sections still running when it expires are cancelled
+
+        Returns:
+            dict: Dictionary containing all analysis results and metadata
+        """
+        print("🤖 Starting batched concurrent agent processing...")
+        source_tokens = resume_tokens + github_tokens + protflow_tokens + other_link_tokens
+
+        batches = [self.sections[i:i + batch_size] for i in range(0, len(self.sections), batch_size)]
+        print(f"📊 Processing {len(self.sections)} agents in {len(batches)} batches of {batch_size}...")
+
+        section_results = []
+        for batch_num, batch in enumerate(batches, 1):
+            print(f"\n🔄 Processing Batch {batch_num}/{len(batches)} ({len(batch)} agents)...")
+            try:
+                batch_results = await wait_with_deadline(
+                    [(section.name, asyncio.create_task(self._run_section(section, Basic_Information, jd_data, source_tokens)))
+                     for section in batch],
+                    deadline
+                )
+                # No pause between batches: llm_scheduler caps concurrent calls across requests
+                section_results.extend(zip(batch, batch_results))
+
+            except Exception as e:
+                print(f"❌ Error in batch {batch_num}: {e}")
+                continue
+
+        results = self._summarize_results(Basic_Information, section_results, "fan_out", source_tokens)
+        print(f"🎉 All agent processing completed! Total tokens: {results['total_tokens_consumed']}")
+        return results
+
+    def _summarize_results(self, Basic_Information, section_results, agent_mode, source_tokens=0):
+        """
+        Build the process_all_agents response from (section, result) pairs.
+        Each section total includes the source_tokens; agent_tokens_consumed
+        counts the section agents alone.
+        """
+        analysis_results = {}
+        reused_sections = []
+        skipped_sections = []
+        degraded_sections = []
+        total_analysis_tokens = 0
+        agent_tokens = 0
+        completed_count = 0
+        for section, result in section_results:
+            if isinstance(result, DeadlineExceeded):
+                analysis_results[section.name] = None
+                degraded_sections.append(section.name)
+                continue
+            if isinstance(result, Exception):
+                print(f"❌ Error in {section.name} agent: {result}")
+                analysis_results[section.name] = None
+                continue
+
+            analysis, tokens, outcome = result
+            analysis_results[section.name] = analysis
+            total_analysis_tokens += tokens
+            agent_tokens += tokens - source_tokens
+            if outcome == REUSED:
+                reused_sections.append(section.name)
+            elif outcome == SKIPPED:
+                skipped_sections.append(section.name)
+            completed_count += 1
+            print(f"✓ [{completed_count}/{len(self.sections)}] {section.name.replace('_', ' ').title()} agent completed ({tokens} tokens)")
+
+        return {
+            "analysis_results": analysis_results,
+            "total_tokens_consumed": total_analysis_tokens,
+            "agent_tokens_consumed": agent_tokens,
+            "reused_sections": reused_sections,
+            "skipped_sections": skipped_sections,
+            "degraded_sections": degraded_sections,
+            "degraded_sources": list(getattr(Basic_Information, 'degraded_sources', [])),
+            "stale_sources": list(getattr(Basic_Information, 'stale_sources', [])),
+            "agent_mode": agent_mode
+        }
+
+    async def _consolidated_section(self, consolidated_task, section, Basic_Information):
+        """
+        Take one section's result from a shared speculative consolidated call,
+        running the section agent on its own if the consolidated call failed.
+        """
+        # Shielded: a re-run section cancelling its wrapper must not cancel the shared call
+        section_results = await asyncio.shield(consolidated_task)
+        if section_results is None:
+            return await self._run_section(section, Basic_Information, None, 0)
+        return dict((item.name, result) for item, result in section_results)[section.name]
+
+    async def run_analysis(self, resume_source, linkedin_profile_link=None, github_profile_link=None, other_link=None, protflow_profile_link=None, jd_task=None, fingerprint=None, deadline=None):
+        """
+        Collect all sources and run the section agents, overlapping the two
+        stages when external sources are requested.
+
+        In speculative mode the section agents start on resume-only data as
+        soon as resume extraction (and the JD, in ATS mode) is done, while
+        LinkedIn, GitHub and the links are still loading. Once they arrive,
+        a section is run again only if its agent input changed; otherwise the
+        speculative result is kept.
+
+        Args:
+            resume_source: Resume file path or resume text, depending on the input adapter
+            linkedin_profile_link: LinkedIn profile file (optional)
+            github_profile_link: GitHub profile URL (optional)
+            other_link: Other relevant link URL (optional)
+            protflow_profile_link: Portfolio link URL (optional)
+            jd_task: Awaitable returning structured job description data; when
+                given the ATS-optimized agents are used
+            fingerprint: Resume fingerprint from result_store.resume_fingerprint (optional)
+            deadline: Request Deadline (optional)
+
+        Returns:
+            dict: Dictionary containing all analysis results and metadata. In
+                  speculative mode agent_mode is "speculative" and
+                  speculative_reruns lists the sections that were run again.
+        """
+        has_sources = any([linkedin_profile_link, github_profile_link, other_link, protflow_profile_link])
+        stored = None
+        if self.store and fingerprint:
+            stored = await asyncio.to_thread(self.store.get_basic_information, fingerprint)
+
+        if stored is not None or not (self.speculative and has_sources):
+            # Nothing to overlap: collect first, then run the section agents
+            if stored is not None:
+                print(f"♻️  Reusing stored resume data for fingerprint {fingerprint[:12]}")
+                Basic_Information, tokens = stored, (0, 0, 0, 0)
+            else:
+                Basic_Information, *tokens = await self.resume_data(resume_source, linkedin_profile_link, github_profile_link, other_link, protflow_profile_link, fingerprint, deadline=deadline)
+            jd_data = await jd_task if jd_task is not None else None
+            return await self.process_all_agents(Basic_Information, jd_data, *tokens, deadline=deadline)
+
+        concurrent_tasks = self._start_collection(resume_source, linkedin_profile_link, github_profile_link, other_link, protflow_profile_link)
+        speculative_tasks = {}
+        section_tasks = []
+        try:
+            resume_task = concurrent_tasks[0][1]
+            await asyncio.wait([resume_task], timeout=deadline.source_budget() if deadline else None)
+            jd_data = await jd_task if jd_task is not None else None
+
+            if resume_task.done() and not resume_task.cancelled() and resume_task.exception() is None:
+                print("🔮 Resume ready, starting section agents on resume-only data while sources load...")
+                provisional = BasicInformationData(resume=resume_task.result())
+                if self.use_consolidated(provisional, jd_data):
+                    # One consolidated call covers every section; each section reads its part
+                    consolidated_task = asyncio.create_task(self._run_consolidated(provisional, 0))
+                    speculative_tasks = {
+                        section.name: (section.build_input(provisional), asyncio.create_task(
+                            self._consolidated_section(consolidated_task, section, provisional)))
+                        for section in self.sections
+                    }
+                    speculative_tasks['consolidated'] = (None, consolidated_task)
+                else:
+                    speculative_tasks = {
+                        section.name: (section.build_input(provisional),
+                                       asyncio.create_task(self._run_section(section, provisional, jd_data, 0)))
+                        for section in self.sections
+                    }
+
+            results = await wait_with_deadline(concurrent_tasks, deadline, SOURCE_SHARE)
+            Basic_Information, *tokens = await self._finish_collection(concurrent_tasks, results, fingerprint)
+            source_tokens = sum(tokens)
+
+            speculative_reruns = []
+            wasted_tokens = {}
+            for section in self.sections:
+                speculative_input, task = speculative_tasks.get(section.name, (None, None))
+                if task is not None and section.build_input(Basic_Information) == speculative_input:
+                    metrics.increment("speculative_sections_kept")
+                    section_tasks.append((section.name, task))
+                    continue
+                if task is not None:
+                    # The external sources changed this section's input
+                    metrics.increment("speculative_sections_rerun")
+                    speculative_reruns.append(section.name)
+                    if task.done() and not task.cancelled() and task.exception() is None:
+                        wasted_tokens[section.name] = task.result()[1]
+                    task.cancel()
+                section_tasks.append((section.name, asyncio.create_task(self._run_section(section, Basic_Information, jd_data, 0))))
+
+            if 'consolidated' in speculative_tasks and len(speculative_reruns) == len(self.sections):
+                speculative_tasks['consolidated'][1].cancel()
+            if speculative_tasks:
+                print(f"🔮 Keeping {len(self.sections) - len(speculative_reruns)} speculative sections, re-running {speculative_reruns or 'none'}")
+            section_results = await wait_with_deadline(section_tasks, deadline)
+        except BaseException:
+            # Cancelled (e.g. the client disconnected) or failed: stop the source
+            # collection and every section agent, not only the speculative ones
+            outstanding = [task for _, task in (*concurrent_tasks, *speculative_tasks.values(), *section_tasks) if not task.done()]
+            metrics.increment("cancelled_tasks", len(outstanding))
+            for task in outstanding:
+                task.cancel()
+            raise
+
+        # Section totals include the source tokens and any discarded speculative call
+        section_results = [
+            (section, (result[0], result[1] + source_tokens + wasted_tokens.get(section.name, 0), result[2])
+             if isinstance(result, tuple) else result)
+            for section, result in zip(self.sections, section_results)
+        ]
+        results = self._summarize_results(Basic_Information, section_results, "speculative" if speculative_tasks else "fan_out", source_tokens)
+        results["speculative_reruns"] = speculative_reruns
+        print(f"🎉 All agent processing completed! Total tokens: {results['total_tokens_consumed']}")
+        return results
+
+    async def process_all_agents(self, Basic_Information, jd_data=None, resume_tokens=0, github_tokens=0, protflow_tokens=0, other_link_tokens=0, deadline=None):
+        """
+        Run every section agent concurrently. Short resumes without external
+        sources are analyzed with one consolidated call instead (see use_consolidated).
+
+        Args:
+            Basic_Information: Object containing all scraped data
+            jd_data: Structured job description data; when given the ATS-optimized agents are used
+            resume_tokens: Tokens used for resume processing
+            github_tokens: Tokens used for GitHub processing
+            protflow_tokens: Tokens used for portfolio processing
+            other_link_tokens: Tokens used for other links processing
+            deadline: Request Deadline (optional). Sections still running when it
+                expires are cancelled, returned as None and listed in degraded_sections.
+
+        Returns:
+            dict: Dictionary containing all analysis results and metadata
+        """
+        source_tokens = resume_tokens + github_tokens + protflow_tokens + other_link_tokens
+
+        if self.use_consolidated(Basic_Information, jd_data):
+            print("🧩 Short resume without external sources, running consolidated single-call analysis...")
+            start_time = asyncio.get_event_loop().time()
+            [section_results] = await wait_with_deadline(
+                [('consolidated', asyncio.create_task(self._run_consolidated(Basic_Information, source_tokens)))],
+                deadline
+            )
+            if isinstance(section_results, DeadlineExceeded):
+                section_results = [(section, section_results) for section in self.sections]
+            if isinstance(section_results, list):
+                results = self._summarize_results(Basic_Information, section_results, "consolidated", source_tokens)
+                print(f"🎉 Consolidated analysis completed in {asyncio.get_event_loop().time() - start_time:.2f}s! Total tokens: {results['total_tokens_consumed']}")
+                return results
+            print(f"⚠️ Consolidated analysis failed ({section_results}), falling back to section agents...")
+
+        print("🤖 Starting optimized concurrent agent processing...")
+
+        tasks = [
+            (section.name, asyncio.create_task(self._run_section(section, Basic_Information, jd_data, source_tokens)))
+            for section in self.sections
+        ]
+        print(f"📊 Processing {len(tasks)} agents with task-based concurrency...")
+
+        try:
+            start_time = asyncio.get_event_loop().time()
+            results = await wait_with_deadline(tasks, deadline)
+            processing_time = asyncio.get_event_loop().time() - start_time
+
+            results = self._summarize_results(Basic_Information, zip(self.sections, results), "fan_out", source_tokens)
+            print(f"🎉 All agent processing completed in {processing_time:.2f}s! Total tokens: {results['total_tokens_consumed']}")
+            return results
+
+        except Exception as e:
+            print(f"❌ Error in concurrent agent processing: {e}")
+            print("🔄 Falling back to batched processing...")
+            return await self.process_all_agents_with_batching(Basic_Information, jd_data, resume_tokens, github_tokens, protflow_tokens, other_link_tokens, deadline=deadline)
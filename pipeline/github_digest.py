@@ -0,0 +1,169 @@
+"""
+GitHub Profile Digest
+
+The collected GitHub profile holds every repository (hundreds for active
+users since pagination is followed) and raw event payloads with whole
+commit lists and PR bodies. The GitHub agent only needs what they add up
+to, so the profile is reduced locally to:
+- the profile fields (bio, company, followers, ...)
+- totals: original and forked repositories, stars and forks
+- language distribution and most common topics of original repositories
+- activity cadence: repositories created per year, recently updated
+  repositories, last activity
+- recent events counted by type and repository, without payloads
+- the top repositories by signal (see token_budget.rank_repositories),
+  with the README excerpt and language mix the scraper fetched for them
+
+Only this digest is sent to the model. It is kept within
+GITHUB_INPUT_TOKENS by dropping top repositories from the end if needed.
+"""
+import os
+from collections import Counter
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+
+from pipeline.prompt_format import compact
+from pipeline.token_budget import GITHUB_INPUT_TOKENS, count_tokens, rank_repositories
+
+load_dotenv()
+
+# Repositories described individually in the digest
+GITHUB_DIGEST_TOP_REPOS = int(os.getenv("GITHUB_DIGEST_TOP_REPOS", "12"))
+
+PROFILE_FIELDS = ("username", "name", "bio", "location", "blog", "company",
+                  "public_repos", "public_gists", "followers", "following")
+DESCRIPTION_CHARS = 200
+TOP_LANGUAGES = 8
+REPO_LANGUAGES = 5
+TOP_TOPICS = 15
+CADENCE_YEARS = 6
+
+
+def _parse_date(timestamp):
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _share(count, total):
+    return f"{count} ({count / total:.0%})" if total else str(count)
+
+
+def _language_distribution(repositories):
+    languages = Counter(repo.get("language") for repo in repositories if repo.get("language"))
+    total = sum(languages.values())
+    distribution = {language: _share(count, total) for language, count in languages.most_common(TOP_LANGUAGES)}
+    other = total - sum(count for _, count in languages.most_common(TOP_LANGUAGES))
+    if other:
+        distribution["other"] = _share(other, total)
+    return distribution
+
+
+def _activity_cadence(repositories, now):
+    created = [_parse_date(repo.get("created_at")) for repo in repositories]
+    updated = [date for date in (_parse_date(repo.get("updated_at")) for repo in repositories) if date]
+    per_year = Counter(date.year for date in created if date and date.year > now.year - CADENCE_YEARS)
+    cadence = {
+        "repositories_created_per_year": {year: per_year[year] for year in sorted(per_year)},
+        "updated_last_90_days": sum((now - date).days <= 90 for date in updated),
+        "updated_last_year": sum((now - date).days <= 365 for date in updated),
+    }
+    if updated:
+        cadence["last_activity"] = max(updated).date().isoformat()
+    return cadence
+
+
+def _event_summary(events):
+    if not events:
+        return {}
+    summary = {
+        "event_types": dict(Counter(event.get("type") for event in events).most_common()),
+        "most_active_repositories": dict(Counter(event.get("repo") for event in events if event.get("repo")).most_common(3)),
+    }
+    pushed_commits = sum(
+        (event.get("payload") or {}).get("size") or len((event.get("payload") or {}).get("commits") or [])
+        for event in events if event.get("type") == "PushEvent"
+    )
+    if pushed_commits:
+        summary["pushed_commits"] = pushed_commits
+    dates = sorted((event.get("created_at") or "")[:10] for event in events if event.get("created_at"))
+    if dates:
+        summary["period"] = f"{dates[0]} to {dates[-1]}"
+    return summary
+
+
+def _repository_digest(repo):
+    description = repo.get("description") or ""
+    if len(description) > DESCRIPTION_CHARS:
+        description = description[:DESCRIPTION_CHARS].rstrip() + "…"
+    digest = {
+        "name": repo.get("name"),
+        "description": description,
+        "language": repo.get("language"),
+        "stars": repo.get("stars"),
+        "forks": repo.get("forks"),
+        "updated": (repo.get("updated_at") or "")[:10],
+        "topics": repo.get("topics"),
+    }
+    if repo.get("fork"):
+        digest["fork"] = True
+    language_bytes = repo.get("language_bytes") or {}
+    total_bytes = sum(language_bytes.values())
+    if total_bytes:
+        digest["languages"] = {
+            language: f"{size / total_bytes:.0%}"
+            for language, size in sorted(language_bytes.items(), key=lambda item: item[1], reverse=True)[:REPO_LANGUAGES]
+        }
+    if repo.get("readme_excerpt"):
+        digest["readme"] = repo["readme_excerpt"]
+    return digest
+
+
+def build_github_digest(profile_info, top_repos: int = GITHUB_DIGEST_TOP_REPOS, max_tokens: int = GITHUB_INPUT_TOKENS, now=None):
+    """
+    Reduce a fetch_github_profile_info() result to the aggregate digest sent to
+    the GitHub agent.
+
+    Args:
+        profile_info: Dictionary from Scraper.github_scraper.fetch_github_profile_info
+        top_repos: Number of repositories described individually
+        max_tokens: Input token budget for the digest
+        now: Reference time for the activity cadence (defaults to now)
+
+    Returns:
+        dict: The digest, or profile_info unchanged if it is empty
+    """
+    if not profile_info:
+        return profile_info
+    now = now or datetime.now(timezone.utc)
+
+    repositories = profile_info.get("repositories") or []
+    originals = [repo for repo in repositories if not repo.get("fork")]
+    topics = Counter(topic for repo in originals for topic in repo.get("topics") or [])
+
+    digest = {field: profile_info.get(field) for field in PROFILE_FIELDS if profile_info.get(field) not in (None, "")}
+    created = _parse_date(profile_info.get("created_at"))
+    if created:
+        digest["member_since"] = created.date().isoformat()
+    digest["totals"] = {
+        "repositories": len(repositories),
+        "original": len(originals),
+        "forked": len(repositories) - len(originals),
+        "stars": sum(repo.get("stars") or 0 for repo in originals),
+        "forks": sum(repo.get("forks") or 0 for repo in originals),
+    }
+    digest["languages"] = _language_distribution(originals)
+    if topics:
+        digest["top_topics"] = [topic for topic, _ in topics.most_common(TOP_TOPICS)]
+    digest["activity"] = _activity_cadence(originals or repositories, now)
+    recent_events = _event_summary(profile_info.get("recent_events") or [])
+    if recent_events:
+        digest["recent_events"] = recent_events
+
+    ranked = [_repository_digest(repo) for repo in rank_repositories(repositories, now)[:top_repos]]
+    digest["top_repositories"] = ranked
+    while ranked and count_tokens(compact(digest)) > max_tokens:
+        ranked.pop()
+    return digest
@@ -0,0 +1,29 @@
+"""
+Pipeline Metrics
+
+In-process counters for pipeline events such as client disconnects and
+cancelled agent tasks. The counters are reported by the /health endpoint.
+"""
+import threading
+from collections import Counter
+
+
+class PipelineMetrics:
+    """
+    Thread-safe named counters.
+    """
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: int = 1):
+        if amount:
+            with self._lock:
+                self._counts[name] += amount
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._counts)
+
+
+metrics = PipelineMetrics()
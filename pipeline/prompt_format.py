@@ -0,0 +1,60 @@
+"""
+Compact Prompt Serialization
+
+Section agent prompts are built from Basic_Information fields that hold
+pydantic models, lists and plain strings. Interpolating them directly into
+an f-string emits their Python repr (class names, field quotes, None and
+empty values), which the model pays for in input tokens without gaining
+information. compact() renders the same data as minified JSON with null and
+empty fields dropped; plain strings are passed through unchanged.
+"""
+import json
+
+from pydantic import BaseModel
+
+from pipeline.token_budget import truncate_to_tokens
+
+EMPTY_VALUES = (None, "", [], {})
+
+
+def _prune(value):
+    """
+    Convert a value into JSON-compatible data without null or empty fields.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    elif hasattr(value, '__dict__') and not isinstance(value, type):
+        value = vars(value)
+
+    if isinstance(value, dict):
+        # Agent responses are wrapped as {"steps": [step]}; the wrapper carries no information
+        if list(value) == ['steps'] and isinstance(value['steps'], list) and len(value['steps']) == 1:
+            return _prune(value['steps'][0])
+        pruned = {key: _prune(item) for key, item in value.items()}
+        return {key: item for key, item in pruned.items() if item not in EMPTY_VALUES}
+    if isinstance(value, (list, tuple, set)):
+        pruned = [_prune(item) for item in value]
+        return [item for item in pruned if item not in EMPTY_VALUES]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def compact(value, max_tokens=None) -> str:
+    """
+    Render a Basic_Information field for a prompt.
+
+    Args:
+        value: String, pydantic model, list, dict or None
+        max_tokens: Optional token budget; longer renderings are truncated
+
+    Returns:
+        str: The string itself, minified JSON for structured data, or an
+             empty string when there is nothing to show
+    """
+    value = _prune(value)
+    if value in EMPTY_VALUES:
+        return ""
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return truncate_to_tokens(value, max_tokens) if max_tokens else value
@@ -0,0 +1,116 @@
+"""
+Resume Result Store
+
+Disk-backed store for pipeline results.
+
+Two kinds of entries are kept:
+- resumes: the collected Basic_Information object keyed by a resume
+  fingerprint. The ATS flow is typically run many times for the same resume
+  with different job descriptions; a repeat run skips source collection and
+  only runs the JD extraction and the section agents.
+- sections: section agent results keyed by a hash of that agent's input
+  (see SectionAgent.fingerprint in pipeline/engine.py). When a user edits
+  one part of the resume and resubmits, only the sections whose input
+  changed are sent to the model again.
+
+Entries are pickled one file per key (see pipeline/disk_store.py), like
+the FAISS metadata in chat_section/vectordata.py, and expire after a TTL.
+
+Retention: both kinds hold the candidate's personal data (name, email,
+phone, work history) in plain pickles. They are kept for RESUME_CACHE_TTL
+seconds (7 days by default) and RESUME_CACHE_TTL=0 turns the store off.
+Expired entries are removed when read and by the periodic sweep in
+pipeline/disk_store.py.
+"""
+import hashlib
+import os
+import time
+
+from dotenv import load_dotenv
+
+from pipeline.disk_store import DiskStore
+
+load_dotenv()
+
+# Bump when the shape of stored results or the agent prompts change so old entries are ignored
+STORE_VERSION = "10"
+
+DEFAULT_STORE_DIR = os.getenv("RESUME_CACHE_DIR", "./resume_cache")
+DEFAULT_TTL_SECONDS = int(os.getenv("RESUME_CACHE_TTL", str(7 * 24 * 3600)))
+
+RESUMES = "resumes"
+SECTIONS = "sections"
+
+
+def content_hash(*parts) -> str:
+    """
+    Hash a sequence of str/bytes/None parts into a hex digest.
+    """
+    digest = hashlib.sha256(STORE_VERSION.encode())
+    for part in parts:
+        if part is None:
+            part = b""
+        elif isinstance(part, str):
+            part = part.strip().encode("utf-8")
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def resume_fingerprint(resume_content, linkedin_content=None, github_profile=None, portfolio_link=None, other_link=None) -> str:
+    """
+    Fingerprint every input that Basic_Information is built from.
+
+    Args:
+        resume_content: Resume file bytes or resume text
+        linkedin_content: LinkedIn file bytes (optional)
+        github_profile: GitHub profile URL (optional)
+        portfolio_link: Portfolio website URL (optional)
+        other_link: Other relevant link URL (optional)
+
+    Returns:
+        str: Hex digest identifying this combination of inputs
+    """
+    return content_hash(resume_content, linkedin_content, github_profile, portfolio_link, other_link)
+
+
+class ResumeStore(DiskStore):
+    """
+    Stored Basic_Information objects and section results.
+
+    Args:
+        store_dir: Directory holding the entries
+        ttl_seconds: Entry lifetime in seconds; 0 stores nothing
+    """
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        super().__init__(store_dir, ttl_seconds, kinds=(RESUMES, SECTIONS), timestamp_field='created_at', label="stored result")
+        self.enabled = ttl_seconds > 0
+
+    def _load(self, kind: str, key: str):
+        """
+        Return (found, value) for a stored entry.
+        """
+        entry = self.load(kind, key) if self.enabled else None
+        return (True, entry['value']) if entry else (False, None)
+
+    def _save(self, kind: str, key: str, value):
+        if self.enabled:
+            self.save(kind, key, {'created_at': time.time(), 'value': value})
+
+    def get_basic_information(self, fingerprint: str):
+        """
+        Return the stored Basic_Information object for a resume fingerprint, or None.
+        """
+        found, Basic_Information = self._load(RESUMES, fingerprint)
+        return Basic_Information if found else None
+
+    def put_basic_information(self, fingerprint: str, Basic_Information):
+        self._save(RESUMES, fingerprint, Basic_Information)
+
+    def get_section(self, section_hash: str):
+        """
+        Return (found, analysis) for a section result keyed by its input hash.
+        """
+        return self._load(SECTIONS, section_hash)
+
+    def put_section(self, section_hash: str, analysis):
+        self._save(SECTIONS, section_hash, analysis)
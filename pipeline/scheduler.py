@@ -0,0 +1,161 @@
+"""
+Fair Scheduler for LLM Calls
+
+Every agent call goes through the shared AsyncOpenAI client, whose HTTP
+transport acquires a slot from the scheduler below (see shared_client.py).
+The scheduler caps the number of calls in flight and, when calls have to
+wait, hands out free slots:
+- by priority: interactive requests before bulk ones
+- round-robin across requests within a priority, so a request with a huge
+  LinkedIn profile and dozens of queued calls cannot hold back a small
+  request that needs only a few
+
+The request a call belongs to is tracked with a context variable that
+RequestFlowMiddleware sets for each HTTP request; asyncio tasks created by
+the pipeline inherit it.
+"""
+import asyncio
+import contextvars
+import os
+import uuid
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+
+from dotenv import load_dotenv
+
+from pipeline.metrics import metrics
+
+load_dotenv()
+
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+
+# Header batch clients send to run their requests below interactive traffic
+PRIORITY_HEADER = b"x-priority"
+
+_request_flow = contextvars.ContextVar("llm_request_flow", default=None)
+
+
+def set_request_flow(flow_id, priority=PRIORITY_INTERACTIVE):
+    """
+    Attribute LLM calls made from the current context to a request.
+
+    Returns:
+        contextvars.Token: Token for reset_request_flow
+    """
+    return _request_flow.set((flow_id, priority))
+
+
+def reset_request_flow(token):
+    _request_flow.reset(token)
+
+
+class FairScheduler:
+    """
+    Concurrency limiter with per-request round-robin queues and priorities.
+
+    Args:
+        max_concurrency: Maximum number of calls in flight
+    """
+    def __init__(self, max_concurrency: int = LLM_MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        # priority -> request flow id -> waiting futures, in round-robin order
+        self._queues = {PRIORITY_INTERACTIVE: OrderedDict(), PRIORITY_BULK: OrderedDict()}
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for flows in self._queues.values() for queue in flows.values())
+
+    def _next_waiter(self):
+        for priority in sorted(self._queues):
+            flows = self._queues[priority]
+            while flows:
+                flow_id, queue = next(iter(flows.items()))
+                future = queue.popleft()
+                if queue:
+                    # The flow goes to the back of the round-robin order
+                    flows.move_to_end(flow_id)
+                else:
+                    del flows[flow_id]
+                if not future.cancelled():
+                    return future
+        return None
+
+    def _grant_waiters(self):
+        while self.active < self.max_concurrency:
+            future = self._next_waiter()
+            if future is None:
+                return
+            self.active += 1
+            future.set_result(None)
+
+    async def acquire(self):
+        flow_id, priority = _request_flow.get() or (None, PRIORITY_INTERACTIVE)
+        if self.active < self.max_concurrency and not self.queued:
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues[priority].setdefault(flow_id, deque()).append(future)
+        metrics.increment("llm_calls_queued")
+        self._grant_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the caller was cancelled: hand the slot on
+                self.release()
+            else:
+                self._discard(priority, flow_id, future)
+            raise
+
+    def _discard(self, priority, flow_id, future):
+        flows = self._queues[priority]
+        queue = flows.get(flow_id)
+        if queue and future in queue:
+            queue.remove(future)
+            if not queue:
+                del flows[flow_id]
+
+    def release(self):
+        self.active -= 1
+        self._grant_waiters()
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def snapshot(self) -> dict:
+        return {"active": self.active, "queued": self.queued, "max_concurrency": self.max_concurrency}
+
+
+llm_scheduler = FairScheduler()
+
+
+class RequestFlowMiddleware:
+    """
+    ASGI middleware giving each HTTP request its own scheduler flow.
+    Requests sent with "X-Priority: bulk" are scheduled below interactive ones.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        priority = PRIORITY_BULK if headers.get(PRIORITY_HEADER, b"").lower() == b"bulk" else PRIORITY_INTERACTIVE
+        token = set_request_flow(uuid.uuid4().hex, priority)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_request_flow(token)
@@ -0,0 +1,93 @@
+"""
+Token Budgets for Agent Inputs
+
+External sources have no natural size limit: a prolific GitHub user has
+100 repositories and event payloads with whole commit lists. Everything
+handed to an agent is measured with tiktoken and ranked or truncated to a
+per-agent budget first, so prompt size and latency stay bounded.
+"""
+import math
+import os
+from datetime import datetime, timezone
+
+import tiktoken
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Input budget for the GitHub agent
+GITHUB_INPUT_TOKENS = int(os.getenv("GITHUB_INPUT_TOKENS", "6000"))
+
+# Input budget for the merged pages of a crawled portfolio site
+PORTFOLIO_INPUT_TOKENS = int(os.getenv("PORTFOLIO_INPUT_TOKENS", "6000"))
+
+# Budget for each free-text external source field inside a section agent prompt
+SOURCE_FIELD_TOKENS = int(os.getenv("SOURCE_FIELD_TOKENS", "800"))
+
+TOKENIZER_MODEL = "gpt-4o"
+TRUNCATION_MARKER = " …[truncated]"
+
+_encoding = None
+_encoding_loaded = False
+
+
+def _get_encoding():
+    """
+    Load the tiktoken encoding once. tiktoken downloads its encoding files on
+    first use; when that fails every count falls back to an estimate.
+    """
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            _encoding = tiktoken.encoding_for_model(TOKENIZER_MODEL)
+        except Exception as e:
+            print(f"Warning: tiktoken encoding unavailable ({type(e).__name__}), estimating token counts")
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens with tiktoken, falling back to a rough estimate (1 token ≈ 4 characters).
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text down to at most max_tokens tokens, marking the cut.
+    """
+    if not text or max_tokens <= 0 or count_tokens(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4] + TRUNCATION_MARKER
+    return encoding.decode(encoding.encode(text)[:max_tokens]) + TRUNCATION_MARKER
+
+
+def _age_days(timestamp, now):
+    try:
+        updated = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return (now - updated).days
+
+
+def rank_repositories(repositories, now=None):
+    """
+    Order repositories by how much they say about the developer: original
+    work before forks, then stars (log scale) plus a bonus for recent activity.
+    """
+    now = now or datetime.now(timezone.utc)
+
+    def score(repo):
+        age_days = _age_days(repo.get("updated_at"), now)
+        recency = 0
+        if age_days is not None:
+            recency = 2 if age_days <= 90 else 1 if age_days <= 365 else 0
+        return (not repo.get("fork"), math.log2(1 + (repo.get("stars") or 0)) + recency)
+
+    return sorted(repositories, key=score, reverse=True)
@@ -9,6 +9,8 @@ import httpx
 from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
+from pipeline.scheduler import llm_scheduler
+
 # Load environment variables
 load_dotenv()
 openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -28,11 +30,32 @@ openai_api_key = os.getenv("OPENAI_API_KEY")
 # )
 
 
+class ScheduledTransport(httpx.AsyncBaseTransport):
+    """
+    HTTP transport that sends each OpenAI request through the fair scheduler
+    (pipeline/scheduler.py), so concurrent requests to this service share the
+    connection pool fairly instead of first come, first served.
+    """
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request):
+        # The slot is held until the response headers arrive
+        async with llm_scheduler.slot():
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+# Limits live on the transport: httpx ignores client limits when a transport is given
 custom_http_client = httpx.AsyncClient(
-    limits=httpx.Limits(
-        max_connections=200,          # Increase for concurrent AI requests
-        max_keepalive_connections=70, # More persistent connections
-    ),
+    transport=ScheduledTransport(httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=200,          # Increase for concurrent AI requests
+            max_keepalive_connections=70, # More persistent connections
+        ),
+    )),
     timeout=httpx.Timeout(
         connect=70.0,    # 1 minute to establish connection  
         read=500.0,      # 5 minutes to read response (AI processing can be slow)
@@ -47,6 +70,22 @@ async_openai_client = AsyncOpenAI(
     http_client=custom_http_client
 )
 
+# Shared pool for external sources (GitHub API, portfolio and other links).
+# Kept apart from the OpenAI client so these requests bypass the LLM scheduler.
+external_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+    ),
+    timeout=httpx.Timeout(
+        connect=10.0,
+        read=30.0,
+        write=10.0,
+        pool=30.0
+    ),
+    follow_redirects=True
+)
+
 async def get_async_client():
     """
     Get the shared AsyncOpenAI client instance.
@@ -56,8 +95,18 @@ async def get_async_client():
     """
     return async_openai_client
 
+async def get_http_client():
+    """
+    Get the shared HTTP client for external sources.
+
+    Returns:
+        httpx.AsyncClient: Pooled client for GitHub and website requests
+    """
+    return external_http_client
+
 async def close_client():
     """
-    Close the HTTP client when shutting down.
+    Close the HTTP clients when shutting down.
     """
     await custom_http_client.aclose()
+    await external_http_client.aclose()
@@ -0,0 +1,7 @@
+import os
+import sys
+from pathlib import Path
+
+# The modules read the OpenAI key at import time; tests never call the API
+os.environ.setdefault("OPENAI_API_KEY", "test")
+sys.path.insert(0, str(Path(__file__).parent.parent))
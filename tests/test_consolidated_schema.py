@@ -0,0 +1,16 @@
+from Multiagent.Consolidated_agent import Consolidated_data, Step, section_models
+
+
+def test_schema_only_requires_active_sections():
+    step_model, data_model = section_models(("experience", "skills"))
+
+    assert step_model.model_json_schema()["required"] == ["experience", "skills"]
+    parsed = step_model.model_validate({
+        "experience": {"Experience": []},
+        "skills": {"Skills": []},
+    })
+    assert data_model(steps=[parsed]).steps[0].skills.Skills == []
+
+
+def test_all_sections_use_the_full_models():
+    assert section_models(tuple(Step.model_fields)) == (Step, Consolidated_data)
@@ -0,0 +1,62 @@
+from Scraper.contact_extractor import extract_contact_facts, extract_full_name, extract_phone
+
+# Headers as MarkItDown renders them from real resume layouts
+HEADER_NAME_FIRST = """# Jane A. Doe
+Senior Software Engineer
+jane.doe@example.com | +1 (415) 555-0132 | linkedin.com/in/janedoe
+
+## Professional Summary
+Backend engineer with 8 years of experience.
+"""
+
+HEADER_TITLE_FIRST = """Senior Software Engineer
+Professional Summary
+Backend engineer building payment systems since 2015.
+"""
+
+HEADER_HEADING_FIRST = """**PROFESSIONAL SUMMARY**
+Data Scientist
+RAVI KUMAR
+ravi.kumar@example.in
++91 98765 43210
+"""
+
+HEADER_YEARS_ONLY = """Full Stack Developer
+Awards: Hackathon winner 2015 2016 2017
+Employee ID 2019 0045 6789
+"""
+
+HEADER_TABLE = """| Maria Garcia López | maria.garcia@example.es |
+| --- | --- |
+| Madrid, Spain | 612-345-678 |
+"""
+
+
+def test_name_from_first_line():
+    assert extract_full_name(HEADER_NAME_FIRST) == "Jane A. Doe"
+
+
+def test_headings_and_job_titles_are_not_names():
+    assert extract_full_name(HEADER_TITLE_FIRST) == ""
+    assert extract_full_name(HEADER_HEADING_FIRST) == "RAVI KUMAR"
+    assert extract_full_name(HEADER_YEARS_ONLY) == ""
+
+
+def test_phone_with_country_code_or_separators():
+    assert extract_phone(HEADER_NAME_FIRST) == "+1 (415) 555-0132"
+    assert extract_phone(HEADER_HEADING_FIRST) == "+91 98765 43210"
+    assert extract_phone(HEADER_TABLE) == "612-345-678"
+
+
+def test_year_sequences_and_ids_are_not_phones():
+    assert extract_phone(HEADER_YEARS_ONLY) == ""
+    assert extract_phone("Worked 2015 - 2019, 2019 - 2023") == ""
+    assert extract_phone("Order number 4155550132") == ""
+
+
+def test_contact_facts():
+    facts = extract_contact_facts(HEADER_NAME_FIRST)
+    assert facts['full_name'] == "Jane A. Doe"
+    assert facts['email'] == "jane.doe@example.com"
+    assert facts['phone'] == "+1 (415) 555-0132"
+    assert facts['urls'] == ["linkedin.com/in/janedoe"]
@@ -0,0 +1,21 @@
+import asyncio
+import time
+
+from pipeline.deadline import Deadline, DeadlineExceeded, wait_with_deadline
+
+
+def test_consecutive_waits_share_one_slice():
+    async def scenario():
+        deadline = Deadline(1.0)
+        # The resume wait, then the link collection, both limited to the first half
+        await wait_with_deadline([("resume", asyncio.create_task(asyncio.sleep(0.3)))], deadline, 0.5)
+        results = await wait_with_deadline([("github", asyncio.create_task(asyncio.sleep(1.0)))], deadline, 0.5)
+        return deadline, results
+
+    start = time.monotonic()
+    deadline, [result] = asyncio.run(scenario())
+    elapsed = time.monotonic() - start
+
+    assert isinstance(result, DeadlineExceeded)
+    assert elapsed < 0.65
+    assert deadline.budget(0.5) == 0.0
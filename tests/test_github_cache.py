@@ -0,0 +1,25 @@
+import asyncio
+
+import httpx
+
+from Scraper.github_cache import HIT, MISS, GitHubCache
+
+README_URL = "https://api.github.com/repos/jane/empty/readme"
+
+
+def test_missing_readme_is_not_requested_again(tmp_path):
+    cache = GitHubCache(str(tmp_path), ttl_seconds=3600, fresh_seconds=600)
+    sent = []
+
+    async def send(url, params, headers):
+        sent.append(url)
+        return httpx.Response(404, json={"message": "Not Found"}, request=httpx.Request("GET", url))
+
+    async def lookups():
+        return [await cache.get_json(send, README_URL) for _ in range(2)]
+
+    assert asyncio.run(lookups()) == [(None, {}, False), (None, {}, False)]
+    assert sent == [README_URL]
+    assert cache.is_fresh(README_URL)
+    snapshot = cache.snapshot()
+    assert (snapshot[MISS], snapshot[HIT]) == (1, 1)
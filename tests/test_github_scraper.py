@@ -0,0 +1,42 @@
+import asyncio
+
+from Scraper import github_scraper
+from Scraper.github_tokens import GitHubRateLimited
+
+REPOS_URL = "https://api.github.com/users/jane/repos"
+
+
+def test_pagination_cut_short_keeps_fetched_pages(monkeypatch):
+    async def get_json(client, url, params=None, state=None):
+        page = params["page"]
+        if page == 3:
+            raise GitHubRateLimited(120)
+        links = {"last": {"url": f"{REPOS_URL}?page=3"}} if page == 1 else {}
+        return [{"name": f"repo-{page}"}], links
+
+    monkeypatch.setattr(github_scraper, "_get_json", get_json)
+    state = {}
+    repos = asyncio.run(github_scraper.fetch_repositories(None, "jane", state=state))
+
+    assert [repo["name"] for repo in repos] == ["repo-1", "repo-2"]
+    assert state["cut_short"] == 120
+
+
+def test_enrichment_only_spends_budget_beyond_reserve(monkeypatch):
+    repositories = [{"full_name": f"jane/repo-{i}", "stars": 10 - i} for i in range(5)]
+    enriched = []
+
+    async def details(client, repo, state):
+        enriched.append(repo["full_name"])
+        return {"language_bytes": {"Python": 100}}
+
+    monkeypatch.setattr(github_scraper, "_repository_details", details)
+    monkeypatch.setattr(github_scraper.github_cache, "is_fresh", lambda url, params=None: False)
+    monkeypatch.setattr(github_scraper.github_tokens, "remaining",
+                        lambda: github_scraper.GITHUB_ENRICH_MIN_REMAINING + 5)
+
+    count = asyncio.run(github_scraper.enrich_top_repositories(None, repositories, {}))
+
+    # Two requests per repository, five spare requests
+    assert count == 2
+    assert len(enriched) == 2
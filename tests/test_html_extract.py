@@ -0,0 +1,36 @@
+import pytest
+
+from Scraper.html_extract import EXTRACTORS, extract_page
+
+pytestmark = pytest.mark.skipif("lxml" not in EXTRACTORS, reason="lxml is not installed")
+
+LINK_IN_BIO = """<html><body><div id="app">
+<h1>Jane Doe</h1><p>Developer</p>
+<div class="grid"><a href="/a">Blog</a><a href="/b">Talks</a><a href="/c">CV</a><a href="/d">Code</a></div>
+</div></body></html>"""
+
+PORTFOLIO = """<html><body><div id="__next">
+<nav><a href="/">Home</a><a href="/about">About</a><a href="/work">Work</a></nav>
+<h1>Jane Doe</h1><p>Backend engineer building payment systems.</p>
+<ul class="related-projects"><li><a href="/p/ledger">Ledger</a> double-entry accounting service in Go with audit trails</li>
+<li><a href="/p/queue">Queue</a> durable job queue on Postgres used by three teams</li>
+<li><a href="/p/cli">CLI</a> deployment tool for blue-green releases</li></ul>
+<div class="social-links">Find me on GitHub and Mastodon</div>
+<ul><li><a href="/x">Home</a></li><li><a href="/y">Blog</a></li><li><a href="/z">Contact</a></li></ul>
+<div class="cookie-banner">We use cookies</div>
+</div></body></html>"""
+
+
+def test_wrapper_with_links_is_not_dropped_as_a_menu():
+    text, links = extract_page(LINK_IN_BIO, "https://jane.example.com/", "lxml", True)
+    assert text == extract_page(LINK_IN_BIO, "https://jane.example.com/", "bs4", True)[0]
+    assert "Developer" in text and "Talks" in text
+    assert len(links) == 4
+
+
+def test_menus_and_widgets_are_dropped_but_content_lists_kept():
+    text, _ = extract_page(PORTFOLIO, "https://jane.example.com/", "lxml", True)
+    assert "double-entry accounting" in text
+    assert "Find me on GitHub" in text
+    assert "Contact" not in text
+    assert "cookies" not in text
@@ -0,0 +1,25 @@
+import os
+import time
+
+from pipeline.result_store import RESUMES, ResumeStore
+
+
+def test_expired_entries_are_evicted(tmp_path):
+    store = ResumeStore(str(tmp_path), ttl_seconds=60)
+    store.put_basic_information("old", {"name": "Jane Doe"})
+    store.put_basic_information("new", {"name": "John Roe"})
+    expired = time.time() - 120
+    os.utime(store._path(RESUMES, "old"), (expired, expired))
+
+    assert store.evict_expired() == 1
+    assert not os.path.exists(store._path(RESUMES, "old"))
+    assert store.get_basic_information("new") == {"name": "John Roe"}
+
+
+def test_zero_ttl_stores_nothing(tmp_path):
+    store = ResumeStore(str(tmp_path / "store"), ttl_seconds=0)
+    store.put_basic_information("key", {"name": "Jane Doe"})
+
+    assert store.get_basic_information("key") is None
+    assert not os.path.exists(tmp_path / "store")
+    assert store.evict_expired() == 0
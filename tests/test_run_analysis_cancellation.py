@@ -0,0 +1,38 @@
+"""
+Cancelling ResumePipeline.run_analysis (client disconnect, request deadline)
+must stop the source collection and every agent call, not only the
+speculative section agents.
+"""
+import asyncio
+
+from benchmarks.fake_llm import install_fake_llm, load_fixture
+from pipeline import engine
+
+LATENCY = 0.2
+SOURCES = {
+    'github_profile_link': "https://github.com/janedoe",
+    'other_link': "https://blog.janedoe.dev",
+    'protflow_profile_link': "https://janedoe.dev",
+}
+
+
+def test_cancelled_run_analysis_stops_collection_and_agents():
+    recorder = install_fake_llm(engine, latency=LATENCY)
+
+    async def scenario():
+        pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput(), speculative=True)
+        run = asyncio.create_task(pipeline.run_analysis(load_fixture("sample_resume.txt"), **SOURCES))
+        # Cancel while the resume is still being analyzed, before any section agent starts
+        await asyncio.sleep(LATENCY / 2)
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        calls_at_cancel = [name for name, _, _ in recorder.calls]
+
+        # Long enough for every orphaned collection task and agent call to finish
+        await asyncio.sleep(LATENCY * 5)
+        leftover = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        return calls_at_cancel, [name for name, _, _ in recorder.calls], leftover
+
+    calls_at_cancel, calls_after, leftover = asyncio.run(scenario())
+    assert calls_after == calls_at_cancel
+    assert leftover == []
@@ -0,0 +1,19 @@
+from pipeline.engine import SECTION_AGENTS, BasicInformationData
+
+BASIC_INFORMATION = next(section for section in SECTION_AGENTS if section.name == 'basic_information')
+RESUME = {'email': "jane.doe@example.com", 'phone': "+1 (415) 555-0132"}
+
+
+def test_resume_contact_details_are_echoed():
+    echoed = BASIC_INFORMATION.echoed_fields(BasicInformationData(resume=RESUME))
+    assert echoed == {'EmailAddress': "jane.doe@example.com", 'PhoneNumber': "+1 (415) 555-0132"}
+
+
+def test_same_contact_details_on_linkedin_are_still_echoed():
+    linkedin = {'professional_summary': "Reach me at Jane.Doe@example.com or +1 415 555 0132."}
+    assert BASIC_INFORMATION.echoed_fields(BasicInformationData(resume=RESUME, linkedin=linkedin))
+
+
+def test_different_linkedin_phone_is_left_to_the_agent():
+    linkedin = {'professional_summary': "Call +44 20 7946 0958 for consulting work."}
+    assert BASIC_INFORMATION.echoed_fields(BasicInformationData(resume=RESUME, linkedin=linkedin)) == {}
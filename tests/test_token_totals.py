@@ -0,0 +1,18 @@
+import asyncio
+
+from benchmarks.fake_llm import install_fake_llm
+from pipeline import engine
+
+SOURCE_TOKENS = 1000
+
+
+def test_agent_tokens_leave_out_the_source_tokens():
+    install_fake_llm(engine, latency=0)
+    pipeline = engine.ResumePipeline(input_adapter=engine.TextResumeInput(), consolidated_max_chars=0)
+    Basic_Information = engine.BasicInformationData(resume={'email': "jane.doe@example.com", 'phone': "+1 (415) 555-0132"})
+
+    results = asyncio.run(pipeline.process_all_agents(Basic_Information, resume_tokens=SOURCE_TOKENS))
+
+    completed = [name for name, analysis in results["analysis_results"].items() if analysis is not None]
+    assert results["agent_tokens_consumed"] > 0
+    assert results["total_tokens_consumed"] == results["agent_tokens_consumed"] + SOURCE_TOKENS * len(completed)
@@ -0,0 +1,41 @@
+import asyncio
+import io
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+import app
+
+
+def endpoint(path):
+    # Several endpoint functions share a name, so look them up by route
+    return next(route.endpoint for route in app.app.routes if getattr(route, "path", None) == path)
+
+
+class DisconnectedRequest:
+    url = SimpleNamespace(path="/improvement-resume")
+
+    async def is_disconnected(self):
+        return True
+
+
+def test_uploads_are_deleted_when_the_client_disconnects(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "UPLOAD_DIR", tmp_path)
+
+    async def slow_analysis(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(app, "run_analysis", slow_analysis)
+    watcher_class = app.DisconnectWatcher
+    monkeypatch.setattr(app, "DisconnectWatcher", lambda request: watcher_class(request, poll_interval=0.01))
+
+    resume = UploadFile(io.BytesIO(b"Jane Doe"), filename="resume.txt")
+    linkedin = UploadFile(io.BytesIO(b"Jane Doe on LinkedIn"), filename="linkedin.txt")
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(endpoint("/improvement-resume")(DisconnectedRequest(), user_id="user", resume_file=resume,
+                                                          github_profile=None, linkedin_profile_file=linkedin,
+                                                          portfolio_link=None, other_link=None))
+
+    assert error.value.status_code == 499
+    assert list(tmp_path.iterdir()) == []